@@ -0,0 +1,108 @@
+"""Asyncio counterpart of :class:`FangraphsClient`."""
+
+import asyncio
+from typing import Optional, Sequence
+
+import pandas as pd
+
+from baseball_data_lab.apis import metrics
+from baseball_data_lab.apis.async_http import AsyncHttpClient
+from baseball_data_lab.apis.fangraphs_client import FangraphsClient
+from baseball_data_lab.apis.fangraphs_snapshot import LeaderboardSnapshot
+from baseball_data_lab.apis.json_stream import records_frame
+
+
+class AsyncFangraphsClient:
+    """Awaitable versions of the :class:`FangraphsClient` fetchers."""
+
+    def __init__(self, http: Optional[AsyncHttpClient] = None):
+        self.http = http or AsyncHttpClient()
+
+    async def _get_json(self, url: str):
+        return await self.http.get_json(url)
+
+    async def _stream(self, url: str, consume, headers=None):
+        """Stream ``url`` and return ``(response, consume(rows), body)``; a 304 is returned unread as ``(response, None, None)``.
+
+        ``consume`` runs in a worker thread, so decoding a large leaderboard
+        does not block the event loop.
+        """
+        async with self.http.stream(url, headers) as resp:
+            if resp.status_code == 304:
+                return resp, None, None
+            body = metrics.StreamedBody(url, resp)
+            try:
+                result = await asyncio.to_thread(lambda: consume(FangraphsClient._iter_rows(resp, body)))
+            finally:
+                body.finish()
+        return resp, result, body
+
+    async def _get_frame(self, url: str, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """Async ``FangraphsClient._get_frame``: streams the rows and shares ``FangraphsClient.cache``."""
+        def consume(rows):
+            return records_frame(rows, columns)
+
+        cache = FangraphsClient.cache
+        if cache is None:
+            return (await self._stream(url, consume))[1]
+
+        key = FangraphsClient._frame_key(url, columns)
+        df = await asyncio.to_thread(cache.get_frame, key)
+        if df is not None:
+            return df
+        headers = await asyncio.to_thread(cache.conditional_headers, key)
+        resp, df, body = await self._stream(url, consume, headers)
+        if resp.status_code == 304:
+            if await asyncio.to_thread(cache.revalidate, key) is not None:
+                df = await asyncio.to_thread(cache.get_frame, key, True)
+                if df is not None:
+                    return df
+            resp, df, body = await self._stream(url, consume)
+        if resp.status_code == 200:
+            await asyncio.to_thread(cache.set_frame, key, df, response=resp, size=body.size)
+        return df
+
+    async def fetch_player_stats(self, player_fangraphs_id: int, season: int, fangraphs_team_id: int, stat_type: str):
+        snapshot = FangraphsClient.get_leaderboard_snapshot(season, stat_type, team_split=fangraphs_team_id is not None)
+        if snapshot is not None:
+            return snapshot.lookup(player_fangraphs_id, fangraphs_team_id)
+        url = FangraphsClient._player_stats_url(player_fangraphs_id, season, fangraphs_team_id, stat_type)
+        data = await self._get_json(url)
+        return pd.DataFrame(data=data['data'])
+
+    async def load_leaderboard_snapshot(self, season: int, stat_type: str, *, team_split: bool = False) -> LeaderboardSnapshot:
+        """Async ``FangraphsClient.load_leaderboard_snapshot``; registers the snapshot for both clients."""
+        df = await self._get_frame(FangraphsClient._snapshot_url(season, stat_type, team_split))
+        snapshot = LeaderboardSnapshot(season, stat_type, df, team_split=team_split)
+        FangraphsClient.snapshots[(season, stat_type, team_split)] = snapshot
+        return snapshot
+
+    async def fetch_leaderboards(self, season: int, stat_type: str, columns: Optional[Sequence[str]] = None):
+        if stat_type == 'pitching':
+            return await self.fetch_pitching_leaderboards(season, columns)
+        elif stat_type == 'batting':
+            return await self.fetch_batting_leaderboards(season, columns)
+        else:
+            raise ValueError("Invalid stat_type. Must be 'pitching' or 'batting'")
+
+    async def fetch_pitching_leaderboards(self, season: int, columns: Optional[Sequence[str]] = None):
+        return await self._get_frame(FangraphsClient._leaderboard_url(season, "pit"), columns)
+
+    async def fetch_batting_leaderboards(self, season: int, columns: Optional[Sequence[str]] = None):
+        return await self._get_frame(FangraphsClient._leaderboard_url(season, "bat"), columns)
+
+    async def fetch_batting_leaderboards_as_json(self, season: int):
+        return (await self._stream(FangraphsClient._leaderboard_url(season, "bat"), list))[1]
+
+    async def fetch_pitching_leaderboards_as_json(self, season: int):
+        return (await self._stream(FangraphsClient._leaderboard_url(season, "pit"), list))[1]
+
+    async def fetch_team_players(self, team_id: int, season: int):
+        batting_url, pitching_url = FangraphsClient._team_players_urls(team_id, season)
+        batting, pitching = await asyncio.gather(
+            self._get_json(batting_url), self._get_json(pitching_url)
+        )
+        return FangraphsClient._merge_team_players(batting['data'], pitching['data'])
+
+    async def close(self) -> None:
+        await self.http.close()
@@ -0,0 +1,294 @@
+"""Shared aiohttp session with per-host concurrency limits for the async clients."""
+
+import asyncio
+import json
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Iterator, Mapping, Optional
+from urllib.parse import urlsplit
+
+import aiohttp
+
+from baseball_data_lab.apis import http_session, metrics
+from baseball_data_lab.apis.rate_limiter import RateLimiter, parse_retry_after
+from baseball_data_lab.apis.single_flight import AsyncSingleFlight
+
+
+DEFAULT_TIMEOUT = 10.0
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF = 0.3
+RETRY_STATUSES = frozenset([429, 500, 502, 503, 504])
+
+# Maximum requests in flight per host. Connections are opened on demand up to
+# these limits and kept alive between requests.
+DEFAULT_HOST_LIMIT = 16
+HOST_LIMITS: Dict[str, int] = {
+    "statsapi.mlb.com": 64,
+    "www.fangraphs.com": 16,
+    "img.mlbstatic.com": 32,
+    "baseballsavant.mlb.com": 8,
+}
+
+
+class AsyncHttpError(Exception):
+    """Raised for non-success responses that were not retried away."""
+
+    def __init__(self, status: int, url: str):
+        super().__init__(f"HTTP {status} for {url}")
+        self.status = status
+        self.url = url
+
+
+class AsyncResponse:
+    """Status, headers and body of a finished async GET.
+
+    Mirrors the parts of ``requests.Response`` the response cache reads.
+    """
+
+    def __init__(self, status: int, headers: Mapping[str, str], body: bytes):
+        self.status_code = status
+        self.headers = headers
+        self._content = body
+
+    @property
+    def content(self) -> bytes:
+        return self._content
+
+    def json(self) -> Any:
+        return json.loads(self._content)
+
+
+class AsyncStreamResponse:
+    """Status and headers of an async GET whose body has not been read yet.
+
+    ``iter_content`` has the ``requests`` signature so the sync streaming
+    parsers can consume the body from a worker thread (``asyncio.to_thread``);
+    each chunk is read on ``loop``, which must not be blocked meanwhile.
+    """
+
+    def __init__(self, resp: aiohttp.ClientResponse, loop: asyncio.AbstractEventLoop):
+        self.status_code = resp.status
+        self.headers = resp.headers
+        self._resp = resp
+        self._loop = loop
+
+    def iter_content(self, chunk_size: int = 1 << 16) -> Iterator[bytes]:
+        chunks = self._resp.content.iter_chunked(chunk_size).__aiter__()
+
+        async def next_chunk():
+            return await chunks.__anext__()
+
+        while True:
+            try:
+                yield asyncio.run_coroutine_threadsafe(next_chunk(), self._loop).result()
+            except StopAsyncIteration:
+                return
+
+
+class AsyncHttpClient:
+    """One ``aiohttp.ClientSession`` shared by every async API client.
+
+    Each host gets its own ``asyncio.Semaphore`` so a burst of requests to one
+    API cannot starve another, and transient failures (429/5xx, connection
+    errors) are retried with exponential backoff, honoring ``Retry-After``.
+    Requests also draw from the same per-host :class:`RateLimiter` as the sync
+    clients (``http_session.get_rate_limiter()`` unless one is passed in),
+    concurrent requests for the same URL share one response, and each request
+    is recorded in the same per-endpoint metrics as ``http_session.http_get``.
+    The session is created lazily on first use and must be used from a single
+    event loop.
+    """
+
+    def __init__(self,
+                 host_limits: Optional[Dict[str, int]] = None,
+                 default_limit: int = DEFAULT_HOST_LIMIT,
+                 timeout: float = DEFAULT_TIMEOUT,
+                 retries: int = DEFAULT_RETRIES,
+                 backoff: float = DEFAULT_BACKOFF,
+                 rate_limiter: Optional[RateLimiter] = None):
+        self.host_limits = dict(HOST_LIMITS if host_limits is None else host_limits)
+        self.default_limit = default_limit
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self._rate_limiter = rate_limiter
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self.single_flight = AsyncSingleFlight()
+
+    async def __aenter__(self) -> "AsyncHttpClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    @property
+    def rate_limiter(self) -> Optional[RateLimiter]:
+        return self._rate_limiter if self._rate_limiter is not None else http_session.get_rate_limiter()
+
+    def limit_for(self, host: str) -> int:
+        return self.host_limits.get(host, self.default_limit)
+
+    def _semaphore(self, host: str) -> asyncio.Semaphore:
+        sem = self._semaphores.get(host)
+        if sem is None:
+            sem = asyncio.Semaphore(self.limit_for(host))
+            self._semaphores[host] = sem
+        return sem
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            # Concurrency is bounded by the per-host semaphores, not the connector.
+            connector = aiohttp.TCPConnector(limit=0, ttl_dns_cache=300)
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+        return self._session
+
+    def _retry_delay(self, attempt: int, retry_after: Optional[str]) -> float:
+        delay = parse_retry_after(retry_after)
+        if delay is not None:
+            return delay
+        return self.backoff * (2 ** attempt)
+
+    async def get_bytes(self, url: str) -> bytes:
+        """GET ``url`` and return the response body, raising ``AsyncHttpError`` on failure."""
+        return (await self.get(url)).content
+
+    async def get(self, url: str, headers: Optional[Mapping[str, str]] = None) -> AsyncResponse:
+        """GET ``url`` with optional request ``headers`` and return the response.
+
+        ``304 Not Modified`` is returned like any other success; 4xx/5xx
+        raise ``AsyncHttpError``.
+        """
+        headers = dict(headers or {})
+        key = (url, tuple(sorted(headers.items()))) if headers else url
+        ran = []
+
+        def run():
+            ran.append(True)
+            return self._get(url, headers)
+
+        try:
+            return await self.single_flight.do(key, run)
+        finally:
+            if not ran:
+                metrics.count_coalesced(metrics.endpoint_of(url))
+
+    @staticmethod
+    def _observe(url: str, started: float, resp=None, status: Optional[int] = None) -> None:
+        """Record one request in the client metrics; no ``resp`` or ``status`` marks an exception."""
+        if resp is not None:
+            status = resp.status_code
+        metrics.observe_request(metrics.endpoint_of(url), time.perf_counter() - started, status=status,
+                                size=metrics.response_size(resp), error=status is None)
+
+    async def _get(self, url: str, headers: Dict[str, str]) -> AsyncResponse:
+        started = time.perf_counter()
+        try:
+            resp = await self._get_with_retries(url, headers)
+        except AsyncHttpError as exc:
+            self._observe(url, started, status=exc.status)
+            raise
+        except Exception:
+            self._observe(url, started)
+            raise
+        self._observe(url, started, resp)
+        return resp
+
+    async def _get_with_retries(self, url: str, headers: Dict[str, str]) -> AsyncResponse:
+        host = urlsplit(url).netloc.lower()
+        session = self._get_session()
+        limiter = self.rate_limiter
+        attempt = 0
+        while True:
+            try:
+                async with self._semaphore(host):
+                    if limiter is not None:
+                        wait = limiter.reserve(url)
+                        if wait > 0:
+                            await asyncio.sleep(wait)
+                    async with session.get(http_session.rewrite_url(url), headers=headers) as resp:
+                        body = await resp.read()
+                        status = resp.status
+                        resp_headers = resp.headers
+                        retry_after = resp_headers.get("Retry-After")
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if limiter is not None:
+                    limiter.record(url, None)
+                if attempt >= self.retries:
+                    raise
+                await asyncio.sleep(self._retry_delay(attempt, None))
+                attempt += 1
+                continue
+
+            if limiter is not None:
+                limiter.record(url, status, retry_after)
+
+            if status in RETRY_STATUSES and attempt < self.retries:
+                await asyncio.sleep(self._retry_delay(attempt, retry_after))
+                attempt += 1
+                continue
+            if status >= 400:
+                raise AsyncHttpError(status, url)
+            return AsyncResponse(status, resp_headers, body)
+
+    @asynccontextmanager
+    async def stream(self, url: str, headers: Optional[Mapping[str, str]] = None) -> AsyncIterator[AsyncStreamResponse]:
+        """GET ``url`` and yield the response before its body is read.
+
+        Retries, rate limiting and errors work as in ``get``, but a failure
+        after the body has started is not retried, and streams are never
+        shared between callers. The host's concurrency slot is held until
+        the block exits.
+        """
+        host = urlsplit(url).netloc.lower()
+        session = self._get_session()
+        limiter = self.rate_limiter
+        started = time.perf_counter()
+        attempt = 0
+        while True:
+            async with self._semaphore(host):
+                try:
+                    if limiter is not None:
+                        wait = limiter.reserve(url)
+                        if wait > 0:
+                            await asyncio.sleep(wait)
+                    resp = await session.get(http_session.rewrite_url(url), headers=dict(headers or {}))
+                except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                    if limiter is not None:
+                        limiter.record(url, None)
+                    if attempt >= self.retries:
+                        self._observe(url, started)
+                        raise
+                    resp = None
+                    retry_after = None
+                else:
+                    status = resp.status
+                    retry_after = resp.headers.get("Retry-After")
+                    if limiter is not None:
+                        limiter.record(url, status, retry_after)
+                    if status not in RETRY_STATUSES or attempt >= self.retries:
+                        try:
+                            if status >= 400:
+                                self._observe(url, started, status=status)
+                                raise AsyncHttpError(status, url)
+                            streamed = AsyncStreamResponse(resp, asyncio.get_running_loop())
+                            self._observe(url, started, streamed)
+                            yield streamed
+                        finally:
+                            resp.release()
+                        return
+                    resp.release()
+            await asyncio.sleep(self._retry_delay(attempt, retry_after))
+            attempt += 1
+
+    async def get_json(self, url: str) -> Any:
+        """GET ``url`` and return the decoded JSON payload."""
+        return json.loads(await self.get_bytes(url))
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
@@ -0,0 +1,199 @@
+"""Asyncio counterpart of :class:`MlbStatsClient`."""
+
+import asyncio
+from datetime import date
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+import pandas as pd
+
+from baseball_data_lab.apis.async_http import AsyncHttpClient
+from baseball_data_lab.apis.mlb_stats_client import MlbStatsClient
+
+
+class AsyncMlbStatsClient:
+    """Awaitable versions of the :class:`MlbStatsClient` fetchers.
+
+    Requests go through a shared :class:`AsyncHttpClient`, so per-host
+    concurrency limits apply across every coroutine using the same instance.
+    URL building and response parsing are shared with the sync client, as is
+    its on-disk response cache when one is enabled.
+    """
+
+    def __init__(self, http: Optional[AsyncHttpClient] = None):
+        self.http = http or AsyncHttpClient()
+
+    async def _get_json(self, url: str) -> Dict[str, Any]:
+        """Async ``ResponseCache.fetch_json``; cache file I/O runs in a worker thread."""
+        cache = MlbStatsClient.cache
+        if cache is None:
+            return await self.http.get_json(url)
+        cached = await asyncio.to_thread(cache.get, url)
+        if cached is not None:
+            return cached
+
+        resp = await self.http.get(url, await asyncio.to_thread(cache.conditional_headers, url))
+        if resp.status_code == 304:
+            payload = await asyncio.to_thread(cache.revalidate, url)
+            if payload is not None:
+                return payload
+            resp = await self.http.get(url)
+        payload = resp.json()
+        if resp.status_code == 200:
+            await asyncio.to_thread(cache.set, url, payload, response=resp)
+        return payload
+
+    # ------------------------------------------------------------------
+    # Simple fetchers
+    # ------------------------------------------------------------------
+    async def fetch_player_info(self, player_id: int):
+        url = MlbStatsClient._player_info_url(player_id)
+        data = await self._get_json(url)
+        return data["people"][0]
+
+    async def fetch_players_info(self, player_ids: List[int], chunk_size: Optional[int] = None) -> Dict[int, Dict[str, Any]]:
+        urls = MlbStatsClient._players_info_urls(player_ids, chunk_size)
+        pages = await asyncio.gather(*(self._get_json(url) for url in urls))
+        return {
+            person["id"]: person
+            for data in pages
+            for person in data.get("people") or []
+        }
+
+    async def fetch_team(self, team_id: int):
+        url = MlbStatsClient._team_url(team_id)
+        data = await self._get_json(url)
+        return data.get("teams", {})[0]
+
+    async def fetch_batter_stat_splits(self, player_id: int, year: int):
+        return await self._fetch_stat_splits(player_id, year, "hitting")
+
+    async def fetch_pitcher_stat_splits(self, player_id: int, year: int):
+        return await self._fetch_stat_splits(player_id, year, "pitching")
+
+    async def _fetch_stat_splits(self, player_id: int, year: int, group: str) -> pd.DataFrame:
+        planner, request = MlbStatsClient._stat_splits_plan(player_id, year, group)
+        for url in planner.urls():
+            planner.resolve(url, await self._get_json(url))
+        return request.result()
+
+    async def fetch_player_stats_by_season(self, player_id: int, year: int, *, group: Optional[str] = None) -> Dict[str, Any]:
+        url = MlbStatsClient._player_stats_by_season_url(player_id, year, group)
+        payload = await self._get_json(url)
+        return MlbStatsClient._parse_player_stats_by_season(payload, player_id, year)
+
+    async def fetch_players_stats_by_season(
+        self,
+        player_ids: List[int],
+        year: int,
+        group: Union[str, Sequence[str]] = ("batting", "pitching"),
+        *,
+        chunk_size: Optional[int] = None,
+    ) -> pd.DataFrame:
+        groups = [group] if isinstance(group, str) else list(group)
+        batches = [
+            (grp, url)
+            for grp in groups
+            for url in MlbStatsClient._players_stats_by_season_urls(player_ids, year, grp, chunk_size)
+        ]
+        payloads = await asyncio.gather(*(self._get_json(url) for _, url in batches))
+        rows = [
+            row
+            for (grp, _), payload in zip(batches, payloads)
+            for row in MlbStatsClient._season_stats_rows(payload, year, grp)
+        ]
+        return MlbStatsClient._season_stats_frame(rows)
+
+    async def fetch_player_stats_career(self, player_id: int):
+        url = MlbStatsClient._player_stats_career_url(player_id)
+        return await self._get_json(url)
+
+    async def get_player_teams_for_season(
+        self,
+        player_id: int,
+        year: int,
+        *,
+        group: Optional[str] = None,
+        ids_only: bool = False,
+    ) -> List[Any]:
+        data = await self.fetch_player_stats_by_season(player_id, year, group=group)
+        return MlbStatsClient._teams_from_season_stats(data, ids_only=ids_only)
+
+    async def fetch_player_team(self, player_id: int, year: int):
+        url = MlbStatsClient._player_team_url(player_id, year)
+        data = await self._get_json(url)
+        for element in data["people"][0]["stats"][0]["splits"]:
+            team = element.get("team")
+            if team:
+                return team
+        return None
+
+    async def fetch_active_roster(self, team_id: int = None, team_name: str = None, year: int = 2024):
+        if not team_id:
+            team_id = await self.get_team_id(team_name)
+        url = MlbStatsClient._roster_url(team_id, year, "active")
+        data = await self._get_json(url)
+        return data["roster"]
+
+    async def fetch_full_season_roster(self, team_id: int, year: int = 2024):
+        url = MlbStatsClient._roster_url(team_id, year, "fullSeason")
+        data = await self._get_json(url)
+        return data["roster"]
+
+    async def get_team_id(self, team_name):
+        # statsapi's lookup helpers are blocking; run them off the event loop.
+        return await asyncio.get_running_loop().run_in_executor(None, MlbStatsClient.get_team_id, team_name)
+
+    async def get_player_mlbam_id(self, player_name):
+        return await asyncio.get_running_loop().run_in_executor(None, MlbStatsClient.get_player_mlbam_id, player_name)
+
+    async def get_season_info(self, year: int) -> Dict[str, Any]:
+        url = MlbStatsClient._season_info_url(year)
+        data = await self._get_json(url)
+        return data['seasons'][0]
+
+    async def get_standings_data(self, season: int, league_ids: str):
+        url = MlbStatsClient._standings_url(season, league_ids)
+        data = await self._get_json(url)
+        return data["records"]
+
+    async def get_team_record_for_season(self, season: int, team_id: int):
+        url = MlbStatsClient._team_record_url(season, team_id)
+        data = await self._get_json(url)
+        return data["teams"][0]["record"]
+
+    async def get_schedule_for_date_range(self, start_date: str, end_date: str):
+        url = MlbStatsClient._schedule_url(start_date, end_date)
+        data = await self._get_json(url)
+        return data["dates"]
+
+    @staticmethod
+    def get_team_logo_url(mlbam_team_id: int) -> str:
+        return MlbStatsClient.get_team_logo_url(mlbam_team_id)
+
+    @staticmethod
+    def get_team_spot_url(mlbam_team_id: int, size: int) -> str:
+        return MlbStatsClient.get_team_spot_url(mlbam_team_id, size)
+
+    async def get_game_data(self, game_pk: int):
+        url = MlbStatsClient._game_data_url(game_pk)
+        return await self._get_json(url)
+
+    async def get_game_boxscore_data(self, game_pk: int):
+        url = MlbStatsClient._boxscore_url(game_pk)
+        return await self._get_json(url)
+
+    async def get_team_stats_for_date_range(self, team_id: int, start_date: str, end_date: str):
+        url = MlbStatsClient._team_stats_url(team_id, start_date, end_date)
+        return await self._get_json(url)
+
+    async def get_recent_schedule_for_team(self, team_id: int) -> Dict[str, Any]:
+        season = date.today().year
+        url = MlbStatsClient._recent_schedule_url(team_id, season)
+        data = await self._get_json(url)
+        teams = data.get("teams") or []
+        if not teams:
+            raise ValueError(f"No team data returned for team_id={team_id} season={season}")
+        return teams[0]
+
+    async def close(self) -> None:
+        await self.http.close()
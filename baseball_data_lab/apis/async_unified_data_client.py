@@ -0,0 +1,195 @@
+"""Asyncio counterpart of :class:`UnifiedDataClient`."""
+
+import asyncio
+from typing import Any, Dict, List, Optional, Sequence
+
+import pandas as pd
+
+from baseball_data_lab.apis.async_http import AsyncHttpClient
+from baseball_data_lab.apis.async_mlb_stats_client import AsyncMlbStatsClient
+from baseball_data_lab.apis.async_fangraphs_client import AsyncFangraphsClient
+from baseball_data_lab.apis.mlb_stats_client import MlbStatsClient
+from baseball_data_lab.apis.unified_data_client import UnifiedDataClient, get_default_client
+
+
+class AsyncUnifiedDataClient:
+    """Awaitable wrappers over the MLB StatsAPI and Fangraphs clients.
+
+    Both API clients share one :class:`AsyncHttpClient`, so a single event
+    loop drives every request with per-host concurrency limits. Player-ID
+    lookups are local and stay synchronous; they reuse the Chadwick register
+    of ``data_client`` (the shared default client when omitted).
+
+    Use as an async context manager so the HTTP session is closed::
+
+        async with AsyncUnifiedDataClient() as client:
+            roster = await client.fetch_full_season_roster(116, 2024)
+    """
+
+    def __init__(self, data_client: Optional[UnifiedDataClient] = None, http: Optional[AsyncHttpClient] = None):
+        self.data_client = data_client or get_default_client()
+        self.http = http or AsyncHttpClient()
+        self.mlb = AsyncMlbStatsClient(self.http)
+        self.fangraphs = AsyncFangraphsClient(self.http)
+
+    async def __aenter__(self) -> "AsyncUnifiedDataClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        await self.http.close()
+
+    @property
+    def search_client(self):
+        return self.data_client.search_client
+
+    #############################
+    # FangraphsClient wrappers
+    #############################
+    async def fetch_batting_stats(
+        self, mlbam_id: int, season: int, fangraphs_team_id: int = None
+    ) -> pd.DataFrame:
+        return await self.fangraphs.fetch_player_stats(
+            player_fangraphs_id=self.data_client.resolve_fangraphs_id(mlbam_id),
+            season=season,
+            fangraphs_team_id=fangraphs_team_id,
+            stat_type="batting",
+        )
+
+    async def fetch_pitching_stats(
+        self, mlbam_id: int, season: int, fangraphs_team_id: int = None
+    ) -> pd.DataFrame:
+        return await self.fangraphs.fetch_player_stats(
+            player_fangraphs_id=self.data_client.resolve_fangraphs_id(mlbam_id),
+            season=season,
+            fangraphs_team_id=fangraphs_team_id,
+            stat_type="pitching",
+        )
+
+    async def fetch_batting_leaderboards(self, season: int, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        return await self.fangraphs.fetch_batting_leaderboards(season, columns)
+
+    async def fetch_batting_leaderboards_as_json(self, season: int):
+        return await self.fangraphs.fetch_batting_leaderboards_as_json(season)
+
+    async def fetch_pitching_leaderboards(self, season: int, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        return await self.fangraphs.fetch_pitching_leaderboards(season, columns)
+
+    async def fetch_pitching_leaderboards_as_json(self, season: int):
+        return await self.fangraphs.fetch_pitching_leaderboards_as_json(season)
+
+    async def load_fangraphs_snapshots(self, season: int, stat_types=("batting", "pitching"), *, team_split: bool = True):
+        splits = (True, False) if team_split else (False,)
+        return await asyncio.gather(*(
+            self.fangraphs.load_leaderboard_snapshot(season, stat_type, team_split=split)
+            for stat_type in stat_types
+            for split in splits
+        ))
+
+    async def fetch_team_players(self, team_id: int, season: int):
+        return await self.fangraphs.fetch_team_players(team_id, season)
+
+    async def fetch_leaderboards(self, season: int, stat_type: str, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        return await self.fangraphs.fetch_leaderboards(season, stat_type, columns)
+
+    #############################
+    # MlbStatsClient wrappers
+    #############################
+    async def fetch_batting_splits(self, player_id: int, season: int) -> pd.DataFrame:
+        return await self.mlb.fetch_batter_stat_splits(player_id, season)
+
+    async def fetch_pitching_splits(self, player_id: int, season: int) -> pd.DataFrame:
+        return await self.mlb.fetch_pitcher_stat_splits(player_id, season)
+
+    async def fetch_active_roster(
+        self, team_id: int = None, team_name: str = None, year: int = 2024
+    ):
+        return await self.mlb.fetch_active_roster(team_id, team_name, year)
+
+    async def fetch_team(self, team_id: int):
+        return await self.mlb.fetch_team(team_id)
+
+    async def fetch_full_season_roster(self, team_id: int, year: int = 2024):
+        return await self.mlb.fetch_full_season_roster(team_id, year)
+
+    async def get_season_info(self, year: int):
+        return await self.mlb.get_season_info(year)
+
+    async def get_team_id(self, team_name: str):
+        return await self.mlb.get_team_id(team_name)
+
+    async def fetch_player_info(self, player_id: int):
+        info = self.data_client.cached_players_info([player_id]).get(player_id)
+        if info is not None:
+            return info
+        return await self.mlb.fetch_player_info(player_id)
+
+    async def fetch_players_info(self, player_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """Async ``UnifiedDataClient.fetch_players_info``; shares its prefetched records."""
+        known = self.data_client.cached_players_info(player_ids)
+        missing = [pid for pid in player_ids if pid not in known]
+        if missing:
+            self.data_client.store_players_info(await self.mlb.fetch_players_info(missing))
+        return self.data_client.cached_players_info(player_ids)
+
+    async def fetch_player_stats_by_season(self, player_id: int, year: int, *, group: Optional[str] = None):
+        return await self.mlb.fetch_player_stats_by_season(player_id, year, group=group)
+
+    async def get_player_teams_for_season(
+        self, player_id: int, year: int, group: str = None, ids_only: bool = False
+    ):
+        return await self.mlb.get_player_teams_for_season(
+            player_id, year, group=group, ids_only=ids_only
+        )
+
+    async def fetch_players_stats_by_season(self, player_ids: List[int], year: int, group=("batting", "pitching")) -> pd.DataFrame:
+        return await self.mlb.fetch_players_stats_by_season(player_ids, year, group)
+
+    async def get_players_teams_for_season(self, player_ids: List[int], year: int, group: str) -> Dict[int, List[int]]:
+        stats_df = await self.mlb.fetch_players_stats_by_season(player_ids, year, group)
+        teams = MlbStatsClient.teams_by_player(stats_df)
+        return {pid: teams.get(pid, []) for pid in player_ids}
+
+    async def fetch_player_team(self, player_id: int, year: int):
+        return await self.mlb.fetch_player_team(player_id, year)
+
+    async def get_player_mlbam_id(self, player_name: str):
+        return await self.mlb.get_player_mlbam_id(player_name)
+
+    async def get_standings_data(self, season: int, league_ids: str):
+        return await self.mlb.get_standings_data(season, league_ids)
+
+    async def get_team_record_for_season(self, season: int, team_id: int):
+        return await self.mlb.get_team_record_for_season(season, team_id)
+
+    async def get_schedule_for_date_range(self, start_date: str, end_date: str):
+        return await self.mlb.get_schedule_for_date_range(start_date, end_date)
+
+    def get_team_logo_url(self, mlbam_team_id: int) -> str:
+        return self.mlb.get_team_logo_url(mlbam_team_id)
+
+    def get_team_spot_url(self, mlbam_team_id: int, size: int) -> str:
+        return self.mlb.get_team_spot_url(mlbam_team_id, size)
+
+    async def get_game_data(self, game_pk: int):
+        return await self.mlb.get_game_data(game_pk)
+
+    async def get_recent_schedule_for_team(self, team_id: int):
+        return await self.mlb.get_recent_schedule_for_team(team_id)
+
+    async def get_game_boxscore_data(self, game_pk: int):
+        return await self.mlb.get_game_boxscore_data(game_pk)
+
+    async def fetch_player_stats_career(self, player_id: int):
+        return await self.mlb.fetch_player_stats_career(player_id)
+
+    #############################
+    # Player search wrappers
+    #############################
+    def lookup_player(self, last_name: str, first_name: str, fuzzy: bool = False):
+        return self.data_client.lookup_player(last_name, first_name, fuzzy=fuzzy)
+
+    def lookup_player_by_id(self, player_id: int):
+        return self.data_client.lookup_player_by_id(player_id)
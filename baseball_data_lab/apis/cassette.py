@@ -0,0 +1,217 @@
+"""Record API responses to a compressed cassette and replay them without the network."""
+
+import base64
+import gzip
+import json
+import os
+import random
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from baseball_data_lab.apis import http_session
+from baseball_data_lab.apis.response_cache import ResponseCache
+
+
+# Response headers worth keeping; everything else is dropped from recordings.
+RECORDED_HEADERS = ("Content-Type", "ETag", "Last-Modified", "Cache-Control", "Retry-After")
+
+
+class CassetteMissError(KeyError):
+    """Raised in replay mode for a request that was never recorded."""
+
+
+class Cassette:
+    """A set of recorded responses keyed by normalized URL, stored as gzip'd JSON.
+
+    Bodies are kept as text when they decode as UTF-8 and as base64 otherwise,
+    so JSON payloads and images can share one file.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        if os.path.exists(path):
+            self.load()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, url: str) -> bool:
+        return ResponseCache.normalize_url(url) in self._entries
+
+    def urls(self):
+        return sorted(self._entries)
+
+    # ------------------------------------------------------------------
+    # Entries
+    # ------------------------------------------------------------------
+    def record(self, url: str, status: int, headers: Dict[str, str], body: bytes) -> None:
+        try:
+            entry = {"text": body.decode("utf-8")}
+        except UnicodeDecodeError:
+            entry = {"base64": base64.b64encode(body).decode("ascii")}
+        entry["status"] = status
+        entry["headers"] = {k: headers[k] for k in RECORDED_HEADERS if k in headers}
+        with self._lock:
+            self._entries[ResponseCache.normalize_url(url)] = entry
+
+    def record_response(self, url: str, resp: requests.Response) -> None:
+        self.record(url, resp.status_code, resp.headers, resp.content)
+
+    def lookup(self, url: str) -> Optional[Dict[str, Any]]:
+        """Return ``{"status", "headers", "body"}`` for ``url``, or ``None``."""
+        entry = self._entries.get(ResponseCache.normalize_url(url))
+        if entry is None:
+            return None
+        if "text" in entry:
+            body = entry["text"].encode("utf-8")
+        else:
+            body = base64.b64decode(entry["base64"])
+        return {"status": entry["status"], "headers": dict(entry["headers"]), "body": body}
+
+    def lookup_json(self, url: str) -> Optional[Any]:
+        entry = self._entries.get(ResponseCache.normalize_url(url))
+        if entry is None or "text" not in entry or entry["status"] != 200:
+            return None
+        return json.loads(entry["text"])
+
+    def items(self) -> Iterator:
+        """Yield ``(normalized_url, entry)`` pairs for every recording."""
+        with self._lock:
+            return iter(list(self._entries.items()))
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+    def load(self) -> None:
+        with gzip.open(self.path, "rt", encoding="utf-8") as fp:
+            data = json.load(fp)
+        with self._lock:
+            self._entries = data.get("entries", {})
+
+    def save(self) -> None:
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        with self._lock:
+            data = {"version": self.VERSION, "entries": dict(self._entries)}
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as fp:
+            json.dump(data, fp)
+        os.replace(tmp_path, self.path)
+
+    # ------------------------------------------------------------------
+    # Transports
+    # ------------------------------------------------------------------
+    @contextmanager
+    def recording(self, save: bool = True):
+        """Record every request made through ``http_session`` while active."""
+        inner = http_session.get_registry()
+        previous = http_session.set_registry(RecordingRegistry(self, inner))
+        try:
+            yield self
+        finally:
+            http_session.set_registry(previous)
+            if save:
+                self.save()
+
+    @contextmanager
+    def replaying(self, latency: float = 0.0, jitter: float = 0.0):
+        """Serve every ``http_session`` request from this cassette while active."""
+        previous = http_session.set_registry(ReplayRegistry(self, latency=latency, jitter=jitter))
+        try:
+            yield self
+        finally:
+            http_session.set_registry(previous)
+
+
+class RecordingRegistry:
+    """Session registry that forwards to ``inner`` and records each response.
+
+    Rate limiting, hedging, circuit breakers and the transport are those of
+    ``inner``, so ``http_session`` settings changed while recording apply to
+    the real requests.
+    """
+
+    def __init__(self, cassette: Cassette, inner):
+        self.cassette = cassette
+        self.inner = inner
+
+    @property
+    def rate_limiter(self):
+        return self.inner.rate_limiter
+
+    @property
+    def hedging(self):
+        return self.inner.hedging
+
+    @property
+    def breakers(self):
+        return self.inner.breakers
+
+    @property
+    def transport(self) -> str:
+        return self.inner.transport
+
+    @transport.setter
+    def transport(self, transport: str) -> None:
+        self.inner.transport = transport
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        resp = self.inner.get(url, **kwargs)
+        self.cassette.record_response(url, resp)
+        return resp
+
+    def close(self) -> None:
+        self.inner.close()
+
+
+class ReplayRegistry:
+    """Session registry that answers from a :class:`Cassette` instead of the network.
+
+    ``latency`` (plus up to ``jitter`` seconds) is slept before each response so
+    offline runs keep a repeatable, realistic timing profile. Hedging, circuit
+    breaker and transport settings are accepted but have no effect, since no
+    request reaches the network.
+    """
+
+    rate_limiter = None
+
+    def __init__(self, cassette: Cassette, latency: float = 0.0, jitter: float = 0.0):
+        self.cassette = cassette
+        self.latency = latency
+        self.jitter = jitter
+        self.hedging: Dict[str, Any] = {}
+        self.breakers: Dict[str, Any] = {}
+        self.transport = "http1"
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        entry = self.cassette.lookup(url)
+        if entry is None:
+            raise CassetteMissError(url)
+        delay = self.latency + (random.uniform(0, self.jitter) if self.jitter else 0.0)
+        if delay > 0:
+            time.sleep(delay)
+        return build_response(url, entry)
+
+    def close(self) -> None:
+        pass
+
+
+def build_response(url: str, entry: Dict[str, Any]) -> requests.Response:
+    """Build a ``requests.Response`` from a cassette entry."""
+    resp = requests.Response()
+    resp.url = url
+    resp.status_code = entry["status"]
+    resp.headers = CaseInsensitiveDict(entry["headers"])
+    resp._content = entry["body"]
+    # Lets ``iter_content`` serve the body for callers that asked for a stream.
+    resp._content_consumed = True
+    resp.encoding = "utf-8"
+    return resp
@@ -1,13 +1,42 @@
 import os
 import re
 import io
+import hashlib
+import threading
 import zipfile
 import unicodedata
-from difflib import get_close_matches
-from typing import List, Tuple, Iterable, Optional
+from typing import Any, Dict, List, Tuple, Iterable, Optional
 
+import numpy as np
 import pandas as pd
-from baseball_data_lab.config import DATA_DIR
+from baseball_data_lab.apis.name_index import NameSearchIndex
+from baseball_data_lab.apis.register_snapshot import RegisterSnapshot
+from baseball_data_lab.config import DATA_DIR, USER_CACHE_DIR
+
+
+KEY_TYPES = ('mlbam', 'retro', 'bbref', 'fangraphs')
+# ID columns holding integers; lookups coerce the requested IDs to match.
+INTEGER_KEYS = ('mlbam', 'fangraphs')
+# Name columns, kept as categoricals over the snapshot's mapped codes when loaded from one.
+NAME_COLUMNS = ('name_last', 'name_first')
+
+
+def build_id_index(table: pd.DataFrame, key_type: str) -> Tuple[np.ndarray, np.ndarray]:
+    """Returns ``(sorted IDs, row positions in that order)`` for the ``key_<key_type>`` column."""
+    column = f'key_{key_type}'
+    if column not in table.columns:
+        return np.empty(0, dtype=object), np.empty(0, dtype=np.intp)
+    values = table[column]
+    if key_type in INTEGER_KEYS:
+        # Registers read with missing IDs come back as floats; index them as ints.
+        values = pd.to_numeric(values, errors='coerce')
+        rows = np.flatnonzero(values.notna().to_numpy())
+        keys = values.to_numpy()[rows].astype(np.int64)
+    else:
+        rows = np.flatnonzero(values.notna().to_numpy())
+        keys = values.to_numpy()[rows].astype(str)
+    order = np.argsort(keys, kind='stable')
+    return keys[order], rows[order]
 
 
 class ChadwickRegister:
@@ -18,10 +47,21 @@ class ChadwickRegister:
 
     def __init__(self,
                  register_file: str = None,
-                 zip_file: str = None):
+                 zip_file: str = None,
+                 name_index_file: str = None,
+                 snapshot_dir: str = None):
         self.register_file = register_file or os.path.join(DATA_DIR, 'chadwick-register.csv')
         self.zip_file = zip_file or os.path.join(DATA_DIR, 'chadwick-register.zip')
+        # Derived files live in the user cache, one directory per register file.
+        cache_dir = os.path.join(USER_CACHE_DIR, 'chadwick-register', hashlib.sha1(
+            os.path.abspath(self.register_file).encode('utf-8')).hexdigest()[:12])
+        self.name_index_file = name_index_file or os.path.join(cache_dir, 'chadwick-name-index.npz')
+        self.snapshot_dir = snapshot_dir or os.path.join(cache_dir, 'chadwick-register.snapshot')
         self.lookup_table: Optional[pd.DataFrame] = None
+        self.snapshot: Optional[RegisterSnapshot] = None
+        self._names_lowered = False
+        self.name_index: Optional[NameSearchIndex] = None
+        self._name_index_saved = False
 
     def _extract_people_files(self, zip_archive: zipfile.ZipFile) -> Iterable[zipfile.ZipInfo]:
         return filter(
@@ -39,13 +79,32 @@ class ChadwickRegister:
 
     def load(self, save: bool = False) -> pd.DataFrame:
         """
-        Loads the Chadwick register. If the register file exists locally, it loads it;
-        otherwise it extracts the data from the given ZIP file.
+        Loads the Chadwick register. A snapshot written by an earlier load is
+        memory-mapped when it is still current; otherwise the register file is
+        read if it exists locally, or the data is extracted from the given ZIP
+        file, and a new snapshot is written for the next load.
         """
-        if os.path.exists(self.register_file):
-            self.lookup_table = pd.read_csv(self.register_file)
+        source_file = self._source_file()
+        snapshot = RegisterSnapshot.open(self.snapshot_dir, source_file)
+        if snapshot is not None:
+            self.snapshot = snapshot
+            self.lookup_table = snapshot.table()
+            self._names_lowered = True
             return self.lookup_table
 
+        if os.path.exists(self.register_file):
+            table = pd.read_csv(self.register_file)
+        else:
+            table = self._load_zip(save)
+        self.lookup_table = table
+        self._names_lowered = False
+        self._write_snapshot(source_file)
+        return table
+
+    def _source_file(self) -> str:
+        return self.register_file if os.path.exists(self.register_file) else self.zip_file
+
+    def _load_zip(self, save: bool) -> pd.DataFrame:
         print("Gathering player lookup table. This may take a moment.")
 
         with open(self.zip_file, 'rb') as f:
@@ -68,10 +127,27 @@ class ChadwickRegister:
 
         if save:
             table.to_csv(self.register_file, index=False)
-
-        self.lookup_table = table
         return table
 
+    def _write_snapshot(self, source_file: str) -> None:
+        """Write the lower-cased table, folded names and ID indexes as a snapshot."""
+        table = self.get_lookup_table()
+        last, first = self.normalized_names(ignore_accents=True)
+        extra_arrays = {}
+        for key_type in KEY_TYPES:
+            keys, rows = build_id_index(table, key_type)
+            extra_arrays[f'index_{key_type}_keys'] = keys
+            extra_arrays[f'index_{key_type}_rows'] = rows
+        try:
+            os.makedirs(os.path.dirname(self.snapshot_dir), exist_ok=True)
+            RegisterSnapshot.write(self.snapshot_dir, table, source_file,
+                                   extra_strings={'name_last_folded': last, 'name_first_folded': first},
+                                   extra_arrays=extra_arrays, categorical=NAME_COLUMNS)
+        except OSError:
+            # An unwritable cache still works; the register is just parsed on every load.
+            return
+        self.snapshot = RegisterSnapshot.open(self.snapshot_dir, source_file)
+
     def get_lookup_table(self, save: bool = False) -> pd.DataFrame:
         """
         Returns the lookup table (loading it if necessary) and normalizes the names
@@ -79,26 +155,94 @@ class ChadwickRegister:
         """
         if self.lookup_table is None:
             self.load(save)
-        # Normalize names for case‐insensitive search.
-        self.lookup_table['name_last'] = self.lookup_table['name_last'].str.lower()
-        self.lookup_table['name_first'] = self.lookup_table['name_first'].str.lower()
+        if not self._names_lowered:
+            # Normalize names for case‐insensitive search.
+            self.lookup_table['name_last'] = self.lookup_table['name_last'].str.lower()
+            self.lookup_table['name_first'] = self.lookup_table['name_first'].str.lower()
+            self._names_lowered = True
         return self.lookup_table
 
+    def normalized_names(self, ignore_accents: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the lower-cased (and, with ignore_accents, accent-folded) last and
+        first names as arrays aligned with the lookup table; missing names are ''.
+        """
+        if ignore_accents and self.snapshot is not None and self.snapshot.has('name_last_folded'):
+            return self.snapshot.strings('name_last_folded'), self.snapshot.strings('name_first_folded')
+        table = self.get_lookup_table()
+        return self._fold_names(table['name_last'], ignore_accents), self._fold_names(table['name_first'], ignore_accents)
+
+    def _fold_names(self, names: pd.Series, ignore_accents: bool) -> np.ndarray:
+        names = names.astype(object).fillna('').astype(str).str.lower()
+        if not ignore_accents:
+            return names.to_numpy()
+        # Fold each distinct name once rather than every row.
+        folded = {name: self.normalize_accents(name) for name in names.unique()}
+        return names.map(folded).to_numpy()
+
+    def id_index(self, key_type: str) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns ``(sorted IDs, row positions)`` for ``key_type``, from the snapshot when mapped.
+        """
+        if self.snapshot is not None:
+            index = self.snapshot.id_index(key_type)
+            if index is not None:
+                return index
+        return build_id_index(self.get_lookup_table(), key_type)
+
     @staticmethod
     def normalize_accents(s: str) -> str:
         """Returns the string with accented characters normalized."""
         return ''.join(c for c in unicodedata.normalize('NFD', str(s)) if unicodedata.category(c) != 'Mn')
 
-    def get_closest_names(self, last: str, first: str) -> pd.DataFrame:
+    def get_name_index(self, save: bool = False) -> NameSearchIndex:
         """
-        Uses difflib.get_close_matches to return the five names closest to the full name.
+        Returns the fuzzy name index, loading it from ``name_index_file`` when that
+        was built from the current register file and building it otherwise.
         """
-        table = self.get_lookup_table()
-        filled_df = table.fillna("").assign(chadwick_name=lambda df: df['name_first'] + " " + df['name_last'])
-        fuzzy_matches = pd.DataFrame(
-            get_close_matches(f"{first} {last}", filled_df['chadwick_name'], n=5, cutoff=0)
-        ).rename({0: "chadwick_name"}, axis=1)
-        return fuzzy_matches.merge(filled_df, on="chadwick_name").drop("chadwick_name", axis=1)
+        if self.name_index is None:
+            self.name_index = self._load_name_index()
+            self._name_index_saved = self.name_index is not None
+        if self.name_index is None:
+            table = self.get_lookup_table()
+            names = (table['name_first'].astype(object).fillna('') + ' '
+                     + table['name_last'].astype(object).fillna(''))
+            self.name_index = NameSearchIndex.build(names, source=RegisterSnapshot.source_stamp(self._source_file()))
+        if save and not self._name_index_saved:
+            os.makedirs(os.path.dirname(self.name_index_file), exist_ok=True)
+            self.name_index.save(self.name_index_file)
+            self._name_index_saved = True
+        return self.name_index
+
+    def _load_name_index(self) -> Optional[NameSearchIndex]:
+        if not os.path.exists(self.name_index_file):
+            return None
+        try:
+            index = NameSearchIndex.load(self.name_index_file)
+        except (OSError, ValueError, KeyError):
+            return None
+        stamp = RegisterSnapshot.source_stamp(self._source_file())
+        if stamp is None or index.source != stamp or index.row_count != len(self.get_lookup_table()):
+            return None
+        return index
+
+    def get_closest_names(self, last: str, first: str, n: int = 5) -> pd.DataFrame:
+        """
+        Returns the register rows for the ``n`` names closest to the full name.
+        """
+        return self.get_closest_names_many([(last, first)], n=n)[0]
+
+    def get_closest_names_many(self, names: List[Tuple[str, str]], n: int = 5) -> List[pd.DataFrame]:
+        """
+        Returns, for each ``(last, first)`` pair, the register rows for the ``n`` closest names.
+        """
+        index = self.get_name_index()
+        table = self.lookup_table
+        matches = index.search_many([f"{first} {last}" for last, first in names], k=n)
+        return [
+            table.iloc[np.concatenate([match.rows for match in found]) if found else []].reset_index(drop=True)
+            for found in matches
+        ]
 
 
 class PlayerSearchClient:
@@ -106,9 +250,57 @@ class PlayerSearchClient:
     Provides methods to search for player information from the Chadwick register.
     """
 
+    KEY_TYPES = KEY_TYPES
+    INTEGER_KEYS = INTEGER_KEYS
+
     def __init__(self, register: ChadwickRegister):
         self.register = register
         self.table = self.register.get_lookup_table()
+        # {key_type: (sorted IDs, row positions in that order)}, built once so reverse
+        # lookups are a binary search instead of a full-table scan.
+        self._id_index: Dict[str, Tuple[np.ndarray, np.ndarray]] = {
+            key_type: self.register.id_index(key_type) for key_type in self.KEY_TYPES
+        }
+        # Lower-cased (and, for ignore_accents, accent-folded) name columns with
+        # their (last, first) and last-name indexes, keyed by ignore_accents and
+        # built on first use. The register table itself is never modified.
+        self._names: Dict[bool, pd.DataFrame] = {}
+        self._name_indexes: Dict[bool, Tuple[Dict[Tuple[str, str], np.ndarray], Dict[str, np.ndarray]]] = {}
+        self._names_lock = threading.Lock()
+
+    def _normalize_id(self, player_id: Any, key_type: str) -> Any:
+        if key_type in self.INTEGER_KEYS:
+            try:
+                return int(player_id)
+            except (TypeError, ValueError):
+                return None
+        return None if player_id is None else str(player_id)
+
+    def _check_key_type(self, key_type: str) -> None:
+        if key_type not in self.KEY_TYPES:
+            raise ValueError(f"[Key Type: {key_type}] Invalid; must be one of {self.KEY_TYPES}")
+
+    def _positions(self, player_id: Any, key_type: str) -> np.ndarray:
+        keys, rows = self._id_index[key_type]
+        player_id = self._normalize_id(player_id, key_type)
+        if player_id is None or len(keys) == 0:
+            return rows[:0]
+        start = np.searchsorted(keys, player_id, side='left')
+        end = np.searchsorted(keys, player_id, side='right')
+        return rows[start:end]
+
+    def _name_index(self, ignore_accents: bool) -> Tuple[Dict[Tuple[str, str], np.ndarray], Dict[str, np.ndarray]]:
+        """Returns ``({(last, first): rows}, {last: rows})``, building it on first use."""
+        with self._names_lock:
+            if ignore_accents not in self._name_indexes:
+                last, first = self.register.normalized_names(ignore_accents)
+                names = pd.DataFrame({'name_last': last, 'name_first': first})
+                self._names[ignore_accents] = names
+                self._name_indexes[ignore_accents] = (
+                    names.groupby(['name_last', 'name_first'], sort=False).indices,
+                    names.groupby('name_last', sort=False).indices,
+                )
+            return self._name_indexes[ignore_accents]
 
     def search(self, last: str, first: Optional[str] = None, fuzzy: bool = False, ignore_accents: bool = False) -> pd.DataFrame:
         """
@@ -122,39 +314,53 @@ class PlayerSearchClient:
             last = self.register.normalize_accents(last)
             if first is not None:
                 first = self.register.normalize_accents(first)
-            self.table['name_last'] = self.table['name_last'].apply(self.register.normalize_accents)
-            self.table['name_first'] = self.table['name_first'].apply(self.register.normalize_accents)
 
+        by_full_name, by_last_name = self._name_index(ignore_accents)
         if first is None:
-            results = self.table.loc[self.table['name_last'] == last]
+            rows = by_last_name.get(last)
         else:
-            results = self.table.loc[(self.table['name_last'] == last) & (self.table['name_first'] == first)]
-
-        results = results.reset_index(drop=True)
+            rows = by_full_name.get((last, first))
+        results = self.table.iloc[rows if rows is not None else []].reset_index(drop=True)
         if results.empty and fuzzy and first is not None:
             print("No identically matched names found! Returning the 5 most similar names.")
             results = self.register.get_closest_names(last, first)
         return results
 
-    def search_list(self, player_list: List[Tuple[str, str]]) -> pd.DataFrame:
+    def search_list(self, player_list: List[Tuple[str, str]], fuzzy: bool = False,
+                    ignore_accents: bool = False) -> pd.DataFrame:
         """
-        Looks up a list of players given as tuples (last, first).
+        Looks up a list of players given as tuples (last, first). With fuzzy, the names
+        without an exact match are matched together and contribute their five closest names.
         """
-        results = pd.DataFrame()
-        for last, first in player_list:
-            results = pd.concat([results, self.search(last, first)], ignore_index=True)
-        return results
+        found = [self.search(last, first, ignore_accents=ignore_accents) for last, first in player_list]
+        missing = [i for i, results in enumerate(found) if results.empty] if fuzzy else []
+        if missing:
+            # Only build (or load) the n-gram index when some name needs it.
+            closest = self.register.get_closest_names_many([player_list[i] for i in missing])
+            for i, results in zip(missing, closest):
+                found[i] = results
+        if not found:
+            return pd.DataFrame()
+        return pd.concat(found, ignore_index=True)
 
     def reverse_lookup(self, player_ids: List[str], key_type: str = 'mlbam') -> pd.DataFrame:
         """
         Given a list of player IDs and a key type, returns a DataFrame with player information.
         """
-        key_types = ('mlbam', 'retro', 'bbref', 'fangraphs')
-        if key_type not in key_types:
-            raise ValueError(f"[Key Type: {key_type}] Invalid; must be one of {key_types}")
-        key = f'key_{key_type}'
-        results = self.table[self.table[key].isin(player_ids)]
-        return results.reset_index(drop=True)
+        self._check_key_type(key_type)
+        positions = [self._positions(player_id, key_type) for player_id in dict.fromkeys(player_ids)]
+        rows = np.sort(np.concatenate(positions)) if positions else np.empty(0, dtype=np.intp)
+        return self.table.iloc[rows].reset_index(drop=True)
+
+    def lookup_id(self, player_id: Any, key_type: str = 'mlbam') -> Optional[Dict[str, Any]]:
+        """
+        Returns the register row for a single player ID as a dict, or ``None`` if unknown.
+        """
+        self._check_key_type(key_type)
+        positions = self._positions(player_id, key_type)
+        if len(positions) == 0:
+            return None
+        return self.table.iloc[int(positions[0])].to_dict()
 
     # Convenience methods for commonly needed functionality:
     def playerid_lookup(self, last: str, first: Optional[str] = None, fuzzy: bool = False, ignore_accents: bool = False) -> pd.DataFrame:
@@ -166,6 +372,29 @@ class PlayerSearchClient:
     def playerid_reverse_lookup(self, player_ids: List[str], key_type: str = 'mlbam') -> pd.DataFrame:
         return self.reverse_lookup(player_ids, key_type)
 
+# The register and search client shared by every UnifiedDataClient; loaded on first use.
+_search_client: Optional[PlayerSearchClient] = None
+_search_client_lock = threading.Lock()
+
+
+def get_search_client() -> PlayerSearchClient:
+    """Return the process-wide search client, loading the register on the first call."""
+    global _search_client
+    with _search_client_lock:
+        if _search_client is None:
+            register = ChadwickRegister()
+            register.load(save=False)
+            _search_client = PlayerSearchClient(register)
+        return _search_client
+
+
+def set_search_client(client: Optional[PlayerSearchClient]) -> Optional[PlayerSearchClient]:
+    """Replace the process-wide search client and return the previous one; ``None`` reloads lazily."""
+    global _search_client
+    with _search_client_lock:
+        previous, _search_client = _search_client, client
+    return previous
+
 # # Example usage:
 # if __name__ == "__main__":
 #     register = ChadwickRegister()
@@ -0,0 +1,95 @@
+"""Per-host circuit breakers that fail fast while a host is unhealthy."""
+
+import threading
+import time
+from typing import Dict, Optional
+
+import requests
+
+
+DEFAULT_FAILURE_THRESHOLD = 5   # consecutive failures that open the circuit
+DEFAULT_RESET_TIMEOUT = 30.0    # seconds the circuit stays open before a trial request
+
+# Responses that count as the host failing; 429 is left to the rate limiter.
+FAILURE_STATUSES = frozenset([500, 502, 503, 504])
+
+CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+
+class CircuitOpenError(requests.ConnectionError):
+    """Raised instead of sending a request to a host whose circuit is open.
+
+    Subclasses ``requests.ConnectionError`` so callers that already handle a
+    host being unreachable treat it the same way.
+    """
+
+    def __init__(self, host: str, retry_in: float):
+        super().__init__(f"Circuit open for {host}; retrying in {retry_in:.1f}s")
+        self.host = host
+        self.retry_in = retry_in
+
+
+class CircuitBreaker:
+    """Tracks one host's failures and rejects requests while it is down.
+
+    After ``failure_threshold`` consecutive connection errors, timeouts or
+    5xx responses the circuit opens and every request fails immediately with
+    :class:`CircuitOpenError` instead of tying up a worker thread in a
+    timeout. Once ``reset_timeout`` has passed a single trial request is let
+    through (half-open): success closes the circuit, failure opens it again.
+    """
+
+    def __init__(self,
+                 host: str,
+                 failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+                 reset_timeout: float = DEFAULT_RESET_TIMEOUT,
+                 clock=time.monotonic):
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._counters = {"opened": 0, "rejected": 0, "failures": 0}
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state
+
+    def before_request(self) -> None:
+        """Raise :class:`CircuitOpenError` unless a request may be sent now."""
+        with self._lock:
+            if self._state == CLOSED:
+                return
+            remaining = self._opened_at + self.reset_timeout - self._clock()
+            if self._state == OPEN and remaining <= 0:
+                self._state = HALF_OPEN
+            if self._state == HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return
+            self._counters["rejected"] += 1
+        raise CircuitOpenError(self.host, max(remaining, 0.0))
+
+    def record(self, status: Optional[int]) -> None:
+        """Feed a response status (``None`` for a request that raised) back in."""
+        with self._lock:
+            self._trial_in_flight = False
+            if status is not None and status not in FAILURE_STATUSES:
+                self._state = CLOSED
+                self._failures = 0
+                return
+            self._counters["failures"] += 1
+            self._failures += 1
+            if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != OPEN:
+                    self._counters["opened"] += 1
+                self._state = OPEN
+                self._opened_at = self._clock()
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            return dict(self._counters, state=self._state)
@@ -1,12 +1,138 @@
-from baseball_data_lab.config import FANGRAPHS_BASE_URL, FANGRAPHS_NEXT_URL
+from baseball_data_lab.config import FANGRAPHS_BASE_URL, FANGRAPHS_NEXT_URL, HTTP_CACHE_DIR
+from typing import Dict, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
+
+from baseball_data_lab.apis import http_session, metrics
+from baseball_data_lab.apis.fangraphs_snapshot import LeaderboardSnapshot
+from baseball_data_lab.apis.json_stream import iter_json_array, records_frame
+from baseball_data_lab.apis.response_cache import ResponseCache, TTLPolicy, default_ttl
 import pandas as pd
-import requests
 
 
 
 
 class FangraphsClient:
 
+    # Loaded leaderboard snapshots keyed by (season, stat_type, team_split); see
+    # ``load_leaderboard_snapshot``.
+    snapshots: Dict[Tuple[int, str, bool], LeaderboardSnapshot] = {}
+
+    # Optional on-disk response cache with conditional requests; see ``enable_cache``.
+    cache: Optional[ResponseCache] = None
+
+    @staticmethod
+    def enable_cache(cache_dir: str = HTTP_CACHE_DIR, ttl_policy: TTLPolicy = default_ttl) -> ResponseCache:
+        """Cache responses and leaderboard frames under ``cache_dir`` and return the cache."""
+        FangraphsClient.cache = ResponseCache(cache_dir, ttl_policy=ttl_policy)
+        return FangraphsClient.cache
+
+    @staticmethod
+    def disable_cache() -> None:
+        FangraphsClient.cache = None
+
+    @staticmethod
+    def cache_stats() -> Dict[str, int]:
+        """Return the response cache hit/miss counters (empty if caching is off)."""
+        cache = FangraphsClient.cache
+        return cache.stats() if cache is not None else {}
+
+    @staticmethod
+    def enable_hedging(**options) -> None:
+        """Send a duplicate of Fangraphs requests slower than usual; see ``HedgePolicy`` for ``options``."""
+        http_session.enable_hedging(urlsplit(FANGRAPHS_BASE_URL).netloc, **options)
+
+    @staticmethod
+    def disable_hedging() -> None:
+        http_session.disable_hedging(urlsplit(FANGRAPHS_BASE_URL).netloc)
+
+    @staticmethod
+    def enable_circuit_breaker(**options) -> None:
+        """Fail Fangraphs requests fast while the host is down; see ``CircuitBreaker`` for ``options``."""
+        http_session.enable_circuit_breaker(urlsplit(FANGRAPHS_BASE_URL).netloc, **options)
+
+    @staticmethod
+    def disable_circuit_breaker() -> None:
+        http_session.disable_circuit_breaker(urlsplit(FANGRAPHS_BASE_URL).netloc)
+
+    @staticmethod
+    def _get_json(url: str):
+        """Fetch ``url`` through the shared session and return the decoded JSON payload.
+
+        Concurrent calls for the same URL share one request and the same payload.
+        """
+        return http_session.coalesce(url, lambda: FangraphsClient._fetch_json(url))
+
+    @staticmethod
+    def _fetch_json(url: str):
+        def request(headers):
+            return http_session.http_get(url, headers=headers) if headers else http_session.http_get(url)
+
+        cache = FangraphsClient.cache
+        if cache is None:
+            return request({}).json()
+        return cache.fetch_json(url, request)
+
+    # Bytes read from the socket at a time when streaming full leaderboards.
+    STREAM_CHUNK_BYTES = 1 << 16
+
+    @staticmethod
+    def _iter_rows(resp, body: metrics.StreamedBody):
+        """Yield the rows of a streamed response's ``data`` array as they arrive, counting its bytes in ``body``."""
+        return iter_json_array(body.count(resp.iter_content(chunk_size=FangraphsClient.STREAM_CHUNK_BYTES)))
+
+    @staticmethod
+    def _stream_rows(url: str):
+        resp = http_session.http_get(url, stream=True)
+        body = metrics.StreamedBody(url, resp)
+        try:
+            yield from FangraphsClient._iter_rows(resp, body)
+        finally:
+            resp.close()
+            body.finish()
+
+    @staticmethod
+    def _get_frame(url: str, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """Stream ``url``'s ``data`` array into a DataFrame, keeping only ``columns`` if given.
+
+        Used for ``pageitems=500000`` leaderboards, where holding the response
+        text, the decoded rows and the frame together dominates peak memory.
+        With a cache enabled the frame is kept as parquet and an expired copy
+        is revalidated with a conditional request before re-downloading.
+        """
+        cache = FangraphsClient.cache
+        if cache is None:
+            return records_frame(FangraphsClient._stream_rows(url), columns)
+
+        key = FangraphsClient._frame_key(url, columns)
+        df = cache.get_frame(key)
+        if df is not None:
+            return df
+        headers = cache.conditional_headers(key)
+        resp = http_session.http_get(url, stream=True, headers=headers) if headers else http_session.http_get(url, stream=True)
+        try:
+            if resp.status_code == 304:
+                if cache.revalidate(key) is not None:
+                    df = cache.get_frame(key, revalidated=True)
+                    if df is not None:
+                        return df
+                resp.close()
+                resp = http_session.http_get(url, stream=True)
+            body = metrics.StreamedBody(url, resp)
+            try:
+                df = records_frame(FangraphsClient._iter_rows(resp, body), columns)
+            finally:
+                body.finish()
+        finally:
+            resp.close()
+        if resp.status_code == 200:
+            cache.set_frame(key, df, response=resp, size=body.size)
+        return df
+
+    @staticmethod
+    def _frame_key(url: str, columns: Optional[Sequence[str]] = None) -> str:
+        """Cache key of ``url``'s frame; a column subset is cached separately from the full frame."""
+        return f"{url}&_columns={','.join(columns)}" if columns else url
+
     # Example URL for fetching pitching stats for a specific player in a specific season:
     # https://www.fangraphs.com/api/leaders/major-league/data
     # Query Parameters:
@@ -34,13 +160,26 @@ class FangraphsClient:
     # https://www.fangraphs.com/api/leaders/major-league/data?pos=all&stats=pit&lg=all&qual=0&season=2025&startdate=2025-03-01&enddate=2025-11-01&month=33&players=22267
     @staticmethod
     def fetch_player_stats(player_fangraphs_id: int, season: int, fangraphs_team_id: int, stat_type: str):
-        month = 0 if season < 2025 else 33
+        snapshot = FangraphsClient.get_leaderboard_snapshot(season, stat_type, team_split=fangraphs_team_id is not None)
+        if snapshot is not None:
+            return snapshot.lookup(player_fangraphs_id, fangraphs_team_id)
+        url = FangraphsClient._player_stats_url(player_fangraphs_id, season, fangraphs_team_id, stat_type)
+        data = FangraphsClient._get_json(url)
+        df = pd.DataFrame(data=data['data'])
+        return df
+
+    @staticmethod
+    def _stat_code(stat_type: str) -> str:
         if stat_type == 'pitching':
-            stat = 'pit'
+            return 'pit'
         elif stat_type == 'batting':
-            stat = 'bat'
-        else:
-            raise ValueError("Invalid stat_type. Must be 'pitching' or 'batting'")
+            return 'bat'
+        raise ValueError("Invalid stat_type. Must be 'pitching' or 'batting'")
+
+    @staticmethod
+    def _player_stats_url(player_fangraphs_id: int, season: int, fangraphs_team_id: int, stat_type: str) -> str:
+        month = 0 if season < 2025 else 33
+        stat = FangraphsClient._stat_code(stat_type)
 
         start_date = f"{season}-03-01"
         end_date = f"{season}-11-01"
@@ -57,46 +196,83 @@ class FangraphsClient:
                 f"&season={season}&startdate={start_date}&enddate={end_date}"
                 f"&month={month}&players={player_fangraphs_id}"
             )
-        data = requests.get(url).json()
-        df = pd.DataFrame(data=data['data'])
-        return df
+        return url
+
+    # ------------------------------------------------------------------
+    # Leaderboard snapshots
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _snapshot_url(season: int, stat_type: str, team_split: bool = False) -> str:
+        """Leaderboard URL with the same filters as ``_player_stats_url`` but every player.
+
+        ``team=0,ss`` splits players who changed teams into one row per team.
+        """
+        month = 0 if season < 2025 else 33
+        stat = FangraphsClient._stat_code(stat_type)
+        url = (
+            f"{FANGRAPHS_BASE_URL}?pos=all&stats={stat}&lg=all&qual=0"
+            f"&season={season}&startdate={season}-03-01&enddate={season}-11-01"
+            f"&month={month}&pageitems=500000"
+        )
+        if team_split:
+            url += "&team=0,ss"
+        return url
+
+    @staticmethod
+    def load_leaderboard_snapshot(season: int, stat_type: str, *, team_split: bool = False) -> LeaderboardSnapshot:
+        """Fetch a season's full leaderboard once and serve ``fetch_player_stats`` from it.
+
+        With ``team_split=True`` the snapshot answers team-filtered lookups
+        (``fangraphs_team_id`` given); otherwise it answers season totals.
+        """
+        df = FangraphsClient._get_frame(FangraphsClient._snapshot_url(season, stat_type, team_split))
+        snapshot = LeaderboardSnapshot(season, stat_type, df, team_split=team_split)
+        FangraphsClient.snapshots[(season, stat_type, team_split)] = snapshot
+        return snapshot
+
+    @staticmethod
+    def get_leaderboard_snapshot(season: int, stat_type: str, *, team_split: bool = False) -> Optional[LeaderboardSnapshot]:
+        return FangraphsClient.snapshots.get((season, stat_type, team_split))
+
+    @staticmethod
+    def clear_leaderboard_snapshots() -> None:
+        FangraphsClient.snapshots.clear()
 
     @staticmethod
-    def fetch_leaderboards(season:int, stat_type:str):
+    def fetch_leaderboards(season:int, stat_type:str, columns: Optional[Sequence[str]] = None):
         if stat_type == 'pitching':
-            return FangraphsClient.fetch_pitching_leaderboards(season)
+            return FangraphsClient.fetch_pitching_leaderboards(season, columns)
         elif stat_type == 'batting':
-            return FangraphsClient.fetch_batting_leaderboards(season)
+            return FangraphsClient.fetch_batting_leaderboards(season, columns)
         else:
             raise ValueError("Invalid stat_type. Must be 'pitching' or 'batting'")
 
     @staticmethod
-    def fetch_pitching_leaderboards(season:int):
-        url = f"{FANGRAPHS_BASE_URL}?age=&pos=all&stats=pit&lg=all&season={season}&season1={season}&ind=0&qual=0&type=8&month=0&pageitems=500000"
-        data = requests.get(url).json()
-        df = pd.DataFrame(data=data['data'])
-        return df
+    def fetch_pitching_leaderboards(season:int, columns: Optional[Sequence[str]] = None):
+        url = FangraphsClient._leaderboard_url(season, "pit")
+        return FangraphsClient._get_frame(url, columns)
     
     # Sample
     # https://www.fangraphs.com/api/leaders/major-league/data?age=&pos=all&stats=bat&lg=all&season=2024&season1=2024&ind=0&qual=0&type=8&month=0&pageitems=10
     @staticmethod
-    def fetch_batting_leaderboards(season:int):
-        url = f"{FANGRAPHS_BASE_URL}?age=&pos=all&stats=bat&lg=all&season={season}&season1={season}&ind=0&qual=0&type=8&month=0&pageitems=500000"
-        data = requests.get(url).json()
-        df = pd.DataFrame(data=data['data'])
-        return df #df
+    def fetch_batting_leaderboards(season:int, columns: Optional[Sequence[str]] = None):
+        url = FangraphsClient._leaderboard_url(season, "bat")
+        return FangraphsClient._get_frame(url, columns)
     
     @staticmethod
     def fetch_batting_leaderboards_as_json(season:int):
-        url = f"{FANGRAPHS_BASE_URL}?age=&pos=all&stats=bat&lg=all&season={season}&season1={season}&ind=0&qual=0&type=8&month=0&pageitems=500000"
-        data = requests.get(url).json()
-        return data['data']
+        """Return the season's batting leaderboard rows (the response's ``data`` array) as a list of dicts.
+
+        The response is streamed, so its text is never held alongside the rows.
+        """
+        url = FangraphsClient._leaderboard_url(season, "bat")
+        return list(FangraphsClient._stream_rows(url))
     
     @staticmethod
     def fetch_pitching_leaderboards_as_json(season:int):
-        url = f"{FANGRAPHS_BASE_URL}?age=&pos=all&stats=pit&lg=all&season={season}&season1={season}&ind=0&qual=0&type=8&month=0&pageitems=500000"
-        data = requests.get(url).json()
-        return data
+        """Pitching counterpart of ``fetch_batting_leaderboards_as_json``; returns the rows as a list of dicts."""
+        url = FangraphsClient._leaderboard_url(season, "pit")
+        return list(FangraphsClient._stream_rows(url))
     
 
     # FANGRAPHS_BASE_URL = "https://www.fangraphs.com/api/leaders/major-league/data"
@@ -104,27 +280,32 @@ class FangraphsClient:
     # https://www.fangraphs.com/api/leaders/major-league/data?age=&pos=all&stats=bat&lg=all&qual=0&season=2021&season1=2021&hand=&team=6&pageitems=30&pagenum=1&ind=0&rost=0&players=0&type=8&postseason=&sortdir=default&sortstat=WAR
     @staticmethod
     def fetch_team_players(team_id: int, season: int):
+        batting_url, pitching_url = FangraphsClient._team_players_urls(team_id, season)
 
-        # Fetch all batting stats for the team in the given year
+        # Fetch all batting and pitching stats for the team in the given year
+        batting_stats = FangraphsClient._get_json(batting_url)['data']
+        pitching_stats = FangraphsClient._get_json(pitching_url)['data']
+        return FangraphsClient._merge_team_players(batting_stats, pitching_stats)
+
+    @staticmethod
+    def _leaderboard_url(season: int, stat: str) -> str:
+        return f"{FANGRAPHS_BASE_URL}?age=&pos=all&stats={stat}&lg=all&season={season}&season1={season}&ind=0&qual=0&type=8&month=0&pageitems=500000"
+
+    @staticmethod
+    def _team_players_urls(team_id: int, season: int):
+        """Return the (batting, pitching) team leaderboard URLs used by ``fetch_team_players``."""
         #url = f"{FANGRAPHS_BASE_URL}?age=&pos=all&stats=bat&lg=all&qual=0&season=2024&season1={season}&startdate=2024-03-01&enddate=2024-11-01&month=0&hand=&team={team_id}&pageitems=30&pagenum=1&ind=0&rost=0&players=0&type=8&postseason=&sortdir=default&sortstat=WAR"
-        url = (
+        batting_url = (
             f"{FANGRAPHS_BASE_URL}?age=&pos=all&stats=bat&lg=all&qual=0"
             f"&season={season}&season1={season}&hand=&team={team_id}"
             f"&pageitems=800&pagenum=1&ind=0&rost=0&players=0&type=8"
             f"&postseason=&sortdir=default&sortstat=WAR"
         )
+        pitching_url = f"{FANGRAPHS_BASE_URL}?age=&pos=all&stats=pit&lg=all&qual=0&season={season}&season1={season}&hand=&team={team_id}&pageitems=800&pagenum=1&ind=0&rost=0&players=0&type=8&postseason=&sortdir=default&sortstat=WAR"
+        return batting_url, pitching_url
 
-        batting_stats = requests.get(url).json()['data']
-        #print(f"batting_stats = {batting_stats}")
-
-        # Fetch all pitching stats for the team in the given year
-        url = f"{FANGRAPHS_BASE_URL}?age=&pos=all&stats=pit&lg=all&qual=0&season={season}&season1={season}&hand=&team={team_id}&pageitems=800&pagenum=1&ind=0&rost=0&players=0&type=8&postseason=&sortdir=default&sortstat=WAR"
-        pitching_stats = requests.get(url).json()['data']
-
-        # Combine player names from both batting and pitching stats
-        # batters = set(batting_stats['Name'])
-        # pitchers = set(pitching_stats['Name'])
-
+    @staticmethod
+    def _merge_team_players(batting_stats, pitching_stats):
         # Extract names from the data
         # batters = [extract_name(entry['Name']) for entry in batting_stats]
         # pitchers = [extract_name(entry['Name']) for entry in pitching_stats]
@@ -150,6 +331,6 @@ class FangraphsClient:
                 https://www.fangraphs.com/api/leaders/major-league/data?age=&pos=all&stats=pit&lg=all&qual=y&season=2025&season1=2025&startdate=2025-03-01&enddate=2025-11-01&month=3&hand=&team=6%2Cts&pageitems=30&pagenum=1&ind=0&rost=0&players=&type=8&postseason=&sortdir=default&sortstat=WAR
             """
             url = f"{FANGRAPHS_BASE_URL}?age=&pos=all&stats=bat&lg=all&qual=0&season={season}&season1={season}&hand=&team={team_id}&pageitems=30&pagenum=1&ind=0&rost=0&players=0&type=8&postseason=&sortdir=default&sortstat=WAR"
-            data = requests.get(url).json()
+            data = FangraphsClient._get_json(url)
             df = pd.DataFrame(data=data['data'])
             return df
\ No newline at end of file
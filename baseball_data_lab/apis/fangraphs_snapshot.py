@@ -0,0 +1,45 @@
+"""In-memory snapshot of a season's Fangraphs leaderboard, indexed by player and team."""
+
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+class LeaderboardSnapshot:
+    """Every row of one season's batting or pitching leaderboard.
+
+    Rows are indexed by ``playerid`` and, for team-split snapshots, by
+    ``(playerid, teamid)``, so a player lookup is a positional slice of the
+    frame rather than a request. ``team_split`` snapshots hold one row per
+    player and team; the others hold one season-total row per player.
+    """
+
+    def __init__(self, season: int, stat_type: str, data: pd.DataFrame, *, team_split: bool = False):
+        self.season = season
+        self.stat_type = stat_type
+        self.team_split = team_split
+        self.data = data.reset_index(drop=True)
+        self._index: Dict[Tuple[Any, Any], np.ndarray] = {}
+        if not self.data.empty and "playerid" in self.data.columns:
+            if team_split and "teamid" in self.data.columns:
+                groups = self.data.groupby(["playerid", "teamid"], sort=False).indices
+                self._index = dict(groups)
+            else:
+                groups = self.data.groupby("playerid", sort=False).indices
+                self._index = {(pid, None): rows for pid, rows in groups.items()}
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def lookup(self, player_fangraphs_id: int, fangraphs_team_id: Optional[int] = None) -> pd.DataFrame:
+        """Return the player's rows (for one team when this is a team-split snapshot).
+
+        Players missing from the leaderboard get an empty frame, matching an
+        empty ``players=`` response from the API.
+        """
+        key = (player_fangraphs_id, fangraphs_team_id if self.team_split else None)
+        rows = self._index.get(key)
+        if rows is None:
+            return self.data.iloc[0:0].copy()
+        return self.data.iloc[rows].reset_index(drop=True)
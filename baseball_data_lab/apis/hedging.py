@@ -0,0 +1,106 @@
+"""Hedged requests: send a duplicate when the first answer is slower than usual."""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Deque, Dict
+
+import requests
+
+
+DEFAULT_PERCENTILE = 95.0       # hedge once a request is slower than this share of recent ones
+DEFAULT_MIN_DELAY = 0.05        # never hedge sooner than this many seconds
+DEFAULT_INITIAL_DELAY = 1.0     # delay used until enough latencies have been seen
+DEFAULT_MIN_SAMPLES = 20
+DEFAULT_WINDOW = 500            # recent latencies kept per host
+DEFAULT_MAX_WORKERS = 64
+
+
+class HedgePolicy:
+    """Sends a second copy of a slow request and returns whichever answers first.
+
+    The delay before hedging is the ``percentile`` of the host's recent
+    successful latencies (``initial_delay`` until ``min_samples`` have been
+    seen), so only the slowest few percent of requests are duplicated. Both
+    copies run on a small shared pool; the caller waits for the first one to
+    succeed and the loser's response is closed when it arrives. The duplicate
+    goes through the same rate limiter and circuit breaker as the original.
+    """
+
+    def __init__(self,
+                 percentile: float = DEFAULT_PERCENTILE,
+                 min_delay: float = DEFAULT_MIN_DELAY,
+                 initial_delay: float = DEFAULT_INITIAL_DELAY,
+                 min_samples: int = DEFAULT_MIN_SAMPLES,
+                 window: int = DEFAULT_WINDOW,
+                 max_workers: int = DEFAULT_MAX_WORKERS):
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.initial_delay = initial_delay
+        self.min_samples = min_samples
+        self._latencies: Deque[float] = deque(maxlen=window)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="hedge")
+        self._lock = threading.Lock()
+        self._counters = {"requests": 0, "hedged": 0, "hedge_wins": 0}
+
+    def delay(self) -> float:
+        """Return how long to wait for the first copy before sending a second."""
+        with self._lock:
+            samples = sorted(self._latencies)
+        if len(samples) < self.min_samples:
+            return self.initial_delay
+        index = min(len(samples) - 1, int(len(samples) * self.percentile / 100.0))
+        return max(self.min_delay, samples[index])
+
+    def _timed(self, send: Callable[[], requests.Response]) -> requests.Response:
+        started = time.monotonic()
+        resp = send()
+        if getattr(resp, "status_code", 200) < 500:
+            with self._lock:
+                self._latencies.append(time.monotonic() - started)
+        return resp
+
+    @staticmethod
+    def _discard(future) -> None:
+        if future.exception() is None:
+            close = getattr(future.result(), "close", None)
+            if close is not None:
+                close()
+
+    def call(self, send: Callable[[], requests.Response]) -> requests.Response:
+        """Run ``send`` and, if it is slow, a duplicate; return the first successful response."""
+        with self._lock:
+            self._counters["requests"] += 1
+        primary = self._executor.submit(self._timed, send)
+        futures = [primary]
+        done, _ = wait(futures, timeout=self.delay())
+        if not done:
+            futures.append(self._executor.submit(self._timed, send))
+            with self._lock:
+                self._counters["hedged"] += 1
+
+        pending, error = set(futures), None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is not None:
+                    error = future.exception()
+                    continue
+                if future is not primary:
+                    with self._lock:
+                        self._counters["hedge_wins"] += 1
+                for other in futures:
+                    if other is not future:
+                        other.add_done_callback(self._discard)
+                return future.result()
+        raise error
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            stats = dict(self._counters)
+        stats["delay"] = round(self.delay(), 3)
+        return stats
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False)
@@ -0,0 +1,231 @@
+"""A ``requests`` transport adapter that multiplexes requests over HTTP/2 with httpx."""
+
+import asyncio
+import logging
+import threading
+import time
+from types import SimpleNamespace
+from typing import Dict, Iterator, List, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from urllib3.util.retry import RequestHistory, Retry
+
+from baseball_data_lab.apis.rate_limiter import parse_retry_after
+
+try:
+    import httpx
+except ImportError:  # optional: pip install "httpx[http2]"
+    httpx = None
+
+# httpx logs every request at INFO; keep batch runs readable.
+logging.getLogger("httpx").setLevel(logging.WARNING)
+
+
+def http2_available() -> bool:
+    """Return whether httpx with HTTP/2 support is installed."""
+    if httpx is None:
+        return False
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+# Connection-specific headers are not allowed in HTTP/2 requests.
+_HOP_BY_HOP = frozenset(["connection", "keep-alive", "proxy-connection", "transfer-encoding", "upgrade"])
+
+
+class _StreamedBody:
+    """Minimal ``Response.raw`` stand-in that reads an httpx body on the adapter's loop."""
+
+    def __init__(self, adapter: "Http2Adapter", response, history: List[RequestHistory]):
+        self._adapter = adapter
+        self._response = response
+        self._chunks = None
+        self._buffer = b""
+        self.retries = SimpleNamespace(history=tuple(history))
+        self.version = response.http_version
+
+    def _next_chunk(self, chunk_size: Optional[int] = None) -> Optional[bytes]:
+        if self._chunks is None:
+            self._chunks = self._response.aiter_bytes(chunk_size)
+
+        async def step():
+            try:
+                return await self._chunks.__anext__()
+            except StopAsyncIteration:
+                return None
+
+        return self._adapter._run(step())
+
+    def stream(self, chunk_size: int = 65536, decode_content: bool = True) -> Iterator[bytes]:
+        if self._buffer:
+            yield self._buffer
+            self._buffer = b""
+        while True:
+            chunk = self._next_chunk(chunk_size)
+            if chunk is None:
+                return
+            yield chunk
+
+    def read(self, amt: Optional[int] = None, **kwargs) -> bytes:
+        while amt is None or len(self._buffer) < amt:
+            chunk = self._next_chunk()
+            if chunk is None:
+                break
+            self._buffer += chunk
+        if amt is None:
+            amt = len(self._buffer)
+        data, self._buffer = self._buffer[:amt], self._buffer[amt:]
+        return data
+
+    def close(self) -> None:
+        if not self._response.is_closed:
+            self._adapter._run(self._response.aclose())
+
+    def release_conn(self) -> None:
+        self.close()
+
+
+class Http2Adapter(BaseAdapter):
+    """Sends a session's requests through one httpx client with HTTP/2 enabled.
+
+    HTTPS hosts negotiate HTTP/2 through ALPN and fall back to HTTP/1.1 if
+    the server does not offer it; plain ``http://`` URLs (a local stand-in
+    server) use HTTP/2 with prior knowledge. Many concurrent requests then
+    share a few multiplexed connections instead of one connection each.
+
+    The httpx client runs on a private event-loop thread and each caller
+    blocks on its own request, so any number of worker threads can share
+    the connections safely. Responses are ordinary ``requests.Response``
+    objects, including streamed bodies, and the session's ``Retry`` policy
+    is applied the same way as with urllib3: statuses in
+    ``status_forcelist`` and connection errors are retried with backoff,
+    honouring ``Retry-After``, and retried attempts are listed in
+    ``resp.raw.retries.history`` for the rate limiter.
+    """
+
+    def __init__(self, max_retries: Optional[Retry] = None, max_connections: int = 10):
+        if not http2_available():
+            raise ImportError('HTTP/2 transport needs httpx with HTTP/2 support: pip install "httpx[http2]"')
+        super().__init__()
+        self.max_retries = max_retries or Retry(0, read=False)
+        self.max_connections = max_connections
+        self._clients: Dict[str, "httpx.AsyncClient"] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def _run(self, coro):
+        """Run ``coro`` on the adapter's event loop and return its result."""
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._loop.run_forever, name="http2-transport", daemon=True)
+                self._thread.start()
+            loop = self._loop
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+    def _client_for(self, scheme: str) -> "httpx.AsyncClient":
+        # Only called on the loop thread.
+        client = self._clients.get(scheme)
+        if client is None:
+            limits = httpx.Limits(max_connections=self.max_connections,
+                                  max_keepalive_connections=self.max_connections)
+            client = httpx.AsyncClient(http1=scheme == "https", http2=True, limits=limits)
+            self._clients[scheme] = client
+        return client
+
+    @staticmethod
+    def _timeout(timeout) -> "httpx.Timeout":
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            return httpx.Timeout(read, connect=connect)
+        return httpx.Timeout(timeout)
+
+    def _backoff(self, retries_done: int) -> float:
+        if retries_done <= 1:
+            return 0.0
+        return min(self.max_retries.backoff_max, self.max_retries.backoff_factor * (2 ** (retries_done - 1)))
+
+    async def _send_once(self, request: requests.PreparedRequest, headers: Dict[str, str], stream: bool, timeout):
+        client = self._client_for(urlsplit(request.url).scheme)
+        httpx_request = client.build_request(request.method, request.url, headers=headers,
+                                             content=request.body, timeout=self._timeout(timeout))
+        response = await client.send(httpx_request, stream=True)
+        if not stream:
+            try:
+                await response.aread()
+            finally:
+                await response.aclose()
+        return response
+
+    def send(self, request: requests.PreparedRequest, stream: bool = False, timeout=None,
+             verify=True, cert=None, proxies=None) -> requests.Response:
+        retry = self.max_retries
+        allowed = retry.allowed_methods is None or request.method in retry.allowed_methods
+        total = retry.total if isinstance(retry.total, int) and allowed else 0
+        headers = {name: value for name, value in request.headers.items() if name.lower() not in _HOP_BY_HOP}
+        history: List[RequestHistory] = []
+        while True:
+            try:
+                response = self._run(self._send_once(request, headers, stream, timeout))
+            except httpx.TimeoutException as exc:
+                if len(history) >= total:
+                    raise requests.Timeout(exc, request=request)
+                history.append(RequestHistory(request.method, request.url, exc, None, None))
+                time.sleep(self._backoff(len(history)))
+                continue
+            except httpx.TransportError as exc:
+                if len(history) >= total:
+                    raise requests.ConnectionError(exc, request=request)
+                history.append(RequestHistory(request.method, request.url, exc, None, None))
+                time.sleep(self._backoff(len(history)))
+                continue
+
+            if response.status_code in (retry.status_forcelist or ()) and len(history) < total:
+                retry_after = response.headers.get("Retry-After") if retry.respect_retry_after_header else None
+                if not response.is_closed:
+                    self._run(response.aclose())
+                history.append(RequestHistory(request.method, request.url, None, response.status_code, None))
+                delay = parse_retry_after(retry_after)
+                time.sleep(delay if delay is not None else self._backoff(len(history)))
+                continue
+            return self._build_response(request, response, stream, history)
+
+    def _build_response(self, request, response, stream: bool, history) -> requests.Response:
+        resp = requests.Response()
+        resp.status_code = response.status_code
+        resp.reason = response.reason_phrase
+        resp.headers = CaseInsensitiveDict(response.headers.multi_items())
+        resp.encoding = get_encoding_from_headers(resp.headers)
+        resp.url = request.url
+        resp.request = request
+        resp.connection = self
+        resp.raw = _StreamedBody(self, response, history)
+        if not stream:
+            resp._content = response.content
+            resp._content_consumed = True
+        return resp
+
+    def close(self) -> None:
+        with self._lock:
+            loop, self._loop = self._loop, None
+            thread, self._thread = self._thread, None
+        if loop is None:
+            return
+        clients, self._clients = self._clients, {}
+
+        async def close_clients():
+            for client in clients.values():
+                await client.aclose()
+
+        asyncio.run_coroutine_threadsafe(close_clients(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
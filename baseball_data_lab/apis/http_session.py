@@ -0,0 +1,339 @@
+"""Process-wide pooled HTTP sessions shared by every API client."""
+
+import logging
+import threading
+import time
+from typing import Dict, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter, Retry
+
+from baseball_data_lab.apis import metrics
+from baseball_data_lab.apis.circuit_breaker import CircuitBreaker
+from baseball_data_lab.apis.hedging import HedgePolicy
+from baseball_data_lab.apis.http2_transport import Http2Adapter, http2_available
+from baseball_data_lab.apis.rate_limiter import RateLimiter, THROTTLE_STATUSES
+from baseball_data_lab.apis.single_flight import SingleFlight
+from baseball_data_lab.config import HTTP2_HOSTS, HTTP_TRANSPORT
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT = 10.0
+
+# One retry/backoff policy for every host.
+DEFAULT_RETRY = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset(["GET"]),
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+
+# Keep-alive pool size per host. Sized to cover SeasonStatsDownloader's worker
+# threads so concurrent requests reuse connections instead of opening new ones.
+DEFAULT_POOL_SIZE = 10
+HOST_POOL_SIZES: Dict[str, int] = {
+    "statsapi.mlb.com": 32,
+    "www.fangraphs.com": 16,
+    "img.mlbstatic.com": 16,
+    "baseballsavant.mlb.com": 8,
+}
+
+
+class SessionRegistry:
+    """Creates and hands out one keep-alive ``requests.Session`` per host.
+
+    Sessions are created lazily and shared between threads; urllib3's
+    connection pools are thread-safe, so a single session per host lets every
+    worker reuse the same TLS connections. When a ``rate_limiter`` is set,
+    every request waits for a token from its host's bucket and reports the
+    outcome back, including throttled attempts urllib3 retried internally.
+
+    Hosts can also be given a :class:`HedgePolicy` (``hedging``), which
+    duplicates unusually slow requests, and a :class:`CircuitBreaker`
+    (``breakers``), which fails requests fast while the host is down.
+
+    With ``transport="http2"`` the sessions for ``http2_hosts`` send through
+    an :class:`Http2Adapter`, multiplexing requests over a few HTTP/2
+    connections; other hosts, or every host when httpx is not installed,
+    keep the pooled HTTP/1.1 adapter.
+    """
+
+    def __init__(self,
+                 retry: Retry = DEFAULT_RETRY,
+                 pool_sizes: Optional[Dict[str, int]] = None,
+                 default_pool_size: int = DEFAULT_POOL_SIZE,
+                 timeout: float = DEFAULT_TIMEOUT,
+                 rate_limiter: Optional[RateLimiter] = None,
+                 transport: str = HTTP_TRANSPORT,
+                 http2_hosts: Sequence[str] = HTTP2_HOSTS):
+        if transport not in ("http1", "http2"):
+            raise ValueError("transport must be 'http1' or 'http2'")
+        self.retry = retry
+        self.rate_limiter = rate_limiter
+        self.pool_sizes = dict(HOST_POOL_SIZES if pool_sizes is None else pool_sizes)
+        self.default_pool_size = default_pool_size
+        self.timeout = timeout
+        if transport == "http2" and not http2_available():
+            logger.warning('HTTP/2 transport needs httpx[http2]; using HTTP/1.1 pooling')
+        self.transport = transport
+        self.http2_hosts = frozenset(h.lower() for h in http2_hosts)
+        self.hedging: Dict[str, HedgePolicy] = {}
+        self.breakers: Dict[str, CircuitBreaker] = {}
+        self._sessions: Dict[Tuple[str, str], requests.Session] = {}
+        self._lock = threading.Lock()
+
+    def pool_size_for(self, host: str) -> int:
+        return self.pool_sizes.get(host, self.default_pool_size)
+
+    def transport_for(self, host: str) -> str:
+        """Return the transport ('http1' or 'http2') used for requests to ``host``."""
+        if self.transport == "http2" and host in self.http2_hosts and http2_available():
+            return "http2"
+        return "http1"
+
+    def _build_session(self, host: str, transport: str = "http1") -> requests.Session:
+        pool_size = self.pool_size_for(host)
+        if transport == "http2":
+            adapter = Http2Adapter(max_retries=self.retry, max_connections=pool_size)
+        else:
+            adapter = HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=pool_size,
+                max_retries=self.retry,
+                pool_block=False,
+            )
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def session_for(self, url: str, origin: Optional[str] = None) -> requests.Session:
+        """Return the shared session for the host of ``url``.
+
+        ``origin`` is the URL before any host override and decides the
+        transport, so a stand-in server is reached the way the real host is.
+        """
+        host = urlsplit(url).netloc.lower()
+        origin_host = urlsplit(origin).netloc.lower() if origin else host
+        key = (host, self.transport_for(origin_host))
+        session = self._sessions.get(key)
+        if session is None:
+            with self._lock:
+                session = self._sessions.get(key)
+                if session is None:
+                    session = self._build_session(origin_host, key[1])
+                    self._sessions[key] = session
+        return session
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        kwargs.setdefault("timeout", self.timeout)
+        hedge = self.hedging.get(urlsplit(url).netloc.lower())
+        if hedge is None:
+            return self._send(url, **kwargs)
+        return hedge.call(lambda: self._send(url, **kwargs))
+
+    def _send(self, url: str, **kwargs) -> requests.Response:
+        breaker = self.breakers.get(urlsplit(url).netloc.lower())
+        if breaker is None:
+            return self._send_limited(url, **kwargs)
+        breaker.before_request()
+        try:
+            resp = self._send_limited(url, **kwargs)
+        except Exception:
+            # Any failure counts, so a half-open trial always settles the breaker.
+            breaker.record(None)
+            raise
+        breaker.record(resp.status_code)
+        return resp
+
+    def _send_limited(self, url: str, **kwargs) -> requests.Response:
+        target = rewrite_url(url)
+        limiter = self.rate_limiter
+        session = self.session_for(target, origin=url)
+        if limiter is None:
+            return session.get(target, **kwargs)
+
+        limiter.acquire(url)
+        try:
+            resp = session.get(target, **kwargs)
+        except (requests.ConnectionError, requests.Timeout):
+            limiter.record(url, None)
+            raise
+        # Attempts urllib3 already retried never reach the caller; count them too.
+        history = getattr(getattr(resp.raw, "retries", None), "history", None) or ()
+        for attempt in history:
+            if attempt.status in THROTTLE_STATUSES:
+                limiter.record(url, attempt.status)
+        limiter.record(url, resp.status_code, resp.headers.get("Retry-After"))
+        return resp
+
+    def hosts(self):
+        return sorted({host for host, _ in self._sessions})
+
+    def transports(self) -> Dict[str, str]:
+        """Return ``{host: transport}`` for every session created so far."""
+        return {host: transport for host, transport in sorted(self._sessions)}
+
+    def close(self) -> None:
+        """Close every pooled session; new ones are created on the next request."""
+        with self._lock:
+            sessions, self._sessions = self._sessions, {}
+        for session in sessions.values():
+            session.close()
+
+
+# Hosts whose requests are sent to a stand-in server instead; see ``set_host_override``.
+_host_overrides: Dict[str, str] = {}
+
+
+def set_host_override(hosts, base_url: Optional[str]) -> None:
+    """Send requests for ``hosts`` to ``base_url`` (``None`` removes the override).
+
+    ``https://statsapi.mlb.com/api/v1/teams`` becomes
+    ``{base_url}/statsapi.mlb.com/api/v1/teams`` so one stand-in server can
+    answer for several hosts. Rate limits still apply per original host.
+    """
+    for host in ([hosts] if isinstance(hosts, str) else hosts):
+        if base_url is None:
+            _host_overrides.pop(host.lower(), None)
+        else:
+            _host_overrides[host.lower()] = base_url.rstrip("/")
+
+
+def rewrite_url(url: str) -> str:
+    """Return ``url`` redirected to its host's override, or unchanged."""
+    if not _host_overrides:
+        return url
+    parts = urlsplit(url)
+    base_url = _host_overrides.get(parts.netloc.lower())
+    if base_url is None:
+        return url
+    target = f"{base_url}/{parts.netloc.lower()}{parts.path}"
+    return f"{target}?{parts.query}" if parts.query else target
+
+
+_registry = SessionRegistry(rate_limiter=RateLimiter())
+
+# Merges concurrent identical fetches from every sync client; see ``coalesce``.
+_single_flight = SingleFlight()
+
+
+def get_registry() -> SessionRegistry:
+    return _registry
+
+
+def set_registry(registry: SessionRegistry) -> SessionRegistry:
+    """Replace the process-wide registry and return the previous one."""
+    global _registry
+    previous, _registry = _registry, registry
+    return previous
+
+
+def set_transport(transport: str) -> None:
+    """Switch the shared sessions to ``transport`` ('http1' or 'http2').
+
+    Open sessions are closed and rebuilt on their next request. A missing
+    httpx install is logged and HTTP/1.1 pooling is kept.
+    """
+    if transport not in ("http1", "http2"):
+        raise ValueError("transport must be 'http1' or 'http2'")
+    if transport == "http2" and not http2_available():
+        logger.warning('HTTP/2 transport needs httpx[http2]; using HTTP/1.1 pooling')
+    _registry.transport = transport
+    _registry.close()
+
+
+def get_rate_limiter() -> Optional[RateLimiter]:
+    """Return the rate limiter shared by the sync and async clients, if any."""
+    return _registry.rate_limiter
+
+
+def rate_limit_stats() -> Dict[str, Dict[str, float]]:
+    limiter = get_rate_limiter()
+    return limiter.stats() if limiter is not None else {}
+
+
+def _hosts(hosts):
+    return [h.lower() for h in ([hosts] if isinstance(hosts, str) else hosts)]
+
+
+def enable_hedging(hosts, **options) -> None:
+    """Hedge slow requests to ``hosts``; ``options`` are passed to :class:`HedgePolicy`."""
+    for host in _hosts(hosts):
+        _registry.hedging[host] = HedgePolicy(**options)
+
+
+def disable_hedging(hosts) -> None:
+    for host in _hosts(hosts):
+        policy = _registry.hedging.pop(host, None)
+        if policy is not None:
+            policy.shutdown()
+
+
+def enable_circuit_breaker(hosts, **options) -> None:
+    """Fail fast while ``hosts`` are down; ``options`` are passed to :class:`CircuitBreaker`."""
+    for host in _hosts(hosts):
+        _registry.breakers[host] = CircuitBreaker(host, **options)
+
+
+def disable_circuit_breaker(hosts) -> None:
+    for host in _hosts(hosts):
+        _registry.breakers.pop(host, None)
+
+
+def hedging_stats() -> Dict[str, Dict[str, float]]:
+    """Return per-host hedged request counts and the current hedging delay."""
+    return {host: policy.stats() for host, policy in sorted(_registry.hedging.items())}
+
+
+def circuit_breaker_stats() -> Dict[str, Dict[str, object]]:
+    """Return per-host circuit state and how often each circuit opened or rejected a request."""
+    return {host: breaker.stats() for host, breaker in sorted(_registry.breakers.items())}
+
+
+def _coalesce_endpoint(key) -> str:
+    parts = key if isinstance(key, tuple) else (key,)
+    for part in parts:
+        if isinstance(part, str) and "://" in part:
+            return metrics.endpoint_of(part)
+    return str(parts[0])
+
+
+def coalesce(key, fn):
+    """Run ``fn`` once for all threads concurrently asking for ``key`` and share its result."""
+    ran = []
+
+    def run():
+        ran.append(True)
+        return fn()
+
+    try:
+        return _single_flight.do(key, run)
+    finally:
+        if not ran:
+            metrics.count_coalesced(_coalesce_endpoint(key))
+
+
+def coalescing_stats() -> Dict[str, int]:
+    """Return how many fetches ran and how many duplicate callers were merged into them."""
+    return _single_flight.stats()
+
+
+def http_get(url: str, **kwargs) -> requests.Response:
+    """GET ``url`` through the shared, pooled session for its host.
+
+    Each call is recorded in the per-endpoint client metrics (see ``metrics``).
+    """
+    started = time.perf_counter()
+    try:
+        resp = _registry.get(url, **kwargs)
+    except Exception:
+        metrics.observe_request(metrics.endpoint_of(url), time.perf_counter() - started, error=True)
+        raise
+    metrics.observe_request(metrics.endpoint_of(url), time.perf_counter() - started,
+                            status=getattr(resp, "status_code", None), size=metrics.response_size(resp))
+    return resp
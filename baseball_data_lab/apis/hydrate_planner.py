@@ -0,0 +1,273 @@
+"""Merges what callers need from the StatsAPI people endpoint into as few requests as possible."""
+
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from baseball_data_lab.apis.mlb_stats_client import MlbStatsClient
+from baseball_data_lab.config import STATS_API_BASE_URL
+
+
+# Situation codes requested for batter and pitcher splits.
+BATTER_SIT_CODES = ("vr", "vl", "h", "a")
+PITCHER_SIT_CODES = ("vr", "vl")
+
+CAREER_STAT_TYPES = ("yearByYear", "career", "yearByYearAdvanced", "careerAdvanced")
+
+# StatsAPI calls the batting group "hitting".
+_GROUP_NAMES = {"batting": "hitting"}
+
+
+def _group_name(group: str) -> str:
+    return _GROUP_NAMES.get(group, group)
+
+
+def _union(first: Sequence[str], second: Sequence[str]) -> Tuple[str, ...]:
+    return tuple(dict.fromkeys(tuple(first) + tuple(second)))
+
+
+@dataclass(frozen=True)
+class StatsHydrate:
+    """One ``stats(...)`` hydration: stat types and groups plus the parameters scoping them.
+
+    ``game_type``, ``league_list_id`` and ``nested`` left as ``None`` adopt
+    whatever another hydration they are merged with asks for; ``season``
+    must match exactly, since ``None`` means every season.
+    """
+
+    types: Tuple[str, ...]
+    groups: Tuple[str, ...]
+    season: Optional[int] = None
+    sit_codes: Tuple[str, ...] = ()
+    game_type: Optional[str] = None
+    league_list_id: Optional[str] = None
+    nested: Optional[str] = None
+
+    def merge(self, other: "StatsHydrate") -> Optional["StatsHydrate"]:
+        """Return one hydration covering both, or ``None`` if their parameters conflict."""
+        if self.season != other.season:
+            return None
+        scoped = {}
+        for name in ("game_type", "league_list_id", "nested"):
+            mine, theirs = getattr(self, name), getattr(other, name)
+            if mine is not None and theirs is not None and mine != theirs:
+                return None
+            scoped[name] = mine if mine is not None else theirs
+        return replace(self,
+                       types=_union(self.types, other.types),
+                       groups=_union(self.groups, other.groups),
+                       sit_codes=_union(self.sit_codes, other.sit_codes),
+                       **scoped)
+
+    def render(self) -> str:
+        """Return the ``stats(...)`` expression, e.g. ``stats(group=[hitting],type=statSplits,...)``."""
+        types = ",".join(self.types)
+        type_part = f"type=[{types}]" if len(self.types) > 1 or self.nested else f"type={types}"
+        if self.nested:
+            type_part += f"({self.nested})"
+        parts = [f"group=[{','.join(self.groups)}]", type_part]
+        if self.sit_codes:
+            parts.append(f"sitCodes=[{','.join(self.sit_codes)}]")
+        if self.game_type:
+            parts.append(f"gameType={self.game_type}")
+        if self.league_list_id:
+            parts.append(f"leagueListId={self.league_list_id}")
+        if self.season is not None:
+            parts.append(f"season={self.season}")
+        return f"stats({','.join(parts)})"
+
+    def select(self, stat_blocks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Return the blocks of a merged response that this hydration asked for.
+
+        Splits are narrowed to ``sit_codes`` when the merged request asked for more.
+        """
+        selected = []
+        for block in stat_blocks:
+            type_name = (block.get("type") or {}).get("displayName")
+            group_name = (block.get("group") or {}).get("displayName")
+            if type_name is not None and type_name not in self.types:
+                continue
+            if group_name is not None and group_name not in self.groups:
+                continue
+            if self.sit_codes:
+                splits = [split for split in block.get("splits") or []
+                          if (split.get("split") or {}).get("code") in self.sit_codes]
+                block = dict(block, splits=splits)
+            selected.append(block)
+        return selected
+
+
+class HydrateRequest:
+    """Handle for one caller's part of a plan; :meth:`result` is available after execution."""
+
+    def __init__(self, player_id: int, hydrations: Tuple[str, ...], stats: Optional[StatsHydrate],
+                 parse: Callable[[Dict[str, Any]], Any]):
+        self.player_id = player_id
+        self.hydrations = hydrations
+        self.stats = stats
+        self.parse = parse
+        self._done = False
+        self._result: Any = None
+        self._error: Optional[Exception] = None
+
+    def _resolve(self, person: Optional[Dict[str, Any]]) -> None:
+        self._done = True
+        if person is None:
+            self._error = LookupError(f"No people record for player {self.player_id}")
+            return
+        try:
+            self._result = self.parse(person)
+        except Exception as exc:
+            self._error = exc
+
+    def result(self) -> Any:
+        if not self._done:
+            raise RuntimeError("The plan has not been executed yet")
+        if self._error is not None:
+            raise self._error
+        return self._result
+
+
+class HydratePlanner:
+    """Plans StatsAPI people requests from declared needs and splits the responses back out.
+
+    Callers declare what they need per player (the people record with the
+    current team, season stats, situational splits, career stats) and get a
+    :class:`HydrateRequest` back. :meth:`urls` merges each player's
+    compatible ``stats(...)`` hydrations into one block, then batches
+    players whose hydrate is identical into ``people?personIds=a,b,c``
+    requests. :meth:`execute` fetches them through
+    ``MlbStatsClient._get_json`` (so the response cache and request
+    coalescing apply) and hands every request its own part of the response.
+    """
+
+    def __init__(self):
+        self._requests: List[HydrateRequest] = []
+        self._routes: Dict[str, List[Tuple[int, List[HydrateRequest]]]] = {}
+
+    # ------------------------------------------------------------------
+    # Declaring needs
+    # ------------------------------------------------------------------
+    def add(self, player_id: int, parse: Callable[[Dict[str, Any]], Any], *,
+            hydrations: Sequence[str] = (), stats: Optional[StatsHydrate] = None) -> HydrateRequest:
+        """Declare a need: top-level ``hydrations`` and/or a ``stats`` hydration, parsed with ``parse(person)``."""
+        request = HydrateRequest(int(player_id), tuple(hydrations), stats, parse)
+        self._requests.append(request)
+        self._routes.clear()
+        return request
+
+    def person(self, player_id: int) -> HydrateRequest:
+        """The people record with ``currentTeam``, as returned by ``fetch_player_info``."""
+        return self.add(player_id, lambda person: {k: v for k, v in person.items() if k != "stats"},
+                        hydrations=("currentTeam",))
+
+    def splits(self, player_id: int, season: int, group: str,
+               sit_codes: Optional[Sequence[str]] = None) -> HydrateRequest:
+        """Situational splits for ``group`` ('hitting' or 'pitching') as a DataFrame, like ``fetch_*_stat_splits``."""
+        group = _group_name(group)
+        if sit_codes is None:
+            sit_codes = PITCHER_SIT_CODES if group == "pitching" else BATTER_SIT_CODES
+        stats = StatsHydrate(types=("statSplits",), groups=(group,), season=season, sit_codes=tuple(sit_codes))
+
+        def parse(person: Dict[str, Any]) -> pd.DataFrame:
+            rows = [split for block in stats.select(person.get("stats") or []) for split in block.get("splits") or []]
+            return MlbStatsClient._process_splits(rows) if rows else pd.DataFrame()
+
+        return self.add(player_id, parse, stats=stats)
+
+    def season_stats(self, player_id: int, season: int, group: Optional[str] = None) -> HydrateRequest:
+        """Season and per-team stats, parsed like ``fetch_player_stats_by_season``."""
+        groups = (_group_name(group),) if group else ("hitting", "pitching")
+        stats = StatsHydrate(types=tuple(MlbStatsClient._SEASON_STAT_TYPES), groups=groups, season=season,
+                             league_list_id="mlb_hist", nested="team(league)")
+        return self.add(player_id,
+                        lambda person: MlbStatsClient._parse_person_season_stats(
+                            {"stats": stats.select(person.get("stats") or [])}, player_id, season),
+                        hydrations=("team",), stats=stats)
+
+    def career(self, player_id: int) -> HydrateRequest:
+        """Regular-season year-by-year and career stats as ``{"stats": [...]}``, like ``fetch_player_stats_career``."""
+        stats = StatsHydrate(types=CAREER_STAT_TYPES, groups=("hitting", "pitching"),
+                             game_type="R", league_list_id="mlb")
+        return self.add(player_id, lambda person: {"stats": stats.select(person.get("stats") or [])}, stats=stats)
+
+    # ------------------------------------------------------------------
+    # Planning
+    # ------------------------------------------------------------------
+    def _player_hydrates(self, requests: List[HydrateRequest]) -> List[Tuple[str, List[HydrateRequest]]]:
+        """Merge one player's requests into ``[(hydrate, requests)]``, one entry per request needed."""
+        blocks: List[StatsHydrate] = []
+        members: List[List[HydrateRequest]] = []
+        plain: List[HydrateRequest] = []
+        hydrations: Tuple[str, ...] = ()
+        for request in requests:
+            hydrations = _union(hydrations, request.hydrations)
+            if request.stats is None:
+                plain.append(request)
+                continue
+            for index, block in enumerate(blocks):
+                merged = block.merge(request.stats)
+                if merged is not None:
+                    blocks[index] = merged
+                    members[index].append(request)
+                    break
+            else:
+                blocks.append(request.stats)
+                members.append([request])
+
+        if not blocks:
+            return [(",".join(hydrations), plain)]
+        planned = []
+        for index, (block, block_requests) in enumerate(zip(blocks, members)):
+            # Top-level hydrations ride along with the first request only.
+            parts = list(hydrations) + [block.render()] if index == 0 else [block.render()]
+            planned.append((",".join(parts), block_requests + plain if index == 0 else block_requests))
+        return planned
+
+    def _plan(self) -> Dict[str, List[Tuple[int, List[HydrateRequest]]]]:
+        if self._routes:
+            return self._routes
+        by_player: Dict[int, List[HydrateRequest]] = {}
+        for request in self._requests:
+            by_player.setdefault(request.player_id, []).append(request)
+
+        by_hydrate: Dict[str, List[Tuple[int, List[HydrateRequest]]]] = {}
+        for player_id, requests in by_player.items():
+            for hydrate, hydrate_requests in self._player_hydrates(requests):
+                by_hydrate.setdefault(hydrate, []).append((player_id, hydrate_requests))
+
+        for hydrate, players in by_hydrate.items():
+            chunk_size = (MlbStatsClient.SEASON_STATS_BATCH_SIZE if "stats(" in hydrate
+                          else MlbStatsClient.PEOPLE_BATCH_SIZE)
+            for i in range(0, len(players), chunk_size):
+                chunk = players[i:i + chunk_size]
+                ids = ",".join(str(player_id) for player_id, _ in chunk)
+                self._routes[f"{STATS_API_BASE_URL}people?personIds={ids}&hydrate={hydrate}"] = chunk
+        return self._routes
+
+    def urls(self) -> List[str]:
+        """Return the requests the declared needs merge into."""
+        return list(self._plan())
+
+    # ------------------------------------------------------------------
+    # Execution
+    # ------------------------------------------------------------------
+    def resolve(self, url: str, payload: Dict[str, Any]) -> None:
+        """Hand each request planned for ``url`` its player's record from ``payload``."""
+        people = {person.get("id"): person for person in payload.get("people") or []}
+        for player_id, requests in self._plan()[url]:
+            for request in requests:
+                request._resolve(people.get(player_id))
+
+    def execute(self) -> None:
+        """Fetch every planned request and resolve the handles; errors surface from ``result()``."""
+        for url in self.urls():
+            try:
+                payload = MlbStatsClient._get_json(url)
+            except Exception as exc:
+                for _, requests in self._routes[url]:
+                    for request in requests:
+                        request._done, request._error = True, exc
+                continue
+            self.resolve(url, payload)
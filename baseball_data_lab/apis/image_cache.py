@@ -0,0 +1,227 @@
+"""Two-tier cache for headshots, logos and other images."""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from typing import Dict, Iterable, Optional
+
+from PIL import Image
+
+from baseball_data_lab.apis import http_session, metrics
+from baseball_data_lab.apis.response_cache import DAY, ResponseCache
+
+
+# Decoded images kept in memory, measured as width * height * bands.
+DEFAULT_MEMORY_BYTES = 256 * 1024 * 1024
+
+# Stored images are used without asking the server for this long, then revalidated.
+DEFAULT_MAX_AGE = 7 * DAY
+
+DEFAULT_PREFETCH_WORKERS = 16
+
+
+class ImageCache:
+    """Caches decoded ``PIL.Image`` objects in memory and encoded bytes on disk.
+
+    The memory tier is an LRU bounded by the decoded size of its images, so a
+    roster of sheets that all draw the same team logo decodes it once. The
+    disk tier stores the downloaded bytes with their ``ETag`` and
+    ``Last-Modified`` headers; entries older than ``max_age`` are revalidated
+    with a conditional request and only downloaded again when the server
+    says they changed. A stale entry is still served if revalidation fails.
+
+    Pass ``cache_dir=None`` for a memory-only cache. Images returned by
+    :meth:`get_image` are shared between callers and must not be modified.
+    """
+
+    def __init__(self,
+                 cache_dir: Optional[str] = None,
+                 max_memory_bytes: int = DEFAULT_MEMORY_BYTES,
+                 max_age: float = DEFAULT_MAX_AGE):
+        self.cache_dir = cache_dir
+        self.max_memory_bytes = max_memory_bytes
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._images: "OrderedDict[str, Image.Image]" = OrderedDict()
+        self._memory_bytes = 0
+        self._counters = {"memory_hits": 0, "disk_hits": 0, "revalidated": 0, "downloads": 0}
+        if cache_dir is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    # ------------------------------------------------------------------
+    # Memory tier
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _image_size(img: Image.Image) -> int:
+        return img.width * img.height * len(img.getbands())
+
+    def _remember(self, key: str, img: Image.Image) -> None:
+        size = self._image_size(img)
+        if size > self.max_memory_bytes:
+            return
+        with self._lock:
+            previous = self._images.pop(key, None)
+            if previous is not None:
+                self._memory_bytes -= self._image_size(previous)
+            self._images[key] = img
+            self._memory_bytes += size
+            while self._memory_bytes > self.max_memory_bytes:
+                _, evicted = self._images.popitem(last=False)
+                self._memory_bytes -= self._image_size(evicted)
+
+    def _recall(self, key: str) -> Optional[Image.Image]:
+        with self._lock:
+            img = self._images.get(key)
+            if img is not None:
+                self._images.move_to_end(key)
+                self._counters["memory_hits"] += 1
+        if img is not None:
+            metrics.count_cache_hit(key)
+        return img
+
+    # ------------------------------------------------------------------
+    # Disk tier
+    # ------------------------------------------------------------------
+    def _paths_for(self, key: str):
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        base = os.path.join(self.cache_dir, digest[:2], digest)
+        return f"{base}.bin", f"{base}.meta.json"
+
+    def _read_disk(self, key: str):
+        if self.cache_dir is None:
+            return None, None
+        body_path, meta_path = self._paths_for(key)
+        try:
+            with open(meta_path, "r", encoding="utf-8") as fp:
+                meta = json.load(fp)
+            with open(body_path, "rb") as fp:
+                return fp.read(), meta
+        except (OSError, ValueError):
+            return None, None
+
+    def _write_meta(self, key: str, meta: Dict) -> None:
+        _, meta_path = self._paths_for(key)
+        tmp_path = f"{meta_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as fp:
+            json.dump(meta, fp)
+        os.replace(tmp_path, meta_path)
+
+    def _write_disk(self, key: str, body: bytes, headers) -> None:
+        if self.cache_dir is None:
+            return
+        body_path, _ = self._paths_for(key)
+        os.makedirs(os.path.dirname(body_path), exist_ok=True)
+        # Body first, then metadata: a reader only trusts a body that has metadata.
+        tmp_path = f"{body_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as fp:
+            fp.write(body)
+        os.replace(tmp_path, body_path)
+        self._write_meta(key, {
+            "url": key,
+            "stored_at": time.time(),
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified"),
+        })
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._counters[name] += 1
+
+    def _load_bytes(self, url: str) -> bytes:
+        key = ResponseCache.normalize_url(url)
+        body, meta = self._read_disk(key)
+        if body is not None and time.time() - meta.get("stored_at", 0) < self.max_age:
+            self._count("disk_hits")
+            metrics.count_cache_hit(url)
+            return body
+
+        headers = {}
+        if meta is not None:
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+        try:
+            resp = http_session.http_get(url, headers=headers)
+            if resp.status_code == 304 and body is not None:
+                meta["stored_at"] = time.time()
+                self._write_meta(key, meta)
+                self._count("revalidated")
+                metrics.count_revalidated(url)
+                return body
+            resp.raise_for_status()
+        except Exception:
+            if body is not None:
+                # Serve the stale copy rather than failing the render.
+                self._count("disk_hits")
+                return body
+            raise
+
+        self._count("downloads")
+        self._write_disk(key, resp.content, resp.headers)
+        return resp.content
+
+    def get_bytes(self, url: str) -> bytes:
+        """Return the encoded image at ``url`` from disk, revalidating or downloading as needed."""
+        return http_session.coalesce(("image", url), lambda: self._load_bytes(url))
+
+    def get_image(self, url: str) -> Image.Image:
+        """Return the decoded image at ``url``, shared with other callers."""
+        key = ResponseCache.normalize_url(url)
+        img = self._recall(key)
+        if img is not None:
+            return img
+        img = Image.open(BytesIO(self.get_bytes(url)))
+        # Decode now so later callers on other threads never trigger a lazy load.
+        img.load()
+        self._remember(key, img)
+        return img
+
+    def prefetch(self, urls: Iterable[str], max_workers: int = DEFAULT_PREFETCH_WORKERS) -> Dict[str, bool]:
+        """Load every URL into both tiers in parallel.
+
+        Returns ``{url: loaded}``; failures are reported rather than raised so a
+        batch job can warm what it can and let rendering retry the rest.
+        """
+        pending = list(dict.fromkeys(u for u in urls if u))
+
+        def load(url: str) -> bool:
+            try:
+                self.get_image(url)
+                return True
+            except Exception:
+                return False
+
+        if not pending:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(pending))) as executor:
+            return dict(zip(pending, executor.map(load, pending)))
+
+    # ------------------------------------------------------------------
+    # Housekeeping
+    # ------------------------------------------------------------------
+    def clear_memory(self) -> None:
+        with self._lock:
+            self._images.clear()
+            self._memory_bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Return the hit/download counters plus the memory tier's size."""
+        with self._lock:
+            stats = dict(self._counters)
+            stats["memory_images"] = len(self._images)
+            stats["memory_bytes"] = self._memory_bytes
+        return stats
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            for name in self._counters:
+                self._counters[name] = 0
@@ -0,0 +1,101 @@
+"""Incremental decoding of large JSON array payloads into DataFrames."""
+
+import codecs
+import json
+import re
+from typing import Any, Iterable, Iterator, Optional, Sequence
+
+import pandas as pd
+
+
+# Rows converted to a typed DataFrame at a time by ``records_frame``.
+DEFAULT_CHUNK_ROWS = 10000
+
+_DECODER = json.JSONDecoder()
+_SEPARATORS = re.compile(r"[\s,]*")
+
+
+def iter_json_array(chunks: Iterable[bytes], key: str = "data") -> Iterator[Any]:
+    """Yield the elements of the top-level ``key`` array from a stream of UTF-8 chunks.
+
+    Only the undecoded tail of the stream is buffered, so a response is never
+    held as one string. The array is located by the first ``"key": [`` in the
+    payload, which suits responses such as Fangraphs' ``{"data": [...], ...}``.
+    Raises ``ValueError`` if the array is missing or the stream ends inside it.
+    """
+    chunks = iter(chunks)
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    start = re.compile(r'"%s"\s*:\s*\[' % re.escape(key))
+    buf, pos, exhausted = "", 0, False
+
+    def read_more() -> bool:
+        nonlocal buf, pos, exhausted
+        if exhausted:
+            return False
+        try:
+            text = decoder.decode(next(chunks))
+        except StopIteration:
+            text = decoder.decode(b"", final=True)
+            exhausted = True
+        buf = buf[pos:] + text
+        pos = 0
+        return True
+
+    while True:
+        match = start.search(buf)
+        if match:
+            pos = match.end()
+            break
+        if not read_more():
+            raise ValueError(f"No '{key}' array in JSON stream")
+
+    while True:
+        pos = _SEPARATORS.match(buf, pos).end()
+        if pos >= len(buf):
+            if not read_more():
+                raise ValueError(f"JSON stream ended inside the '{key}' array")
+            continue
+        if buf[pos] == "]":
+            return
+        try:
+            value, end = _DECODER.raw_decode(buf, pos)
+        except json.JSONDecodeError:
+            if read_more():
+                continue
+            raise
+        # A scalar at the very end of the buffer may continue in the next chunk.
+        if end == len(buf) and not exhausted:
+            read_more()
+            continue
+        yield value
+        pos = end
+
+
+def records_frame(records: Iterable[dict],
+                  columns: Optional[Sequence[str]] = None,
+                  chunk_rows: int = DEFAULT_CHUNK_ROWS) -> pd.DataFrame:
+    """Build a DataFrame from ``records`` ``chunk_rows`` at a time.
+
+    Each chunk is converted to typed columns as soon as it is full, so at most
+    one chunk of Python dicts is alive at once. With ``columns`` only those
+    fields are kept (missing ones become NaN) and the rest of each record is
+    dropped immediately.
+    """
+    frames = []
+    batch = []
+    for record in records:
+        if columns is not None:
+            record = {name: record[name] for name in columns if name in record}
+        batch.append(record)
+        if len(batch) >= chunk_rows:
+            frames.append(pd.DataFrame.from_records(batch, columns=columns))
+            batch = []
+    if batch or not frames:
+        frames.append(pd.DataFrame.from_records(batch, columns=columns))
+    if len(frames) == 1:
+        return frames[0]
+    names = list(columns) if columns is not None else list(dict.fromkeys(name for frame in frames for name in frame))
+    # A column that is all NA in one chunk must not decide the dtype; pandas only
+    # ignores such chunks with a FutureWarning, so drop them and restore the columns after.
+    frames = [frame.dropna(axis=1, how="all") for frame in frames]
+    return pd.concat(frames, ignore_index=True, sort=False).reindex(columns=names)
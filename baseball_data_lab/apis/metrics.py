@@ -0,0 +1,313 @@
+"""Per-endpoint request metrics for the API clients, with a Prometheus text exporter."""
+
+import math
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
+
+
+# Upper bounds (seconds) of the latency histogram buckets; +Inf is implied.
+DEFAULT_BUCKETS = (0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+METRIC_PREFIX = "baseball_data_lab_client"
+
+_ID_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+
+def endpoint_of(url: str) -> str:
+    """Return ``url``'s host and path with numeric IDs replaced, e.g. ``.../teams/{id}/roster``."""
+    parts = urlsplit(url)
+    return f"{parts.netloc.lower()}{_ID_SEGMENT.sub('/{id}', parts.path)}"
+
+
+def response_size(resp: Any) -> int:
+    """Return the number of bytes ``resp`` transferred, as far as it can be told."""
+    headers = getattr(resp, "headers", None) or {}
+    length = headers.get("Content-Length")
+    if length and str(length).isdigit():
+        return int(length)
+    content = getattr(resp, "_content", None)
+    return len(content) if isinstance(content, (bytes, bytearray)) else 0
+
+
+class StreamedBody:
+    """Counts the bytes of a streamed response body as it is read.
+
+    ``http_get`` records a streamed response before its body is read, so it
+    only knows the size when a ``Content-Length`` was sent. ``finish`` adds
+    the counted bytes to ``url``'s metrics for the other responses.
+    """
+
+    def __init__(self, url: str, resp: Any):
+        self.url = url
+        self.header_size = response_size(resp)
+        self.read = 0
+
+    @property
+    def size(self) -> int:
+        """The response size: its ``Content-Length`` if sent, else the bytes read so far."""
+        return self.header_size or self.read
+
+    def count(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        for chunk in chunks:
+            self.read += len(chunk)
+            yield chunk
+
+    def finish(self) -> None:
+        if not self.header_size and self.read:
+            _metrics.add_bytes(endpoint_of(self.url), self.read)
+
+
+class LatencyHistogram:
+    """Cumulative-bucket latency histogram in the Prometheus layout."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.bounds = tuple(sorted(buckets)) + (math.inf,)
+        self.counts = [0] * len(self.bounds)
+        self.total = 0.0
+        self.max = 0.0
+
+    @property
+    def count(self) -> int:
+        return sum(self.counts)
+
+    def observe(self, seconds: float) -> None:
+        for index, bound in enumerate(self.bounds):
+            if seconds <= bound:
+                self.counts[index] += 1
+                break
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def cumulative(self) -> List[Tuple[float, int]]:
+        """Return ``[(upper_bound, observations <= bound)]`` including ``+Inf``."""
+        running, result = 0, []
+        for bound, count in zip(self.bounds, self.counts):
+            running += count
+            result.append((bound, running))
+        return result
+
+    def quantile(self, q: float) -> float:
+        """Estimate the ``q`` quantile by interpolating inside its bucket, like ``histogram_quantile``."""
+        count = self.count
+        if not count:
+            return 0.0
+        rank = q * count
+        lower, seen = 0.0, 0
+        for bound, in_bucket in zip(self.bounds, self.counts):
+            if in_bucket and seen + in_bucket >= rank:
+                upper = self.max if math.isinf(bound) else min(bound, self.max)
+                return lower + (upper - lower) * (rank - seen) / in_bucket
+            seen += in_bucket
+            lower = bound if not math.isinf(bound) else lower
+        return self.max
+
+
+class EndpointMetrics:
+    """Counters and latency histogram for one endpoint template."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.requests = 0
+        self.errors = 0
+        self.bytes = 0
+        self.cache_hits = 0
+        self.revalidated = 0
+        self.coalesced = 0
+        self.latency = LatencyHistogram(buckets)
+
+    def snapshot(self) -> Dict[str, Any]:
+        served = self.requests + self.cache_hits
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "bytes": self.bytes,
+            "cache_hits": self.cache_hits,
+            "revalidated": self.revalidated,
+            "coalesced": self.coalesced,
+            "cache_hit_ratio": round(self.cache_hits / served, 4) if served else 0.0,
+            "latency": {
+                "count": self.latency.count,
+                "sum": round(self.latency.total, 6),
+                "mean": round(self.latency.total / self.latency.count, 6) if self.latency.count else 0.0,
+                "p50": round(self.latency.quantile(0.5), 6),
+                "p95": round(self.latency.quantile(0.95), 6),
+                "max": round(self.latency.max, 6),
+                "buckets": {("+Inf" if math.isinf(b) else b): c for b, c in self.latency.cumulative()},
+            },
+        }
+
+
+class ClientMetrics:
+    """Thread-safe per-endpoint metrics for every API client in the process.
+
+    Endpoints are URL templates (:func:`endpoint_of`) for HTTP calls and
+    ``pybaseball.<function>`` for calls made through pybaseball. Each one
+    counts requests, errors (connection errors, timeouts and 4xx/5xx
+    responses), response bytes, response cache hits and 304 revalidations,
+    calls merged into an identical in-flight request, and a latency
+    histogram. Streamed responses are timed to their headers; without a
+    ``Content-Length`` their bytes are added as the body is read (``StreamedBody``).
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self._endpoints: Dict[str, EndpointMetrics] = {}
+        self._lock = threading.Lock()
+
+    def _endpoint(self, endpoint: str) -> EndpointMetrics:
+        metrics = self._endpoints.get(endpoint)
+        if metrics is None:
+            metrics = self._endpoints[endpoint] = EndpointMetrics(self.buckets)
+        return metrics
+
+    def observe_request(self,
+                        endpoint: str,
+                        seconds: float,
+                        status: Optional[int] = None,
+                        size: int = 0,
+                        error: bool = False) -> None:
+        """Record one request; ``error`` marks an exception, ``status >= 400`` counts as one too."""
+        with self._lock:
+            metrics = self._endpoint(endpoint)
+            metrics.requests += 1
+            metrics.bytes += size
+            metrics.latency.observe(seconds)
+            if error or (status is not None and status >= 400):
+                metrics.errors += 1
+
+    def add_bytes(self, endpoint: str, size: int) -> None:
+        """Add response bytes that were read after the request was recorded."""
+        with self._lock:
+            self._endpoint(endpoint).bytes += size
+
+    def count(self, endpoint: str, name: str) -> None:
+        """Increment ``cache_hits``, ``revalidated`` or ``coalesced`` for ``endpoint``."""
+        with self._lock:
+            metrics = self._endpoint(endpoint)
+            setattr(metrics, name, getattr(metrics, name) + 1)
+
+    @contextmanager
+    def track(self, endpoint: str) -> Iterator[None]:
+        """Time the block as one request to ``endpoint``; an exception counts as an error."""
+        started = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            self.observe_request(endpoint, time.perf_counter() - started, error=True)
+            raise
+        self.observe_request(endpoint, time.perf_counter() - started)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Return ``{endpoint: metrics}`` with counters, cache hit ratio and latency summary."""
+        with self._lock:
+            return {endpoint: metrics.snapshot() for endpoint, metrics in sorted(self._endpoints.items())}
+
+    def slowest(self, count: int = 10, quantile: str = "p95") -> List[Tuple[str, Dict[str, Any]]]:
+        """Return the ``count`` endpoints with the highest ``quantile`` latency ('p50', 'p95', 'mean', 'max')."""
+        timed = [item for item in self.snapshot().items() if item[1]["latency"]["count"]]
+        return sorted(timed, key=lambda item: item[1]["latency"][quantile], reverse=True)[:count]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._endpoints.clear()
+
+    # ------------------------------------------------------------------
+    # Prometheus
+    # ------------------------------------------------------------------
+    def to_prometheus(self, prefix: str = METRIC_PREFIX) -> str:
+        """Render the metrics in the Prometheus text exposition format."""
+        with self._lock:
+            endpoints = sorted(self._endpoints.items())
+            counters = [
+                ("requests_total", "Requests sent", [(e, m.requests) for e, m in endpoints]),
+                ("errors_total", "Requests that failed or returned 4xx/5xx", [(e, m.errors) for e, m in endpoints]),
+                ("response_bytes_total", "Response bytes received", [(e, m.bytes) for e, m in endpoints]),
+                ("cache_hits_total", "Responses served from the cache", [(e, m.cache_hits) for e, m in endpoints]),
+                ("revalidated_total", "Cached responses renewed by a 304", [(e, m.revalidated) for e, m in endpoints]),
+                ("coalesced_total", "Calls merged into an in-flight request", [(e, m.coalesced) for e, m in endpoints]),
+            ]
+            histograms = [(e, m.latency.cumulative(), m.latency.total, m.latency.count) for e, m in endpoints]
+
+        lines: List[str] = []
+        for name, help_text, values in counters:
+            lines.append(f"# HELP {prefix}_{name} {help_text}.")
+            lines.append(f"# TYPE {prefix}_{name} counter")
+            lines.extend(f'{prefix}_{name}{{endpoint="{_escape(e)}"}} {v}' for e, v in values)
+
+        name = f"{prefix}_request_duration_seconds"
+        lines.append(f"# HELP {name} Request latency in seconds.")
+        lines.append(f"# TYPE {name} histogram")
+        for endpoint, buckets, total, count in histograms:
+            label = _escape(endpoint)
+            for bound, running in buckets:
+                le = "+Inf" if math.isinf(bound) else repr(bound)
+                lines.append(f'{name}_bucket{{endpoint="{label}",le="{le}"}} {running}')
+            lines.append(f'{name}_sum{{endpoint="{label}"}} {total!r}')
+            lines.append(f'{name}_count{{endpoint="{label}"}} {count}')
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: str, prefix: str = METRIC_PREFIX) -> None:
+        """Write the metrics to ``path`` for node_exporter's textfile collector.
+
+        The file is replaced atomically so the collector never reads a partial one.
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as fp:
+            fp.write(self.to_prometheus(prefix))
+        os.replace(tmp_path, path)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+# Shared by every client; see ``get_metrics``.
+_metrics = ClientMetrics()
+
+
+def get_metrics() -> ClientMetrics:
+    return _metrics
+
+
+def set_metrics(metrics: ClientMetrics) -> ClientMetrics:
+    """Replace the process-wide metrics and return the previous ones."""
+    global _metrics
+    previous, _metrics = _metrics, metrics
+    return previous
+
+
+def observe_request(endpoint: str, seconds: float, status: Optional[int] = None, size: int = 0,
+                    error: bool = False) -> None:
+    _metrics.observe_request(endpoint, seconds, status=status, size=size, error=error)
+
+
+def count_cache_hit(url: str) -> None:
+    _metrics.count(endpoint_of(url), "cache_hits")
+
+
+def count_revalidated(url: str) -> None:
+    _metrics.count(endpoint_of(url), "revalidated")
+
+
+def count_coalesced(endpoint: str) -> None:
+    _metrics.count(endpoint, "coalesced")
+
+
+def track(endpoint: str):
+    """Context manager timing a non-HTTP call (e.g. pybaseball) as one request to ``endpoint``."""
+    return _metrics.track(endpoint)
+
+
+def snapshot() -> Dict[str, Dict[str, Any]]:
+    return _metrics.snapshot()
+
+
+def write_prometheus(path: str) -> None:
+    _metrics.write_prometheus(path)
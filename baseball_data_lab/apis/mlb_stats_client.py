@@ -1,28 +1,90 @@
 """Utilities for interacting with the public MLB Stats API."""
 
-from typing import Any, Dict, List, Optional, Literal
-from urllib.parse import urlencode
+from typing import Any, Dict, List, Optional, Literal, Sequence, Union
+from urllib.parse import urlencode, urlsplit
 
 import pandas as pd
-import requests
 import statsapi
-from requests.adapters import HTTPAdapter, Retry
 
-from baseball_data_lab.config import STATS_API_BASE_URL, SAVANT_BASE_URL
+from baseball_data_lab.apis import http_session
+from baseball_data_lab.config import STATS_API_BASE_URL, SAVANT_BASE_URL, HTTP_CACHE_DIR
+from baseball_data_lab.apis.response_cache import ResponseCache, TTLPolicy, default_ttl
 from datetime import date
 
 
 class MlbStatsClient:
     """Thin wrapper around the MLB Stats API."""
 
+    # Optional on-disk response cache shared by every fetcher; see ``enable_cache``.
+    cache: Optional[ResponseCache] = None
+
+    # ------------------------------------------------------------------
+    # Response cache
+    # ------------------------------------------------------------------
+    @staticmethod
+    def enable_cache(cache_dir: str = HTTP_CACHE_DIR, ttl_policy: TTLPolicy = default_ttl) -> ResponseCache:
+        """Cache decoded responses on disk under ``cache_dir`` and return the cache."""
+        MlbStatsClient.cache = ResponseCache(cache_dir, ttl_policy=ttl_policy)
+        return MlbStatsClient.cache
+
+    @staticmethod
+    def disable_cache() -> None:
+        MlbStatsClient.cache = None
+
+    @staticmethod
+    def cache_stats() -> Dict[str, int]:
+        """Return the response cache hit/miss counters (empty if caching is off)."""
+        cache = MlbStatsClient.cache
+        return cache.stats() if cache is not None else {}
+
+    @staticmethod
+    def cache_bytes_saved() -> Dict[str, int]:
+        """Return the bytes 304 responses saved, by endpoint (empty if caching is off)."""
+        cache = MlbStatsClient.cache
+        return cache.bytes_saved() if cache is not None else {}
+
+    @staticmethod
+    def enable_hedging(**options) -> None:
+        """Send a duplicate of StatsAPI requests slower than usual; see ``HedgePolicy`` for ``options``."""
+        http_session.enable_hedging(urlsplit(STATS_API_BASE_URL).netloc, **options)
+
+    @staticmethod
+    def disable_hedging() -> None:
+        http_session.disable_hedging(urlsplit(STATS_API_BASE_URL).netloc)
+
+    @staticmethod
+    def enable_circuit_breaker(**options) -> None:
+        """Fail StatsAPI requests fast while the host is down; see ``CircuitBreaker`` for ``options``."""
+        http_session.enable_circuit_breaker(urlsplit(STATS_API_BASE_URL).netloc, **options)
+
+    @staticmethod
+    def disable_circuit_breaker() -> None:
+        http_session.disable_circuit_breaker(urlsplit(STATS_API_BASE_URL).netloc)
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
     @staticmethod
     def _get_json(url: str, *, session: Optional[Any] = None) -> Dict[str, Any]:
-        """Fetch ``url`` and return the decoded JSON payload."""
-        http = session or requests
-        return http.get(url).json()
+        """Fetch ``url`` and return the decoded JSON payload.
+
+        When a response cache is enabled, fresh entries are served from disk and
+        successful responses are stored for later calls. Concurrent calls for
+        the same URL share one request and the same decoded payload.
+        """
+        return http_session.coalesce(url, lambda: MlbStatsClient._fetch_json(url, session=session))
+
+    @staticmethod
+    def _fetch_json(url: str, *, session: Optional[Any] = None) -> Dict[str, Any]:
+        get = session.get if session is not None else http_session.http_get
+
+        def request(headers: Dict[str, str]):
+            return get(url, headers=headers) if headers else get(url)
+
+        cache = MlbStatsClient.cache
+        if cache is None:
+            return request({}).json()
+        return cache.fetch_json(url, request)
 
     @staticmethod
     def _process_splits(data: List[Dict[str, Any]]) -> pd.DataFrame:
@@ -64,17 +126,69 @@ class MlbStatsClient:
         if k_pct is not None:
             bucket["K%"] = k_pct
 
+    # ------------------------------------------------------------------
+    # URL builders, shared with AsyncMlbStatsClient
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _player_info_url(player_id: int) -> str:
+        return f"{STATS_API_BASE_URL}people?personIds={player_id}&hydrate=currentTeam"
+
+    @staticmethod
+    def _team_url(team_id: int) -> str:
+        return f"{STATS_API_BASE_URL}teams/{team_id}"
+
+    @staticmethod
+    def _player_stats_career_url(player_id: int) -> str:
+        return (f"{STATS_API_BASE_URL}people/{player_id}/stats?stats=yearByYear,career,yearByYearAdvanced,careerAdvanced"
+                "&gameType=R&leagueListId=mlb&group=hitting,pitching")
+
     @staticmethod
-    def _session_with_retries(total: int = 3, backoff: float = 0.3) -> requests.Session:
-        s = requests.Session()
-        retries = Retry(
-            total=total,
-            backoff_factor=backoff,
-            status_forcelist=(429, 500, 502, 503, 504),
-            allowed_methods=frozenset(["GET"]),
+    def _player_team_url(player_id: int, year: int) -> str:
+        return (
+            f"{STATS_API_BASE_URL}people?"
+            f"personIds={player_id}"
+            f"&season={year}"
+            f"&hydrate=stats(group=[],type=season,team,season={year})"
         )
-        s.mount("https://", HTTPAdapter(max_retries=retries))
-        return s
+
+    @staticmethod
+    def _roster_url(team_id: int, year: int, roster_type: str) -> str:
+        return f"{STATS_API_BASE_URL}teams/{team_id}/roster?season={year}&rosterType={roster_type}"
+
+    @staticmethod
+    def _season_info_url(year: int) -> str:
+        return f"{STATS_API_BASE_URL}seasons/{year}?sportId=1"
+
+    @staticmethod
+    def _standings_url(season: int, league_ids: str) -> str:
+        return f"{STATS_API_BASE_URL}standings?leagueId={league_ids}&season={season}&standingsTypes=regularSeason"
+
+    @staticmethod
+    def _team_record_url(season: int, team_id: int) -> str:
+        return f"{STATS_API_BASE_URL}teams/?teamId={team_id}&season={season}&hydrate=standings"
+
+    @staticmethod
+    def _schedule_url(start_date: str, end_date: str) -> str:
+        return (f"{STATS_API_BASE_URL}schedule?sportId=1&startDate={start_date}&endDate={end_date}"
+                "&hydrate=probablePitcher,decisions,team")
+
+    @staticmethod
+    def _game_data_url(game_pk: int) -> str:
+        return f"{SAVANT_BASE_URL}gf?game_pk={game_pk}"
+
+    @staticmethod
+    def _boxscore_url(game_pk: int) -> str:
+        return f"{STATS_API_BASE_URL}game/{game_pk}/boxscore"
+
+    @staticmethod
+    def _team_stats_url(team_id: int, start_date: str, end_date: str) -> str:
+        # The season is the one the range starts in (``start_date`` is YYYY-MM-DD).
+        season = str(start_date)[:4]
+        return f"{STATS_API_BASE_URL}teams/{team_id}/stats?season={season}&startDate={start_date}&endDate={end_date}"
+
+    @staticmethod
+    def _recent_schedule_url(team_id: int, season: int) -> str:
+        return f"{STATS_API_BASE_URL}teams?teamId={team_id}&season={season}&hydrate=previousSchedule,nextSchedule"
 
     # ------------------------------------------------------------------
     # Simple fetchers
@@ -84,16 +198,43 @@ class MlbStatsClient:
         """Fetch player information by MLBAM player ID.
             https://statsapi.mlb.com/api/v1/people?personIds=669373&hydrate=currentTeam
         """
-        url = f"{STATS_API_BASE_URL}people?personIds={player_id}&hydrate=currentTeam"
+        url = MlbStatsClient._player_info_url(player_id)
         data = MlbStatsClient._get_json(url)
         return data["people"][0]
 
+    # Largest number of IDs sent in one people?personIds=... request.
+    PEOPLE_BATCH_SIZE = 200
+
+    @staticmethod
+    def _players_info_urls(player_ids: List[int], chunk_size: Optional[int] = None) -> List[str]:
+        """Build people?personIds=a,b,c URLs covering ``player_ids`` in chunks."""
+        chunk_size = chunk_size or MlbStatsClient.PEOPLE_BATCH_SIZE
+        ids = list(dict.fromkeys(int(pid) for pid in player_ids))
+        return [
+            f"{STATS_API_BASE_URL}people?personIds={','.join(map(str, ids[i:i + chunk_size]))}&hydrate=currentTeam"
+            for i in range(0, len(ids), chunk_size)
+        ]
+
+    @staticmethod
+    def fetch_players_info(player_ids: List[int], chunk_size: Optional[int] = None) -> Dict[int, Dict[str, Any]]:
+        """Fetch player information for many MLBAM IDs, batching the people endpoint.
+
+        Returns a dict keyed by player ID; IDs unknown to the API are omitted.
+            https://statsapi.mlb.com/api/v1/people?personIds=669373,682985&hydrate=currentTeam
+        """
+        players: Dict[int, Dict[str, Any]] = {}
+        for url in MlbStatsClient._players_info_urls(player_ids, chunk_size):
+            data = MlbStatsClient._get_json(url)
+            for person in data.get("people") or []:
+                players[person["id"]] = person
+        return players
+
     @staticmethod
     def fetch_team(team_id: int):
         """Fetch team information by MLBAM team ID.
             https://statsapi.mlb.com/api/v1/teams/116 
         """
-        url = f"{STATS_API_BASE_URL}teams/{team_id}"
+        url = MlbStatsClient._team_url(team_id)
         data = MlbStatsClient._get_json(url)
         return data.get("teams", {})[0]
 
@@ -106,12 +247,7 @@ class MlbStatsClient:
         lookup sitCodes here
           https://statsapi.mlb.com/api/v1/situationCodes         
         """
-        url = (
-            f"{STATS_API_BASE_URL}people?personIds={player_id}"
-            f"&hydrate=stats(group=[hitting],type=statSplits,sitCodes=[vr,vl,h,a],season={year})"
-        )
-        data = MlbStatsClient._get_json(url)
-        return MlbStatsClient._process_splits(data["people"][0]["stats"][0]["splits"])
+        return MlbStatsClient._fetch_stat_splits(player_id, year, "hitting")
 
     @staticmethod
     def fetch_pitcher_stat_splits(player_id: int, year: int):
@@ -119,12 +255,21 @@ class MlbStatsClient:
         Fetch pitcher stat splits for a player in a specific year.
         https://statsapi.mlb.com/api/v1/people?personIds=669373&hydrate=stats(group=[pitching],type=statSplits,sitCodes=[vr,vl],season=2024)
         """
-        url = (
-            f"{STATS_API_BASE_URL}people?personIds={player_id}"
-            f"&hydrate=stats(group=[pitching],type=statSplits,sitCodes=[vr,vl],season={year})"
-        )
-        data = MlbStatsClient._get_json(url)
-        return MlbStatsClient._process_splits(data["people"][0]["stats"][0]["splits"])
+        return MlbStatsClient._fetch_stat_splits(player_id, year, "pitching")
+
+    @staticmethod
+    def _fetch_stat_splits(player_id: int, year: int, group: str) -> pd.DataFrame:
+        planner, request = MlbStatsClient._stat_splits_plan(player_id, year, group)
+        planner.execute()
+        return request.result()
+
+    @staticmethod
+    def _stat_splits_plan(player_id: int, year: int, group: str):
+        """Return ``(planner, request)`` for one player's splits; the async client executes it itself."""
+        from baseball_data_lab.apis.hydrate_planner import HydratePlanner
+
+        planner = HydratePlanner()
+        return planner, planner.splits(player_id, year, group)
 
     # @staticmethod
     # def fetch_player_stats(player_id: int, year: int):
@@ -171,10 +316,53 @@ class MlbStatsClient:
         """Fetch player stats for a specific season.
             https://statsapi.mlb.com/api/v1/people/656427?hydrate=team,stats(type=[season,seasonAdvanced](team(league))),leagueListId=mlb_hist,season=2024
         """
+        full_url = MlbStatsClient._player_stats_by_season_url(player_id, year, group)
+        #print (f"Fetching player stats from URL: {full_url}")
+        payload = http_session.coalesce(
+            full_url, lambda: MlbStatsClient._fetch_player_stats_payload(full_url, timeout)
+        )
+        return MlbStatsClient._parse_player_stats_by_season(payload, player_id, year)
+
+    @staticmethod
+    def _fetch_player_stats_payload(full_url: str, timeout: float) -> Dict[str, Any]:
+        cache = MlbStatsClient.cache
+        payload = cache.get(full_url) if cache is not None else None
+        if payload is None:
+            headers = cache.conditional_headers(full_url) if cache is not None else {}
+            kwargs = {"headers": headers} if headers else {}
+            try:
+                resp = http_session.http_get(full_url, timeout=timeout, **kwargs)
+            except TypeError:
+                # Support mocks that don't accept a timeout argument
+                resp = http_session.http_get(full_url, **kwargs)
+            if resp.status_code == 304:
+                payload = cache.revalidate(full_url)
+                if payload is not None:
+                    return payload
+                resp = http_session.http_get(full_url, timeout=timeout)
+            if resp.status_code != 200:
+                # Surface a clear message with URL & params for debugging
+                msg = f"StatsAPI error {resp.status_code} for {resp.url}"
+                try:
+                    details = resp.json()
+                    msg += f" | body: {details}"
+                except Exception:
+                    pass
+                resp.raise_for_status()
+
+            payload = resp.json()
+            if cache is not None:
+                cache.set(full_url, payload, response=resp)
+        return payload
 
+    # Stat types requested by ``fetch_player_stats_by_season``.
+    _SEASON_STAT_TYPES = ["season", "seasonAdvanced"]
+
+    @staticmethod
+    def _season_stats_hydrate(year: int, group: Optional[str] = None) -> str:
+        """Return the team/stats hydrate expression used for season stats."""
         # Build the hydrate expression
-        stat_types = ["season", "seasonAdvanced"]  # add/remove types as needed
-        stat_types_part = ",".join(stat_types)
+        stat_types_part = ",".join(MlbStatsClient._SEASON_STAT_TYPES)
 
         # If you want to filter to a specific group, you can also request:
         # stats(type=[...], group=[pitching])
@@ -186,37 +374,33 @@ class MlbStatsClient:
             f"stats(type=[{stat_types_part}]{group_part}"
             f"(team(league)),leagueListId=mlb_hist,season={year})"
         )
+        return hydrate
 
+    @staticmethod
+    def _player_stats_by_season_url(player_id: int, year: int, group: Optional[str] = None) -> str:
+        """Build the people/{id} hydrate URL used by ``fetch_player_stats_by_season``."""
         params = {
-            "hydrate": hydrate,
+            "hydrate": MlbStatsClient._season_stats_hydrate(year, group),
         }
         url = f"{STATS_API_BASE_URL}/people/{player_id}"
 
-        # Build full URL to allow simple monkeypatching of requests.get
-        full_url = f"{url}?{urlencode(params)}"
-        #print (f"Fetching player stats from URL: {full_url}")
-        try:
-            resp = requests.get(full_url, timeout=timeout)
-        except TypeError:
-            # Support mocks that don't accept a timeout argument
-            resp = requests.get(full_url)
-        if resp.status_code != 200:
-            # Surface a clear message with URL & params for debugging
-            msg = f"StatsAPI error {resp.status_code} for {resp.url}"
-            try:
-                details = resp.json()
-                msg += f" | body: {details}"
-            except Exception:
-                pass
-            resp.raise_for_status()
+        # Build full URL to allow simple monkeypatching of http_session.http_get
+        return f"{url}?{urlencode(params)}"
 
-        payload = resp.json()
+    @staticmethod
+    def _parse_player_stats_by_season(payload: Dict[str, Any], player_id: int, year: int) -> Dict[str, Any]:
+        """Group a people/{id} hydrate payload into season and per-team buckets."""
         people = payload.get("people") or []
         if not people:
             raise ValueError(f"No 'people' found for player_id={player_id}, year={year}")
 
         # Find the exact player (safety in case multiple entries are returned)
         person = next((p for p in people if p.get("id") == player_id), people[0])
+        return MlbStatsClient._parse_person_season_stats(person, player_id, year)
+
+    @staticmethod
+    def _parse_person_season_stats(person: Dict[str, Any], player_id: int, year: int) -> Dict[str, Any]:
+        stat_types = MlbStatsClient._SEASON_STAT_TYPES
 
         season_bucket: Dict[str, Any] = {}
         result: Dict[str, Any] = {
@@ -276,6 +460,94 @@ class MlbStatsClient:
 
         return result
     
+    # Players per request for the bulk season-stats hydrate; each person carries
+    # several stat splits, so batches are smaller than for plain people lookups.
+    SEASON_STATS_BATCH_SIZE = 50
+
+    # Leading columns of the ``fetch_players_stats_by_season`` frame; stat columns follow.
+    SEASON_STATS_COLUMNS = ["player_id", "season", "group", "team_id", "team_name", "abbrev", "league_id", "league_name"]
+
+    @staticmethod
+    def _players_stats_by_season_urls(
+        player_ids: List[int], year: int, group: str, chunk_size: Optional[int] = None
+    ) -> List[str]:
+        """Build people?personIds=a,b,c URLs with the season-stats hydrate."""
+        chunk_size = chunk_size or MlbStatsClient.SEASON_STATS_BATCH_SIZE
+        ids = list(dict.fromkeys(int(pid) for pid in player_ids))
+        hydrate = MlbStatsClient._season_stats_hydrate(year, group)
+        return [
+            f"{STATS_API_BASE_URL}people?"
+            f"{urlencode({'personIds': ','.join(map(str, ids[i:i + chunk_size])), 'hydrate': hydrate}, safe=',[]()=')}"
+            for i in range(0, len(ids), chunk_size)
+        ]
+
+    @staticmethod
+    def _season_stats_rows(payload: Dict[str, Any], year: int, group: str) -> List[Dict[str, Any]]:
+        """Flatten a bulk season-stats payload into one row per player and team."""
+        rows: List[Dict[str, Any]] = []
+        for person in payload.get("people") or []:
+            parsed = MlbStatsClient._parse_person_season_stats(person, person.get("id"), year)
+            for tid in parsed["team_ids"]:
+                team = parsed["teams"][tid]
+                row = {
+                    "player_id": person.get("id"),
+                    "season": year,
+                    "group": group,
+                    "team_id": team.get("teamId", tid),
+                    "team_name": team.get("teamName"),
+                    "abbrev": team.get("abbrev"),
+                    "league_id": team.get("leagueId"),
+                    "league_name": team.get("leagueName"),
+                }
+                row.update(team["stats"])
+                rows.append(row)
+        return rows
+
+    @staticmethod
+    def _season_stats_frame(rows: List[Dict[str, Any]]) -> pd.DataFrame:
+        if not rows:
+            return pd.DataFrame(columns=MlbStatsClient.SEASON_STATS_COLUMNS)
+        return pd.DataFrame(rows)
+
+    @staticmethod
+    def fetch_players_stats_by_season(
+        player_ids: List[int],
+        year: int,
+        group: Union[str, Sequence[str]] = ("batting", "pitching"),
+        *,
+        chunk_size: Optional[int] = None,
+    ) -> pd.DataFrame:
+        """Fetch per-team season stats for many players with batched hydrate requests.
+
+        Each request carries up to ``chunk_size`` personIds and the same hydrate as
+        ``fetch_player_stats_by_season``, filtered to one stat group. Returns a tidy
+        DataFrame with one row per player, team and group; the leading columns are
+        ``SEASON_STATS_COLUMNS`` and the remaining columns are the stats.
+
+            https://statsapi.mlb.com/api/v1/people?personIds=656427,669373&hydrate=team,stats(type=[season,seasonAdvanced],group=[pitching](team(league)),leagueListId=mlb_hist,season=2024)
+        """
+        groups = [group] if isinstance(group, str) else list(group)
+        rows: List[Dict[str, Any]] = []
+        for grp in groups:
+            for url in MlbStatsClient._players_stats_by_season_urls(player_ids, year, grp, chunk_size):
+                payload = MlbStatsClient._get_json(url)
+                rows.extend(MlbStatsClient._season_stats_rows(payload, year, grp))
+        return MlbStatsClient._season_stats_frame(rows)
+
+    @staticmethod
+    def teams_by_player(stats_df: pd.DataFrame) -> Dict[int, List[int]]:
+        """Map each player in a ``fetch_players_stats_by_season`` frame to their team IDs, in order."""
+        teams: Dict[int, List[int]] = {}
+        for player_id, team_id in zip(stats_df["player_id"], stats_df["team_id"]):
+            try:
+                team_id = int(team_id)
+            except (TypeError, ValueError):
+                pass
+            player_teams = teams.setdefault(int(player_id), [])
+            if team_id not in player_teams:
+                player_teams.append(team_id)
+        return teams
+
     @staticmethod
     def fetch_player_stats_career(player_id: int):
         """
@@ -285,7 +557,7 @@ class MlbStatsClient:
             Pitcher example:
             https://statsapi.mlb.com/api/v1/people/669373/stats?stats=yearByYear,career,yearByYearAdvanced,careerAdvanced&gameType=R&leagueListId=mlb&group=hitting,pitching
         """
-        url = STATS_API_BASE_URL + f"people/{player_id}/stats?stats=yearByYear,career,yearByYearAdvanced,careerAdvanced&gameType=R&leagueListId=mlb&group=hitting,pitching"
+        url = MlbStatsClient._player_stats_career_url(player_id)
         data = MlbStatsClient._get_json(url)
         return data
 
@@ -322,7 +594,11 @@ class MlbStatsClient:
         data: Dict[str, Any] = MlbStatsClient.fetch_player_stats_by_season(
             player_id, year, group=group
         )
+        return MlbStatsClient._teams_from_season_stats(data, ids_only=ids_only)
 
+    @staticmethod
+    def _teams_from_season_stats(data: Dict[str, Any], *, ids_only: bool = False) -> List[Any]:
+        """Return the team list (or IDs) from a ``fetch_player_stats_by_season`` result."""
         team_ids = data.get("team_ids") or []
         teams_map = data.get("teams") or {}
 
@@ -359,12 +635,7 @@ class MlbStatsClient:
 
             https://statsapi.mlb.com/api/v1/people?personIds=111509&season=1984&hydrate=stats(group=[],type=season,team,season=1984)
         """
-        url = (
-            f"{STATS_API_BASE_URL}people?"
-            f"personIds={player_id}"
-            f"&season={year}"
-            f"&hydrate=stats(group=[],type=season,team,season={year})"
-        )
+        url = MlbStatsClient._player_team_url(player_id, year)
         data = MlbStatsClient._get_json(url)
         splits = data["people"][0]["stats"][0]["splits"]
 
@@ -413,10 +684,7 @@ class MlbStatsClient:
         if not team_id:
             team_id = MlbStatsClient.get_team_id(team_name)
 
-        url = (
-            f"{STATS_API_BASE_URL}teams/{team_id}/roster"
-            f"?season={year}&rosterType=active"
-        )
+        url = MlbStatsClient._roster_url(team_id, year, "active")
         data = MlbStatsClient._get_json(url)
         return data["roster"]
     
@@ -427,7 +695,7 @@ class MlbStatsClient:
 
         https://statsapi.mlb.com/api/v1/teams/116/roster?&season=2025&rosterType=fullSeason
         """
-        url = f"{STATS_API_BASE_URL}teams/{team_id}/roster?season={year}&rosterType=fullSeason"
+        url = MlbStatsClient._roster_url(team_id, year, "fullSeason")
         data = MlbStatsClient._get_json(url)
         return data["roster"]
 
@@ -468,9 +736,13 @@ class MlbStatsClient:
         Returns
         -------
         dict
-            The first season record returned by ``statsapi.get``.
+            The first season record returned by the ``seasons`` endpoint.
+
+            https://statsapi.mlb.com/api/v1/seasons/2024?sportId=1
         """
-        return statsapi.get('season', {'seasonId': year, 'sportId': 1})['seasons'][0]
+        url = MlbStatsClient._season_info_url(year)
+        data = MlbStatsClient._get_json(url)
+        return data['seasons'][0]
     
 
     @staticmethod
@@ -479,7 +751,7 @@ class MlbStatsClient:
         """ AL ID = 103, NL ID = 104
             https://statsapi.mlb.com/api/v1/standings?leagueId=103,104&season=2025&standingsTypes=regularSeason
         """
-        url = f"{STATS_API_BASE_URL}standings?leagueId={league_ids}&season={season}&standingsTypes=regularSeason"
+        url = MlbStatsClient._standings_url(season, league_ids)
         data = MlbStatsClient._get_json(url)
         return data["records"]
 
@@ -487,7 +759,7 @@ class MlbStatsClient:
     @staticmethod
     def get_team_record_for_season(season: int, team_id: int) -> pd.DataFrame:
         """Return the team record for a given season."""
-        url = f"{STATS_API_BASE_URL}teams/?teamId={team_id}&season={season}&hydrate=standings"
+        url = MlbStatsClient._team_record_url(season, team_id)
         data = MlbStatsClient._get_json(url)
         return data["teams"][0]["record"]
     
@@ -495,7 +767,7 @@ class MlbStatsClient:
     @staticmethod
     def get_schedule_for_date_range(start_date: str, end_date: str) -> pd.DataFrame:
         """Return the schedule for a given date range."""
-        url = f"{STATS_API_BASE_URL}schedule?sportId=1&startDate={start_date}&endDate={end_date}&hydrate=probablePitcher,decisions,team"
+        url = MlbStatsClient._schedule_url(start_date, end_date)
         data = MlbStatsClient._get_json(url)
         return data["dates"]
     
@@ -515,7 +787,7 @@ class MlbStatsClient:
     @staticmethod
     def get_game_data(game_pk: int) -> pd.DataFrame:
         """Return the game data for a given game ID."""
-        url = f"{SAVANT_BASE_URL}gf?game_pk={game_pk}"
+        url = MlbStatsClient._game_data_url(game_pk)
         data = MlbStatsClient._get_json(url)
         return data
     
@@ -524,7 +796,7 @@ class MlbStatsClient:
         """Return the game boxscore data for a given game ID.
             http://statsapi.mlb.com/api/v1/game/776673/boxscore
         """
-        url = f"{STATS_API_BASE_URL}game/{game_pk}/boxscore"
+        url = MlbStatsClient._boxscore_url(game_pk)
         data = MlbStatsClient._get_json(url)
         return data
     
@@ -536,7 +808,7 @@ class MlbStatsClient:
             https://bdfed.stitch.mlbinfra.com/bdfed/stats/team?&env=prod&gameType=R&group=pitching&order=desc&sortStat=strikeouts&stats=season&season=2025&limit=30&offset=0&leagueIds=103,104&daysBack=-29
 
         """
-        url = f"{STATS_API_BASE_URL}teams/{team_id}/stats?season=2025&startDate={start_date}&endDate={end_date}"
+        url = MlbStatsClient._team_stats_url(team_id, start_date, end_date)
         data = MlbStatsClient._get_json(url)
         return data
 
@@ -548,7 +820,7 @@ class MlbStatsClient:
         Returns the first team dict from the response, or raises ValueError if not present.
         """
         season = date.today().year
-        url = f"{STATS_API_BASE_URL}teams?teamId={team_id}&season={season}&hydrate=previousSchedule,nextSchedule"
+        url = MlbStatsClient._recent_schedule_url(team_id, season)
         data = MlbStatsClient._get_json(url)
         teams = data.get("teams") or []
         if not teams:
@@ -0,0 +1,151 @@
+"""Character n-gram index for fuzzy player-name search."""
+
+import os
+import unicodedata
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+
+def fold_name(name: str) -> str:
+    """Lower-case ``name``, strip accents and collapse whitespace."""
+    stripped = ''.join(c for c in unicodedata.normalize('NFD', str(name)) if unicodedata.category(c) != 'Mn')
+    return ' '.join(stripped.lower().split())
+
+
+@dataclass(frozen=True)
+class NameMatch:
+    """One fuzzy match: the folded name, its similarity in [0, 1] and the table rows carrying it."""
+
+    name: str
+    score: float
+    rows: np.ndarray
+
+
+class NameSearchIndex:
+    """Finds the names closest to a query without comparing it against every name.
+
+    Each distinct folded name is broken into padded character ``n``-grams
+    and an inverted index maps every n-gram to the names containing it.
+    A query only scores names that share at least one n-gram with it,
+    keeps the ``candidates`` best by Dice overlap and ranks those with
+    the same ``SequenceMatcher`` ratio ``difflib.get_close_matches`` uses.
+    """
+
+    FORMAT_VERSION = 2
+
+    def __init__(self, names: np.ndarray, row_offsets: np.ndarray, rows: np.ndarray,
+                 grams: np.ndarray, gram_offsets: np.ndarray, postings: np.ndarray,
+                 gram_counts: np.ndarray, n: int = 3, source: Optional[Dict[str, int]] = None):
+        self.names = names
+        self.row_offsets = row_offsets
+        self.rows = rows
+        self.grams = grams
+        self.gram_offsets = gram_offsets
+        self.postings = postings
+        self.gram_counts = gram_counts
+        self.n = n
+        # Size and mtime of the file the names came from, so a saved index can be checked against it.
+        self.source = source
+        self._gram_ids: Dict[str, int] = {gram: i for i, gram in enumerate(grams.tolist())}
+
+    @property
+    def row_count(self) -> int:
+        """Number of table rows the index was built from."""
+        return len(self.rows)
+
+    @staticmethod
+    def _ngrams(name: str, n: int) -> List[str]:
+        padded = f" {name} "
+        return list(dict.fromkeys(padded[i:i + n] for i in range(max(len(padded) - n + 1, 1))))
+
+    @classmethod
+    def build(cls, names: Iterable[str], n: int = 3, source: Optional[Dict[str, int]] = None) -> "NameSearchIndex":
+        """Index ``names``, one per table row; rows sharing a folded name share an entry."""
+        folded = np.array([fold_name(name) for name in names], dtype=str)
+        unique, inverse = np.unique(folded, return_inverse=True)
+        row_order = np.argsort(inverse, kind='stable')
+        row_offsets = np.concatenate(([0], np.cumsum(np.bincount(inverse, minlength=len(unique)))))
+
+        gram_ids: Dict[str, int] = {}
+        pair_grams: List[int] = []
+        pair_names: List[int] = []
+        gram_counts = np.zeros(len(unique), dtype=np.int32)
+        for name_id, name in enumerate(unique.tolist()):
+            grams = cls._ngrams(name, n)
+            gram_counts[name_id] = len(grams)
+            for gram in grams:
+                pair_grams.append(gram_ids.setdefault(gram, len(gram_ids)))
+            pair_names.extend([name_id] * len(grams))
+
+        pair_grams_arr = np.asarray(pair_grams, dtype=np.int64)
+        order = np.argsort(pair_grams_arr, kind='stable')
+        postings = np.asarray(pair_names, dtype=np.int32)[order]
+        gram_offsets = np.concatenate(([0], np.cumsum(np.bincount(pair_grams_arr, minlength=len(gram_ids)))))
+        grams = np.array(list(gram_ids), dtype=str)
+        return cls(unique, row_offsets, row_order, grams, gram_offsets, postings, gram_counts, n=n, source=source)
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+    def save(self, path: str) -> None:
+        """Write the index to ``path`` (an ``.npz`` archive), replacing it atomically."""
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp_path = f"{path}.tmp.npz"
+        source = [self.source['size'], self.source['mtime_ns']] if self.source else []
+        np.savez(tmp_path, version=self.FORMAT_VERSION, n=self.n, source=np.asarray(source, dtype=np.int64),
+                 names=self.names,
+                 row_offsets=self.row_offsets, rows=self.rows, grams=self.grams,
+                 gram_offsets=self.gram_offsets, postings=self.postings, gram_counts=self.gram_counts)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "NameSearchIndex":
+        """Read an index written by :meth:`save`; raises ``ValueError`` for another format version."""
+        with np.load(path, allow_pickle=False) as data:
+            if int(data['version']) != cls.FORMAT_VERSION:
+                raise ValueError(f"Unsupported name index version {int(data['version'])} in {path}")
+            source = data['source'].tolist()
+            return cls(data['names'], data['row_offsets'], data['rows'], data['grams'],
+                       data['gram_offsets'], data['postings'], data['gram_counts'], n=int(data['n']),
+                       source={'size': source[0], 'mtime_ns': source[1]} if source else None)
+
+    # ------------------------------------------------------------------
+    # Search
+    # ------------------------------------------------------------------
+    def _rows_for(self, name_id: int) -> np.ndarray:
+        return self.rows[self.row_offsets[name_id]:self.row_offsets[name_id + 1]]
+
+    def search(self, query: str, k: int = 5, candidates: int = 64) -> List[NameMatch]:
+        """Return up to ``k`` matches for ``query``, best first."""
+        query = fold_name(query)
+        query_grams = self._ngrams(query, self.n)
+        ids = [self._gram_ids[gram] for gram in query_grams if gram in self._gram_ids]
+        if not ids:
+            return []
+        hits = np.concatenate([self.postings[self.gram_offsets[i]:self.gram_offsets[i + 1]] for i in ids])
+        name_ids, shared = np.unique(hits, return_counts=True)
+        dice = 2 * shared / (len(query_grams) + self.gram_counts[name_ids])
+        if len(name_ids) > candidates:
+            keep = np.argpartition(-dice, candidates)[:candidates]
+            name_ids = name_ids[keep]
+
+        matcher = SequenceMatcher()
+        matcher.set_seq2(query)
+        scored = []
+        for name_id in name_ids.tolist():
+            name = str(self.names[name_id])
+            matcher.set_seq1(name)
+            scored.append((matcher.ratio(), name, name_id))
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        return [NameMatch(name, score, self._rows_for(name_id)) for score, name, name_id in scored[:k]]
+
+    def search_many(self, queries: Sequence[str], k: int = 5, candidates: int = 64) -> List[List[NameMatch]]:
+        """Run :meth:`search` for each query; repeated queries are scored once."""
+        results: Dict[str, List[NameMatch]] = {}
+        for query in queries:
+            if query not in results:
+                results[query] = self.search(query, k=k, candidates=candidates)
+        return [results[query] for query in queries]
@@ -1,16 +1,41 @@
 import pybaseball as pyb
 import pandas as pd
 from baseball_data_lab.config import StatsConfig
+from baseball_data_lab.apis import metrics
 from baseball_data_lab.apis.mlb_stats_client import MlbStatsClient
+from baseball_data_lab.apis.statcast_fetcher import StatcastFetcher
+from baseball_data_lab.apis.statcast_store import StatcastStore
+from baseball_data_lab.config import STATCAST_CHECKPOINT_DIR, STATCAST_STORE_DIR
+from typing import Optional
 import os
 
 
 class PybaseballClient: 
-    
+
+    # Windowed Statcast downloads used by the statcast fetchers below; kept in memory.
+    statcast: StatcastFetcher = StatcastFetcher(checkpoint_dir=None)
+
+    # Same, but checkpointed under STATCAST_CHECKPOINT_DIR so the ``save_statcast_*``
+    # downloads can resume after an interruption.
+    resumable_statcast: StatcastFetcher = StatcastFetcher(checkpoint_dir=STATCAST_CHECKPOINT_DIR)
+
+    # League-wide daily store; when set, per-player statcast fetches are sliced from it.
+    statcast_store: Optional[StatcastStore] = None
+
+    @staticmethod
+    def enable_statcast_store(store_dir: str = STATCAST_STORE_DIR) -> StatcastStore:
+        """Serve ``fetch_statcast_*_data`` from league-wide daily ingestion under ``store_dir``."""
+        PybaseballClient.statcast_store = StatcastStore(store_dir)
+        return PybaseballClient.statcast_store
+
+    @staticmethod
+    def disable_statcast_store() -> None:
+        PybaseballClient.statcast_store = None
 
     @staticmethod
     def fetch_fangraphs_batter_data(player_name: str, team_fangraphs_id: str, start_year: int, end_year: int):
-        data = pyb.batting_stats(start_season=start_year, end_season=end_year, team=team_fangraphs_id, qual=1)
+        with metrics.track("pybaseball.batting_stats"):
+            data = pyb.batting_stats(start_season=start_year, end_season=end_year, team=team_fangraphs_id, qual=1)
         try:
             player_stats = data[data['Name'] == player_name]
             
@@ -25,7 +50,8 @@ class PybaseballClient:
 
     @staticmethod
     def fetch_fangraphs_pitcher_data(player_name: str, team_fangraphs_id: str, start_year: int, end_year: int):
-        data = pyb.pitching_stats(start_season=start_year, end_season=end_year, team=team_fangraphs_id, qual=1)
+        with metrics.track("pybaseball.pitching_stats"):
+            data = pyb.pitching_stats(start_season=start_year, end_season=end_year, team=team_fangraphs_id, qual=1)
         try:
             player_stats = data[data['Name'] == player_name]
             
@@ -40,47 +66,62 @@ class PybaseballClient:
         
     @staticmethod
     def fetch_team_batting_stats(team_abbrev: str, start_year: int, end_year: int):
-        data = pyb.team_batting(start_year, end_year, 'al')   
+        with metrics.track("pybaseball.team_batting"):
+            data = pyb.team_batting(start_year, end_year, 'al')
         stats = data.query(f"Team == '{team_abbrev}'")     
         return stats
     
     @staticmethod
     def fetch_team_pitching_stats(team_abbrev: str, start_year: int, end_year: int):
-        data = pyb.team_pitching(start_year, end_year, 'al')   
+        with metrics.track("pybaseball.team_pitching"):
+            data = pyb.team_pitching(start_year, end_year, 'al')
         stats = data.query(f"Team == '{team_abbrev}'")     
         return stats
     
     @staticmethod
     def fetch_team_schedule_and_record(team_abbrev: str, season: int):
         print(f"Fetching schedule and record for {team_abbrev} in season {season}...")
-        data = pyb.schedule_and_record(season, team_abbrev)
+        with metrics.track("pybaseball.schedule_and_record"):
+            data = pyb.schedule_and_record(season, team_abbrev)
         return data
     
     @staticmethod
     def lookup_player(last_name: str, first_name: str, fuzzy: bool = False):
-        return pyb.playerid_lookup(last_name, first_name, fuzzy=fuzzy)
+        with metrics.track("pybaseball.playerid_lookup"):
+            return pyb.playerid_lookup(last_name, first_name, fuzzy=fuzzy)
     
     @staticmethod
     def lookup_player_by_id(player_id: int):
         #print(f"Looking up player by ID: {player_id}")
-        return pyb.playerid_reverse_lookup([player_id], key_type='mlbam')
+        with metrics.track("pybaseball.playerid_reverse_lookup"):
+            return pyb.playerid_reverse_lookup([player_id], key_type='mlbam')
 
     @staticmethod
     def fetch_statcast_batter_data(player_id: int, start_date: str, end_date: str):
-        statcast_data = pyb.statcast_batter(start_date, end_date, player_id)  
-        return statcast_data
+        store = PybaseballClient.statcast_store
+        if store is not None:
+            return store.load_batter(player_id, start_date, end_date)
+        return PybaseballClient.statcast.fetch_batter(player_id, start_date, end_date)
     
 
     @staticmethod
-    def save_statcast_batter_data(player_id: int, year: int, file_path: str = None):
+    def save_statcast_batter_data(player_id: int, year: int, file_path: str = None, incremental: bool = False):
+        """Save the batter's regular-season Statcast data to ``file_path`` as CSV.
+
+        With ``incremental=True`` an existing file is only topped up with the
+        days since its last stored pitch.
+        """
         season_info = MlbStatsClient.get_season_info(year)
         start_date = season_info['regularSeasonStartDate']
         end_date = season_info['regularSeasonEndDate']
-        statcast_data = pyb.statcast_batter(start_date, end_date, player_id)
+        if file_path is None:
+            file_path = f'output/statcast_data_{player_id}_{start_date}_{end_date}.csv'
+        if incremental:
+            added = PybaseballClient.resumable_statcast.sync_batter(player_id, start_date, end_date, file_path)
+            print(f"Added {added} new pitches to {file_path}")
+            return
+        statcast_data = PybaseballClient.resumable_statcast.fetch_batter(player_id, start_date, end_date)
         if statcast_data is not None and not statcast_data.empty:
-            if file_path is None:
-                file_path = f'output/statcast_data_{player_id}_{start_date}_{end_date}.csv'
-
             # Ensure that the directory exists
             os.makedirs(os.path.dirname(file_path), exist_ok=True)
 
@@ -91,15 +132,23 @@ class PybaseballClient:
         return
     
     @staticmethod
-    def save_statcast_pitcher_data(player_id: int, year: int, file_path: str = None):
+    def save_statcast_pitcher_data(player_id: int, year: int, file_path: str = None, incremental: bool = False):
+        """Save the pitcher's regular-season Statcast data to ``file_path`` as CSV.
+
+        With ``incremental=True`` an existing file is only topped up with the
+        days since its last stored pitch.
+        """
         season_info = MlbStatsClient.get_season_info(year)
         start_date = season_info['regularSeasonStartDate']
         end_date = season_info['regularSeasonEndDate']
-        statcast_data = pyb.statcast_pitcher(start_date, end_date, player_id)
+        if file_path is None:
+            file_path = f'output/statcast_data_{player_id}_{start_date}_{end_date}.csv'
+        if incremental:
+            added = PybaseballClient.resumable_statcast.sync_pitcher(player_id, start_date, end_date, file_path)
+            print(f"Added {added} new pitches to {file_path}")
+            return
+        statcast_data = PybaseballClient.resumable_statcast.fetch_pitcher(player_id, start_date, end_date)
         if statcast_data is not None and not statcast_data.empty:
-            if file_path is None:
-                file_path = f'output/statcast_data_{player_id}_{start_date}_{end_date}.csv'
-
             # Ensure that the directory exists
             os.makedirs(os.path.dirname(file_path), exist_ok=True)
 
@@ -111,9 +160,10 @@ class PybaseballClient:
     
     @staticmethod
     def fetch_statcast_pitcher_data(pitcher_id: int, start_date: str, end_date: str):
-        df_pyb = pyb.statcast_pitcher(start_date, end_date, pitcher_id)
-        df_pyb.head()
-        return df_pyb
+        store = PybaseballClient.statcast_store
+        if store is not None:
+            return store.load_pitcher(pitcher_id, start_date, end_date)
+        return PybaseballClient.statcast.fetch_pitcher(pitcher_id, start_date, end_date)
 
 
     # Split types returned:
@@ -157,7 +207,8 @@ class PybaseballClient:
         print(f"Fetching batting splits data for player {player_bbref} in season {season}...")
         
         try:
-            data = pyb.get_splits(playerid=player_bbref, year=season)
+            with metrics.track("pybaseball.get_splits"):
+                data = pyb.get_splits(playerid=player_bbref, year=season)
         except IndexError as e:
             print("IndexError caught in get_splits:", e)
             # Return an empty DataFrame if no splits data is available
@@ -182,7 +233,8 @@ class PybaseballClient:
 
         try:
             # Fetching the splits data for pitching
-            data = pyb.get_splits(playerid=player_bbref, year=season, pitching_splits=True)
+            with metrics.track("pybaseball.get_splits"):
+                data = pyb.get_splits(playerid=player_bbref, year=season, pitching_splits=True)
             df1, df2 = data
 
             # Check if the requested season is present in df1
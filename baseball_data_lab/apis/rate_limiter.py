@@ -0,0 +1,163 @@
+"""Per-host token-bucket rate limiting with adaptive backoff on 429/5xx responses."""
+
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+
+# Requests per second each host is allowed at most. The limiter starts at this
+# ceiling, backs off when the host pushes back and climbs back towards it.
+DEFAULT_RATE = 10.0
+HOST_RATES: Dict[str, float] = {
+    "statsapi.mlb.com": 25.0,
+    "www.fangraphs.com": 8.0,
+    "img.mlbstatic.com": 25.0,
+    "baseballsavant.mlb.com": 5.0,
+}
+
+THROTTLE_STATUSES = frozenset([429, 500, 502, 503, 504])
+
+BACKOFF_FACTOR = 0.5        # multiply the rate by this on a throttled response
+RECOVERY_STEP = 0.05        # requests/second added back per successful response
+MIN_RATE_FRACTION = 0.05    # never drop below this share of the ceiling
+DECREASE_COOLDOWN = 1.0     # seconds between successive rate cuts
+
+
+def parse_retry_after(value: Optional[str], now: Optional[float] = None) -> Optional[float]:
+    """Return the delay in seconds requested by a ``Retry-After`` header, if any."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+    return max(when - (time.time() if now is None else now), 0.0)
+
+
+class TokenBucket:
+    """Token bucket for one host with an AIMD-adjusted refill rate.
+
+    ``reserve`` hands out tokens in order and returns how long the caller must
+    wait, letting the balance go negative instead of making callers poll; this
+    keeps requests evenly spaced at the current rate. Throttled responses halve
+    the rate (at most once per ``decrease_cooldown``) and a ``Retry-After``
+    pauses the host entirely; every success adds ``recovery_step`` back until
+    the ceiling is reached again.
+    """
+
+    def __init__(self,
+                 max_rate: float,
+                 burst: Optional[float] = None,
+                 backoff_factor: float = BACKOFF_FACTOR,
+                 recovery_step: float = RECOVERY_STEP,
+                 min_rate: Optional[float] = None,
+                 decrease_cooldown: float = DECREASE_COOLDOWN,
+                 clock=time.monotonic):
+        self.max_rate = float(max_rate)
+        self.rate = self.max_rate
+        self.burst = float(burst) if burst is not None else max(1.0, self.max_rate)
+        self.backoff_factor = backoff_factor
+        self.recovery_step = recovery_step
+        self.min_rate = min_rate if min_rate is not None else self.max_rate * MIN_RATE_FRACTION
+        self.decrease_cooldown = decrease_cooldown
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._tokens = self.burst
+        self._updated = clock()
+        self._blocked_until = 0.0
+        self._last_decrease = float("-inf")
+        self._counters = {"requests": 0, "throttled": 0, "waited": 0.0}
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self) -> float:
+        """Take a token and return the number of seconds to wait before using it."""
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self._tokens -= 1.0
+            wait = 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+            wait = max(wait, self._blocked_until - now)
+            self._counters["requests"] += 1
+            self._counters["waited"] += wait
+            return wait
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    def on_success(self) -> None:
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.recovery_step)
+
+    def on_throttle(self, retry_after: Optional[float] = None) -> None:
+        with self._lock:
+            now = self._clock()
+            self._counters["throttled"] += 1
+            if retry_after:
+                self._blocked_until = max(self._blocked_until, now + retry_after)
+            if now - self._last_decrease >= self.decrease_cooldown:
+                self._refill(now)
+                self.rate = max(self.min_rate, self.rate * self.backoff_factor)
+                self._last_decrease = now
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            return dict(self._counters, rate=round(self.rate, 3), max_rate=self.max_rate)
+
+
+class RateLimiter:
+    """Hands out one :class:`TokenBucket` per host, shared by every client."""
+
+    def __init__(self,
+                 host_rates: Optional[Dict[str, float]] = None,
+                 default_rate: float = DEFAULT_RATE,
+                 **bucket_options):
+        self.host_rates = dict(HOST_RATES if host_rates is None else host_rates)
+        self.default_rate = default_rate
+        self.bucket_options = bucket_options
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def bucket_for(self, url: str) -> TokenBucket:
+        host = urlsplit(url).netloc.lower()
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.get(host)
+                if bucket is None:
+                    rate = self.host_rates.get(host, self.default_rate)
+                    bucket = TokenBucket(rate, **self.bucket_options)
+                    self._buckets[host] = bucket
+        return bucket
+
+    def acquire(self, url: str) -> None:
+        self.bucket_for(url).acquire()
+
+    def reserve(self, url: str) -> float:
+        return self.bucket_for(url).reserve()
+
+    def record(self, url: str, status: Optional[int], retry_after: Optional[str] = None) -> None:
+        """Feed a response status (``None`` for a connection error) back into the host's rate."""
+        bucket = self.bucket_for(url)
+        if status is None or status in THROTTLE_STATUSES:
+            bucket.on_throttle(parse_retry_after(retry_after))
+        else:
+            bucket.on_success()
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Return per-host request, throttle and wait counters and the current rate."""
+        with self._lock:
+            buckets = dict(self._buckets)
+        return {host: bucket.stats() for host, bucket in sorted(buckets.items())}
@@ -0,0 +1,176 @@
+"""Columnar on-disk snapshot of the Chadwick register that is memory-mapped on load."""
+
+import json
+import os
+import shutil
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+class RegisterSnapshot:
+    """A directory of ``.npy`` column files opened with ``mmap_mode='r'``.
+
+    Numeric columns are stored as typed arrays. String columns are stored
+    as integer codes into a small array of distinct values, so loading
+    them builds an object column of shared (interned) strings with one
+    ``take``; columns written as ``categorical`` load as a ``Categorical``
+    over the mapped codes instead, so no per-row strings are built at all.
+    Extra arrays, such as the accent-folded names and the sorted
+    ID indexes the search client needs, are stored alongside the table.
+    Mapped arrays are read-only and their pages are shared by every
+    process that opens the same snapshot.
+    """
+
+    FORMAT_VERSION = 2
+    META_FILE = 'meta.json'
+
+    def __init__(self, path: str, meta: Dict, arrays: Dict[str, np.ndarray]):
+        self.path = path
+        self.meta = meta
+        self.arrays = arrays
+
+    @staticmethod
+    def source_stamp(source_file: Optional[str]) -> Optional[Dict[str, int]]:
+        """Return ``source_file``'s size and modification time, or ``None`` if it does not exist."""
+        if not source_file or not os.path.exists(source_file):
+            return None
+        stat = os.stat(source_file)
+        return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+    @classmethod
+    def write(cls, path: str, table: pd.DataFrame, source_file: Optional[str] = None,
+              extra_strings: Optional[Dict[str, Sequence]] = None,
+              extra_arrays: Optional[Dict[str, np.ndarray]] = None,
+              categorical: Sequence[str] = ()) -> None:
+        """Write ``table`` (plus named extra string and numeric arrays) to the directory ``path``.
+
+        String columns named in ``categorical`` are loaded back by ``table`` as categoricals.
+
+        The snapshot is written to a temporary directory first and moved into
+        place, so readers never see a partial snapshot.
+        """
+        tmp_path = f"{path}.tmp-{os.getpid()}"
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        os.makedirs(tmp_path)
+
+        columns = []
+        for name in table.columns:
+            values = table[name]
+            if pd.api.types.is_numeric_dtype(values):
+                np.save(os.path.join(tmp_path, f"{name}.npy"), values.to_numpy())
+                columns.append({'name': name, 'kind': 'numeric'})
+            else:
+                cls._save_strings(tmp_path, name, values)
+                columns.append({'name': name, 'kind': 'category' if name in categorical else 'string'})
+        for name, values in (extra_strings or {}).items():
+            cls._save_strings(tmp_path, name, pd.Series(values))
+        for name, values in (extra_arrays or {}).items():
+            np.save(os.path.join(tmp_path, f"{name}.npy"), np.asarray(values))
+
+        meta = {
+            'version': cls.FORMAT_VERSION,
+            'rows': len(table),
+            'columns': columns,
+            'extra_strings': list(extra_strings or {}),
+            'extra_arrays': list(extra_arrays or {}),
+            'source': cls.source_stamp(source_file),
+        }
+        with open(os.path.join(tmp_path, cls.META_FILE), 'w') as f:
+            json.dump(meta, f)
+
+        shutil.rmtree(path, ignore_errors=True)
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def _save_strings(path: str, name: str, values: pd.Series) -> None:
+        codes, uniques = pd.factorize(values)
+        # Store the codes in the dtype pandas picks for them so ``Categorical`` can keep the mapped array.
+        codes = pd.Categorical.from_codes(codes, categories=pd.Index(uniques)).codes
+        np.save(os.path.join(path, f"{name}.codes.npy"), codes)
+        np.save(os.path.join(path, f"{name}.values.npy"), np.asarray(uniques, dtype=str))
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+    @classmethod
+    def open(cls, path: str, source_file: Optional[str] = None) -> Optional["RegisterSnapshot"]:
+        """Map the snapshot at ``path``.
+
+        Returns ``None`` if there is none, it has another format version, or
+        ``source_file`` exists and changed since the snapshot was written.
+        """
+        meta_file = os.path.join(path, cls.META_FILE)
+        if not os.path.exists(meta_file):
+            return None
+        try:
+            with open(meta_file) as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if meta.get('version') != cls.FORMAT_VERSION:
+            return None
+        stamp = cls.source_stamp(source_file)
+        if stamp is not None and stamp != meta.get('source'):
+            return None
+
+        names = [column['name'] for column in meta['columns'] if column['kind'] == 'numeric']
+        names += meta['extra_arrays']
+        string_names = [column['name'] for column in meta['columns'] if column['kind'] != 'numeric']
+        string_names += meta['extra_strings']
+        try:
+            arrays = {name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode='r') for name in names}
+            for name in string_names:
+                arrays[f"{name}.codes"] = np.load(os.path.join(path, f"{name}.codes.npy"), mmap_mode='r')
+                arrays[f"{name}.values"] = np.load(os.path.join(path, f"{name}.values.npy"), mmap_mode='r')
+        except (OSError, ValueError):
+            return None
+        return cls(path, meta, arrays)
+
+    def strings(self, name: str) -> np.ndarray:
+        """Return string column ``name`` as an object array; missing values are NaN."""
+        values = np.append(np.asarray(self.arrays[f"{name}.values"]).astype(object), np.nan)
+        # Code -1 (missing) picks the trailing NaN.
+        return values.take(self.arrays[f"{name}.codes"])
+
+    def categorical(self, name: str) -> pd.Categorical:
+        """Return string column ``name`` as a ``Categorical`` whose codes are the mapped array."""
+        categories = pd.Index(np.asarray(self.arrays[f"{name}.values"]).astype(object))
+        return pd.Categorical.from_codes(np.asarray(self.arrays[f"{name}.codes"]), categories=categories)
+
+    def array(self, name: str) -> np.ndarray:
+        """Return the mapped numeric array ``name``."""
+        return self.arrays[name]
+
+    def has(self, name: str) -> bool:
+        return name in self.arrays or f"{name}.codes" in self.arrays
+
+    def table(self) -> pd.DataFrame:
+        """Return the register table stored in the snapshot.
+
+        Numeric columns and the codes of categorical columns stay views of
+        the mapped (read-only) arrays; with ``copy=False`` pandas does not
+        consolidate them into private copies.
+        """
+        data = {}
+        for column in self.meta['columns']:
+            name, kind = column['name'], column['kind']
+            if kind == 'numeric':
+                # np.asarray drops the memmap subclass but keeps the view onto the mapped pages.
+                data[name] = np.asarray(self.array(name))
+            elif kind == 'category':
+                data[name] = self.categorical(name)
+            else:
+                data[name] = self.strings(name)
+        return pd.DataFrame(data, columns=[column['name'] for column in self.meta['columns']], copy=False)
+
+    def id_index(self, key_type: str) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """Return the stored ``(sorted IDs, row positions)`` index for ``key_type``, if any."""
+        keys, rows = f"index_{key_type}_keys", f"index_{key_type}_rows"
+        if keys not in self.arrays:
+            return None
+        return self.arrays[keys], self.arrays[rows]
@@ -0,0 +1,331 @@
+"""On-disk cache for decoded JSON responses from the MLB Stats API and Fangraphs."""
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from datetime import date
+from typing import Any, Callable, Dict, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import pandas as pd
+
+from baseball_data_lab.apis import metrics
+from baseball_data_lab.apis.metrics import endpoint_of, response_size
+from baseball_data_lab.config import HTTP_CACHE_DIR
+
+
+MINUTE = 60
+HOUR = 60 * MINUTE
+DAY = 24 * HOUR
+
+# ``None`` marks an entry that never expires.
+NEVER_EXPIRES = None
+
+# How long current-season data stays fresh, by endpoint class.
+LIVE_TTL = 5 * MINUTE        # rosters, standings, schedules, in-progress games
+CURRENT_TTL = HOUR           # people, stats and other current-season payloads
+STATIC_TTL = DAY             # team metadata and other slow-moving resources
+
+_SEASON_IN_HYDRATE = re.compile(r"season=(\d{4})")
+
+TTLPolicy = Callable[[str, Any], Optional[float]]
+
+
+def _url_season(path: str, params: Dict[str, str]) -> Optional[int]:
+    """Return the season a StatsAPI URL refers to, if one can be determined."""
+    for key in ("season", "seasonId"):
+        value = params.get(key)
+        if value and value.isdigit():
+            return int(value)
+    match = _SEASON_IN_HYDRATE.search(params.get("hydrate", "")) or re.search(r"/seasons/(\d{4})", path)
+    if match:
+        return int(match.group(1))
+    return None
+
+
+def _game_is_final(payload: Any) -> bool:
+    """Return True when a game payload describes a completed game."""
+    if not isinstance(payload, dict):
+        return False
+    # Baseball Savant game feed
+    if payload.get("game_status_code") in ("F", "O"):
+        return True
+    # StatsAPI boxscores only list the time of game ("T") once it has ended.
+    for item in payload.get("info") or []:
+        if isinstance(item, dict) and item.get("label") == "T":
+            return True
+    return False
+
+
+def default_ttl(url: str, payload: Any = None) -> Optional[float]:
+    """Return the time-to-live in seconds for ``url``.
+
+    Completed seasons and finished games never expire. Current-season rosters,
+    standings and schedules expire after a few minutes, while other
+    current-season payloads are kept for an hour.
+    """
+    parts = urlsplit(url)
+    path = parts.path
+    params = dict(parse_qsl(parts.query, keep_blank_values=True))
+    today = date.today()
+
+    if "/game/" in path or "game_pk" in params:
+        return NEVER_EXPIRES if _game_is_final(payload) else LIVE_TTL
+
+    if path.endswith("/schedule"):
+        end_date = params.get("endDate") or params.get("date")
+        if end_date and end_date < today.isoformat():
+            return NEVER_EXPIRES
+        return LIVE_TTL
+
+    season = _url_season(path, params)
+    if season is not None and season < today.year:
+        return NEVER_EXPIRES
+
+    hydrate = params.get("hydrate", "")
+    if "/roster" in path or path.endswith("/standings") or "Schedule" in hydrate or "standings" in hydrate:
+        return LIVE_TTL
+
+    if re.search(r"/teams/\d+$", path):
+        return STATIC_TTL
+
+    return CURRENT_TTL
+
+
+class ResponseCache:
+    """Stores decoded JSON payloads on disk, keyed by a normalized URL.
+
+    Each entry is written to its own file together with the time it was stored
+    and its time-to-live, which is chosen by ``ttl_policy`` from the URL and the
+    payload. Hit and miss counters are kept so callers can see how many
+    requests the cache saved.
+
+    Entries also keep the response's ``ETag``/``Last-Modified`` validators.
+    Once an entry expires, ``conditional_headers`` turns them into
+    ``If-None-Match``/``If-Modified-Since`` headers, and a ``304`` answer is
+    handled by ``revalidate``, which renews the entry without a download.
+    The bytes those 304s saved are tallied per endpoint.
+    DataFrames can be stored as a parquet file beside the entry
+    (``set_frame``/``get_frame``).
+    """
+
+    def __init__(self, cache_dir: str = HTTP_CACHE_DIR, ttl_policy: TTLPolicy = default_ttl):
+        self.cache_dir = cache_dir
+        self.ttl_policy = ttl_policy
+        self._lock = threading.Lock()
+        self._counters = {"hits": 0, "misses": 0, "expired": 0, "writes": 0, "revalidated": 0}
+        self._bytes_saved: Dict[str, int] = {}
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    # ------------------------------------------------------------------
+    # Keys
+    # ------------------------------------------------------------------
+    @staticmethod
+    def normalize_url(url: str) -> str:
+        """Return ``url`` with a lower-case host, no fragment and sorted query parameters."""
+        parts = urlsplit(url)
+        path = re.sub(r"/{2,}", "/", parts.path)
+        query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)), safe="[],()")
+        return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, query, ""))
+
+    def _path_for(self, url: str, suffix: str = ".json") -> str:
+        key = hashlib.sha256(self.normalize_url(url).encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, key[:2], f"{key}{suffix}")
+
+    # ------------------------------------------------------------------
+    # Lookup / store
+    # ------------------------------------------------------------------
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._counters[name] += 1
+
+    def _read_entry(self, url: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._path_for(url), "r", encoding="utf-8") as fp:
+                return json.load(fp)
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _is_fresh(entry: Dict[str, Any], now: float) -> bool:
+        ttl = entry.get("ttl")
+        return ttl is None or now - entry.get("stored_at", 0) < ttl
+
+    def _fresh_entry(self, url: str) -> Optional[Dict[str, Any]]:
+        """Return ``url``'s entry if it is fresh, counting a miss otherwise; hits are counted by the caller."""
+        entry = self._read_entry(url)
+        if entry is None:
+            self._count("misses")
+            return None
+        if not self._is_fresh(entry, time.time()):
+            self._count("expired")
+            self._count("misses")
+            return None
+        return entry
+
+    def _count_hit(self, url: str) -> None:
+        self._count("hits")
+        metrics.count_cache_hit(url)
+
+    def get(self, url: str) -> Optional[Any]:
+        """Return the cached payload for ``url``, or ``None`` if missing or expired."""
+        entry = self._fresh_entry(url)
+        if entry is None:
+            return None
+        self._count_hit(url)
+        return entry["payload"]
+
+    def set(self, url: str, payload: Any, ttl: Optional[float] = ..., response: Any = None,
+            size: Optional[int] = None) -> None:
+        """Store ``payload`` for ``url``.
+
+        ``ttl`` overrides the policy; pass ``None`` for an entry that never expires.
+        When ``response`` is given its validators and size are kept for
+        conditional requests; ``size`` overrides the size, e.g. for a body
+        that was streamed without a ``Content-Length``.
+        """
+        if ttl is ...:
+            ttl = self.ttl_policy(url, payload)
+        headers = getattr(response, "headers", None) or {}
+        entry = {
+            "url": self.normalize_url(url),
+            "stored_at": time.time(),
+            "ttl": ttl,
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified"),
+            "size": size if size is not None else (response_size(response) if response is not None else 0),
+            "payload": payload,
+        }
+        self._write_entry(url, entry)
+        self._count("writes")
+
+    def _write_entry(self, url: str, entry: Dict[str, Any]) -> None:
+        path = self._path_for(url)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write to a temporary file first so concurrent readers never see a partial entry.
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as fp:
+            json.dump(entry, fp)
+        os.replace(tmp_path, path)
+
+    # ------------------------------------------------------------------
+    # Conditional requests
+    # ------------------------------------------------------------------
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """Return ``If-None-Match``/``If-Modified-Since`` headers for ``url``'s stored entry."""
+        entry = self._read_entry(url)
+        headers = {}
+        if entry is not None:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def revalidate(self, url: str) -> Optional[Any]:
+        """Renew ``url``'s entry after a ``304 Not Modified`` and return its payload.
+
+        Returns ``None`` if the entry has gone missing in the meantime.
+        """
+        entry = self._read_entry(url)
+        if entry is None:
+            return None
+        entry["stored_at"] = time.time()
+        entry["ttl"] = self.ttl_policy(url, entry.get("payload"))
+        self._write_entry(url, entry)
+        endpoint = endpoint_of(url)
+        with self._lock:
+            self._counters["revalidated"] += 1
+            self._bytes_saved[endpoint] = self._bytes_saved.get(endpoint, 0) + entry.get("size", 0)
+        metrics.count_revalidated(url)
+        return entry["payload"]
+
+    def fetch_json(self, url: str, request: Callable[[Dict[str, str]], Any]) -> Any:
+        """Return ``url``'s payload from the cache, revalidating or downloading it as needed.
+
+        ``request(headers)`` performs the GET with the given conditional
+        headers. Only ``200`` responses are stored.
+        """
+        cached = self.get(url)
+        if cached is not None:
+            return cached
+        resp = request(self.conditional_headers(url))
+        status = getattr(resp, "status_code", 200)
+        if status == 304:
+            payload = self.revalidate(url)
+            if payload is not None:
+                return payload
+            resp = request({})
+            status = getattr(resp, "status_code", 200)
+        payload = resp.json()
+        if status == 200:
+            self.set(url, payload, response=resp)
+        return payload
+
+    def bytes_saved(self) -> Dict[str, int]:
+        """Return the response bytes not downloaded thanks to 304s, by endpoint."""
+        with self._lock:
+            return dict(self._bytes_saved)
+
+    # ------------------------------------------------------------------
+    # DataFrames
+    # ------------------------------------------------------------------
+    def get_frame(self, url: str, revalidated: bool = False) -> Optional[pd.DataFrame]:
+        """Return the DataFrame stored for ``url``, or ``None`` if missing or expired.
+
+        ``revalidated=True`` skips the freshness check, for use right after a 304.
+        """
+        if not revalidated and self._fresh_entry(url) is None:
+            return None
+        try:
+            df = pd.read_parquet(self._path_for(url, ".parquet"))
+        except (OSError, ValueError):
+            if not revalidated:
+                self._count("misses")
+            return None
+        if not revalidated:
+            self._count_hit(url)
+        return df
+
+    def set_frame(self, url: str, df: pd.DataFrame, ttl: Optional[float] = ..., response: Any = None,
+                  size: Optional[int] = None) -> None:
+        """Store ``df`` for ``url`` as parquet, with an entry holding its validators."""
+        path = self._path_for(url, ".parquet")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        df.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, path)
+        self.set(url, {"frame": True}, ttl=ttl, response=response, size=size)
+
+    def invalidate(self, url: str) -> None:
+        """Remove the entry for ``url`` if present."""
+        for suffix in (".json", ".parquet"):
+            try:
+                os.remove(self._path_for(url, suffix))
+            except FileNotFoundError:
+                pass
+
+    def clear(self) -> None:
+        """Remove every cached entry and reset the counters."""
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if name.endswith((".json", ".parquet")):
+                    os.remove(os.path.join(root, name))
+        self.reset_stats()
+
+    # ------------------------------------------------------------------
+    # Counters
+    # ------------------------------------------------------------------
+    def stats(self) -> Dict[str, int]:
+        """Return a snapshot of the hit, miss, expired and write counters."""
+        with self._lock:
+            return dict(self._counters)
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            for name in self._counters:
+                self._counters[name] = 0
+            self._bytes_saved.clear()
@@ -0,0 +1,93 @@
+"""Coalesce concurrent identical fetches into a single call."""
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException = None
+
+
+class SingleFlight:
+    """Runs at most one call per key at a time across threads.
+
+    The first caller for a key runs ``fn``; callers arriving while it is in
+    flight wait and receive the same result (or exception) instead of issuing
+    their own request. Results are shared objects, so callers must treat them
+    as read-only. Nothing is kept once the call finishes; caching is left to
+    :class:`ResponseCache`.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._counters = {"calls": 0, "merged": 0}
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self._counters["merged"] += 1
+                leader = False
+            else:
+                call = _Call()
+                self._calls[key] = call
+                self._counters["calls"] += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+        return call.result
+
+    def stats(self) -> Dict[str, int]:
+        """Return how many calls ran and how many duplicate callers were merged into them."""
+        with self._lock:
+            return dict(self._counters)
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            for name in self._counters:
+                self._counters[name] = 0
+
+
+class AsyncSingleFlight:
+    """Event-loop counterpart of :class:`SingleFlight` for coroutines."""
+
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+        self._counters = {"calls": 0, "merged": 0}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        future = self._calls.get(key)
+        if future is not None:
+            self._counters["merged"] += 1
+            # shield() so one cancelled waiter does not cancel the shared call
+            return await asyncio.shield(future)
+
+        self._counters["calls"] += 1
+        future = asyncio.ensure_future(fn())
+        self._calls[key] = future
+        future.add_done_callback(lambda _: self._calls.pop(key, None))
+        return await asyncio.shield(future)
+
+    def stats(self) -> Dict[str, int]:
+        return dict(self._counters)
@@ -0,0 +1,282 @@
+"""Local HTTP server that answers StatsAPI and Fangraphs requests from a cassette."""
+
+import json
+import random
+import socketserver
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+from baseball_data_lab.apis import http_session
+from baseball_data_lab.apis.cassette import Cassette
+
+
+STAND_IN_HOSTS = ("statsapi.mlb.com", "www.fangraphs.com", "baseballsavant.mlb.com", "img.mlbstatic.com")
+
+
+class StandInServer:
+    """Serves recorded responses over HTTP for offline benchmarks and load tests.
+
+    Requests arrive as ``/{host}/{path}?{query}`` (see
+    ``http_session.set_host_override``) and are answered with the exact
+    recording when there is one. Two common query shapes are also assembled
+    from recordings that do not match exactly:
+
+    * ``people?personIds=a,b,c`` is built from any recorded people responses
+      with the same hydrate, so batched lookups work against single-player
+      recordings and vice versa;
+    * Fangraphs ``leaders`` queries with ``players=`` are sliced from a
+      recorded full leaderboard with the same filters.
+
+    ``latency``/``jitter`` delay every response and ``error_rate`` answers a
+    share of requests with 503 to exercise retries and rate limiting.
+
+    With ``http2=True`` the server speaks cleartext HTTP/2 (prior knowledge,
+    needs the ``h2`` package) and answers the streams of a connection
+    concurrently, for benchmarking the HTTP/2 transport. Accepted
+    connections are counted in ``stats()["connections"]`` either way.
+    """
+
+    def __init__(self,
+                 cassette: Cassette,
+                 host: str = "127.0.0.1",
+                 port: int = 0,
+                 latency: float = 0.0,
+                 jitter: float = 0.0,
+                 error_rate: float = 0.0,
+                 seed: Optional[int] = None,
+                 http2: bool = False):
+        self.cassette = cassette
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._counters = {"requests": 0, "exact": 0, "assembled": 0, "missing": 0, "injected_errors": 0,
+                          "connections": 0}
+        self._people, self._leaders = self._build_indexes()
+        if http2:
+            self._httpd = socketserver.ThreadingTCPServer((host, port), self._h2_handler_class())
+        else:
+            self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StandInServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "StandInServer":
+        self.start()
+        http_session.set_host_override(STAND_IN_HOSTS, self.base_url)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        http_session.set_host_override(STAND_IN_HOSTS, None)
+        self.stop()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._counters)
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._counters[name] += 1
+
+    # ------------------------------------------------------------------
+    # Indexes over the recordings
+    # ------------------------------------------------------------------
+    def _build_indexes(self) -> Tuple[Dict[Tuple[str, int], Any], Dict[Tuple, List[Dict[str, Any]]]]:
+        people: Dict[Tuple[str, int], Any] = {}
+        leaders: Dict[Tuple, List[Dict[str, Any]]] = {}
+        for url, _ in self.cassette.items():
+            parts = urlsplit(url)
+            params = dict(parse_qsl(parts.query, keep_blank_values=True))
+            if parts.path.endswith("/people") and "personIds" in params:
+                payload = self.cassette.lookup_json(url) or {}
+                for person in payload.get("people") or []:
+                    people[(params.get("hydrate", ""), person["id"])] = person
+            elif parts.path.endswith("/leaders/major-league/data") and params.get("players", "0") in ("", "0"):
+                payload = self.cassette.lookup_json(url) or {}
+                leaders[self._leaders_key(params)] = payload.get("data") or []
+        return people, leaders
+
+    @staticmethod
+    def _leaders_key(params: Dict[str, str]) -> Tuple:
+        return tuple(params.get(k, "") for k in ("stats", "season", "month", "team"))
+
+    def _assemble(self, path: str, params: Dict[str, str]) -> Optional[Any]:
+        if path.endswith("/people") and "personIds" in params:
+            hydrate = params.get("hydrate", "")
+            found = [
+                self._people.get((hydrate, int(pid)))
+                for pid in params["personIds"].split(",") if pid.strip().isdigit()
+            ]
+            if found and all(found):
+                return {"people": found}
+        elif path.endswith("/leaders/major-league/data") and params.get("players", "0") not in ("", "0"):
+            rows = self._leaders.get(self._leaders_key(params))
+            if rows is not None:
+                wanted = {pid for pid in params["players"].split(",")}
+                return {"data": [row for row in rows if str(row.get("playerid")) in wanted]}
+        return None
+
+    # ------------------------------------------------------------------
+    # Request handling
+    # ------------------------------------------------------------------
+    def respond(self, raw_path: str) -> Tuple[int, Dict[str, str], bytes]:
+        """Return ``(status, headers, body)`` for a ``/{host}/{path}?{query}`` request."""
+        self._count("requests")
+        delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+        if delay > 0:
+            time.sleep(delay)
+        if self.error_rate and self._random.random() < self.error_rate:
+            self._count("injected_errors")
+            return 503, {"Retry-After": "0"}, b""
+
+        host, _, rest = raw_path.lstrip("/").partition("/")
+        url = f"https://{host}/{rest}"
+        entry = self.cassette.lookup(url)
+        if entry is not None:
+            self._count("exact")
+            return entry["status"], entry["headers"], entry["body"]
+
+        parts = urlsplit(url)
+        payload = self._assemble(parts.path, dict(parse_qsl(parts.query, keep_blank_values=True)))
+        if payload is not None:
+            self._count("assembled")
+            return 200, {"Content-Type": "application/json"}, json.dumps(payload).encode("utf-8")
+
+        self._count("missing")
+        return 404, {"Content-Type": "application/json"}, json.dumps({"message": f"not recorded: {url}"}).encode("utf-8")
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                server._count("connections")
+                super().setup()
+
+            def do_GET(self):
+                status, headers, body = server.respond(self.path)
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def _h2_handler_class(self):
+        server = self
+
+        class Handler(socketserver.BaseRequestHandler):
+            def handle(self):
+                server._count("connections")
+                _H2Connection(server, self.request).serve()
+
+        return Handler
+
+
+class _H2Connection:
+    """Serves one cleartext HTTP/2 connection, answering its streams on worker threads."""
+
+    def __init__(self, server: StandInServer, sock):
+        import h2.config
+        import h2.connection
+
+        self.server = server
+        self.sock = sock
+        self.conn = h2.connection.H2Connection(
+            config=h2.config.H2Configuration(client_side=False, header_encoding="utf-8"))
+        self.lock = threading.Lock()
+        self.pending: Dict[int, bytes] = {}
+
+    def _flush(self) -> None:
+        data = self.conn.data_to_send()
+        if data:
+            self.sock.sendall(data)
+
+    def _send_body(self, stream_id: int) -> None:
+        body = self.pending.pop(stream_id, b"")
+        while body:
+            size = min(self.conn.local_flow_control_window(stream_id), self.conn.max_outbound_frame_size, len(body))
+            if size <= 0:
+                # Wait for a WINDOW_UPDATE; the rest is sent from ``serve``.
+                self.pending[stream_id] = body
+                return
+            self.conn.send_data(stream_id, body[:size])
+            body = body[size:]
+        self.conn.end_stream(stream_id)
+
+    def _answer(self, stream_id: int, path: str) -> None:
+        import h2.exceptions
+
+        status, headers, body = self.server.respond(path)
+        response_headers = [(":status", str(status)), ("content-length", str(len(body)))]
+        response_headers += [(name.lower(), value) for name, value in headers.items()
+                             if name.lower() not in ("content-length", "connection", "transfer-encoding")]
+        with self.lock:
+            try:
+                self.conn.send_headers(stream_id, response_headers)
+                self.pending[stream_id] = body
+                self._send_body(stream_id)
+                self._flush()
+            except (h2.exceptions.ProtocolError, OSError):
+                # The client reset the stream or hung up; nobody is waiting for the answer.
+                self.pending.pop(stream_id, None)
+
+    def serve(self) -> None:
+        import h2.events
+
+        with self.lock:
+            self.conn.initiate_connection()
+            self._flush()
+        while True:
+            try:
+                data = self.sock.recv(65536)
+            except OSError:
+                return
+            if not data:
+                return
+            with self.lock:
+                events = self.conn.receive_data(data)
+                for event in events:
+                    if isinstance(event, h2.events.RequestReceived):
+                        path = dict(event.headers).get(":path", "/")
+                        threading.Thread(target=self._answer, args=(event.stream_id, path), daemon=True).start()
+                    elif isinstance(event, h2.events.WindowUpdated):
+                        streams = list(self.pending) if event.stream_id == 0 else [event.stream_id]
+                        for stream_id in streams:
+                            if stream_id in self.pending:
+                                self._send_body(stream_id)
+                    elif isinstance(event, h2.events.StreamReset):
+                        self.pending.pop(event.stream_id, None)
+                    elif isinstance(event, h2.events.ConnectionTerminated):
+                        self._flush()
+                        return
+                self._flush()
@@ -0,0 +1,282 @@
+"""Windowed, resumable Statcast downloads for a single player."""
+
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from typing import Callable, Dict, List, Optional, Tuple
+
+import pandas as pd
+import pybaseball as pyb
+
+from baseball_data_lab.apis import http_session, metrics
+from baseball_data_lab.apis.rate_limiter import RateLimiter
+from baseball_data_lab.config import SAVANT_BASE_URL, STATCAST_CHECKPOINT_DIR
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WINDOW_DAYS = 7
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_RETRIES = 2
+DEFAULT_BACKOFF = 1.0
+# Savant can return nothing (or only some games) for recent days until it has
+# processed them, so results this many days old or newer are not trusted as final.
+DEFAULT_SETTLE_DAYS = 3
+
+# Savant's natural order: newest pitch first.
+SORT_COLUMNS = ["game_date", "game_pk", "at_bat_number", "pitch_number"]
+
+# Identifies one pitch; used to drop rows already stored when syncing.
+KEY_COLUMNS = ["game_pk", "at_bat_number", "pitch_number"]
+
+Window = Tuple[str, str]
+
+
+class StatcastFetchError(Exception):
+    """Raised when some windows could not be fetched; the rest are checkpointed."""
+
+    def __init__(self, missing: List[Window]):
+        super().__init__(f"{len(missing)} Statcast window(s) failed: {missing}")
+        self.missing = missing
+
+
+def date_windows(start_date: str, end_date: str, days: int = DEFAULT_WINDOW_DAYS) -> List[Window]:
+    """Split the inclusive ``start_date``..``end_date`` range into ``days``-long windows."""
+    start = date.fromisoformat(start_date)
+    end = date.fromisoformat(end_date)
+    windows = []
+    while start <= end:
+        stop = min(start + timedelta(days=days - 1), end)
+        windows.append((start.isoformat(), stop.isoformat()))
+        start = stop + timedelta(days=1)
+    return windows
+
+
+def is_settled(day: str, settle_days: int = DEFAULT_SETTLE_DAYS) -> bool:
+    """Return whether ``day`` is at least ``settle_days`` days before today."""
+    return date.fromisoformat(day) <= date.today() - timedelta(days=settle_days)
+
+
+class StatcastFetcher:
+    """Fetches a player's Statcast pitches in date windows, in parallel.
+
+    Each window is one ``pybaseball.statcast_pitcher``/``statcast_batter``
+    call, paced by the Savant bucket of the shared :class:`RateLimiter` and
+    retried with backoff. Finished windows are written to
+    ``checkpoint_dir/{role}_{player_id}/`` as parquet (or an ``.empty``
+    marker), so a rerun after an interruption only fetches the windows that
+    are missing. A window is only checkpointed once it ended ``settle_days``
+    ago, since games may still be in progress and Savant often has nothing
+    (or only some games) for the last few days. Pass ``checkpoint_dir=None``
+    to keep everything in memory.
+    """
+
+    FETCHERS: Dict[str, Callable[[str, str, int], pd.DataFrame]] = {
+        "pitcher": lambda start, end, player_id: pyb.statcast_pitcher(start, end, player_id),
+        "batter": lambda start, end, player_id: pyb.statcast_batter(start, end, player_id),
+        # Every pitch in the range; the player ID is ignored (see ``StatcastStore``).
+        "league": lambda start, end, player_id: pyb.statcast(start, end, verbose=False, parallel=False),
+    }
+
+    # Endpoint names used for the client metrics.
+    ENDPOINTS: Dict[str, str] = {
+        "pitcher": "pybaseball.statcast_pitcher",
+        "batter": "pybaseball.statcast_batter",
+        "league": "pybaseball.statcast",
+    }
+
+    def __init__(self,
+                 checkpoint_dir: Optional[str] = STATCAST_CHECKPOINT_DIR,
+                 window_days: int = DEFAULT_WINDOW_DAYS,
+                 max_workers: int = DEFAULT_MAX_WORKERS,
+                 retries: int = DEFAULT_RETRIES,
+                 backoff: float = DEFAULT_BACKOFF,
+                 rate_limiter: Optional[RateLimiter] = None,
+                 settle_days: int = DEFAULT_SETTLE_DAYS):
+        self.checkpoint_dir = checkpoint_dir
+        self.window_days = window_days
+        self.max_workers = max_workers
+        self.retries = retries
+        self.backoff = backoff
+        self.settle_days = settle_days
+        self._rate_limiter = rate_limiter
+        self._lock = threading.Lock()
+        self._counters = {"windows_fetched": 0, "windows_resumed": 0, "windows_failed": 0, "retries": 0}
+
+    @property
+    def rate_limiter(self) -> Optional[RateLimiter]:
+        return self._rate_limiter if self._rate_limiter is not None else http_session.get_rate_limiter()
+
+    # ------------------------------------------------------------------
+    # Checkpoints
+    # ------------------------------------------------------------------
+    def _player_dir(self, role: str, player_id: int) -> Optional[str]:
+        if self.checkpoint_dir is None:
+            return None
+        return os.path.join(self.checkpoint_dir, f"{role}_{player_id}")
+
+    @staticmethod
+    def _window_path(player_dir: str, window: Window, suffix: str) -> str:
+        return os.path.join(player_dir, f"{window[0]}_{window[1]}{suffix}")
+
+    def _load_checkpoint(self, player_dir: Optional[str], window: Window) -> Optional[pd.DataFrame]:
+        if player_dir is None:
+            return None
+        if os.path.exists(self._window_path(player_dir, window, ".empty")):
+            return pd.DataFrame()
+        path = self._window_path(player_dir, window, ".parquet")
+        if os.path.exists(path):
+            return pd.read_parquet(path)
+        return None
+
+    def _save_checkpoint(self, player_dir: Optional[str], window: Window, df: pd.DataFrame) -> None:
+        if player_dir is None or not is_settled(window[1], self.settle_days):
+            return
+        os.makedirs(player_dir, exist_ok=True)
+        if df is None or df.empty:
+            open(self._window_path(player_dir, window, ".empty"), "w").close()
+            return
+        path = self._window_path(player_dir, window, ".parquet")
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        df.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, path)
+
+    # ------------------------------------------------------------------
+    # Fetching
+    # ------------------------------------------------------------------
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._counters[name] += 1
+
+    def _fetch_window(self, role: str, player_id: int, window: Window) -> pd.DataFrame:
+        fetch = self.FETCHERS[role]
+        limiter = self.rate_limiter
+        attempt = 0
+        while True:
+            if limiter is not None:
+                limiter.acquire(SAVANT_BASE_URL)
+            try:
+                with metrics.track(self.ENDPOINTS[role]):
+                    df = fetch(window[0], window[1], player_id)
+            except Exception:
+                if limiter is not None:
+                    limiter.record(SAVANT_BASE_URL, None)
+                if attempt >= self.retries:
+                    raise
+                self._count("retries")
+                time.sleep(self.backoff * (2 ** attempt))
+                attempt += 1
+                continue
+            if limiter is not None:
+                limiter.record(SAVANT_BASE_URL, 200)
+            return df if df is not None else pd.DataFrame()
+
+    def _window_frame(self, role: str, player_id: int, player_dir: Optional[str], window: Window):
+        cached = self._load_checkpoint(player_dir, window)
+        if cached is not None:
+            self._count("windows_resumed")
+            return cached
+        try:
+            df = self._fetch_window(role, player_id, window)
+        except Exception as exc:
+            logger.warning("Statcast %s %s window %s-%s failed: %s", role, player_id, window[0], window[1], exc)
+            self._count("windows_failed")
+            return None
+        self._save_checkpoint(player_dir, window, df)
+        self._count("windows_fetched")
+        return df
+
+    def fetch(self, role: str, player_id: int, start_date: str, end_date: str) -> pd.DataFrame:
+        """Return every pitch for ``player_id`` as ``role`` ('pitcher' or 'batter') in the date range.
+
+        Raises :class:`StatcastFetchError` listing the windows that still
+        failed after retries; rerunning fetches only those.
+        """
+        if role not in self.FETCHERS:
+            raise ValueError(f"Invalid role. Must be one of {sorted(self.FETCHERS)}")
+        windows = date_windows(start_date, end_date, self.window_days)
+        player_dir = self._player_dir(role, player_id)
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(windows)))) as executor:
+            frames = list(executor.map(lambda w: self._window_frame(role, player_id, player_dir, w), windows))
+
+        missing = [w for w, df in zip(windows, frames) if df is None]
+        if missing:
+            raise StatcastFetchError(missing)
+        return self.merge(frames)
+
+    def fetch_pitcher(self, player_id: int, start_date: str, end_date: str) -> pd.DataFrame:
+        return self.fetch("pitcher", player_id, start_date, end_date)
+
+    def fetch_batter(self, player_id: int, start_date: str, end_date: str) -> pd.DataFrame:
+        return self.fetch("batter", player_id, start_date, end_date)
+
+    @staticmethod
+    def merge(frames: List[pd.DataFrame]) -> pd.DataFrame:
+        """Concatenate window frames into one frame in Savant's newest-first order."""
+        frames = [df for df in frames if df is not None and not df.empty]
+        if not frames:
+            return pd.DataFrame()
+        df = pd.concat(frames, ignore_index=True, sort=False)
+        sort_columns = [c for c in SORT_COLUMNS if c in df.columns]
+        if sort_columns:
+            df = df.sort_values(sort_columns, ascending=False, kind="stable", ignore_index=True)
+        return df
+
+    @staticmethod
+    def last_stored_date(file_path: str) -> Optional[str]:
+        """Return the latest ``game_date`` in a saved Statcast CSV, or ``None``."""
+        if not os.path.exists(file_path):
+            return None
+        try:
+            dates = pd.read_csv(file_path, usecols=["game_date"])["game_date"]
+        except (ValueError, pd.errors.EmptyDataError):
+            return None
+        if dates.empty:
+            return None
+        return pd.to_datetime(dates).max().date().isoformat()
+
+    def sync(self, role: str, player_id: int, start_date: str, end_date: str, file_path: str) -> int:
+        """Bring the CSV at ``file_path`` up to date and return the number of pitches added.
+
+        Only dates from the last stored ``game_date`` onward are fetched (that
+        day is fetched again in case it was stored mid-game), and never past
+        today. New pitches are merged into the stored ones, dropping
+        duplicates by game, at-bat and pitch number.
+        """
+        last = self.last_stored_date(file_path)
+        if last is not None:
+            start_date = max(start_date, last)
+        end_date = min(end_date, date.today().isoformat())
+        if start_date > end_date:
+            return 0
+        new = self.fetch(role, player_id, start_date, end_date)
+        if new.empty:
+            return 0
+
+        stored = pd.read_csv(file_path) if last is not None else pd.DataFrame()
+        if "game_date" in stored.columns:
+            stored["game_date"] = pd.to_datetime(stored["game_date"])
+        merged = pd.concat([stored, new], ignore_index=True, sort=False)
+        keys = [c for c in KEY_COLUMNS if c in merged.columns]
+        if len(keys) == len(KEY_COLUMNS):
+            merged = merged.drop_duplicates(subset=keys, keep="last")
+        merged = self.merge([merged])
+
+        os.makedirs(os.path.dirname(os.path.abspath(file_path)), exist_ok=True)
+        tmp_path = f"{file_path}.{os.getpid()}.tmp"
+        merged.to_csv(tmp_path, index=False)
+        os.replace(tmp_path, file_path)
+        return len(merged) - len(stored)
+
+    def sync_pitcher(self, player_id: int, start_date: str, end_date: str, file_path: str) -> int:
+        return self.sync("pitcher", player_id, start_date, end_date, file_path)
+
+    def sync_batter(self, player_id: int, start_date: str, end_date: str, file_path: str) -> int:
+        return self.sync("batter", player_id, start_date, end_date, file_path)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._counters)
@@ -0,0 +1,156 @@
+"""League-wide Statcast pitches stored by day and partitioned by pitcher and batter."""
+
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from baseball_data_lab.apis import http_session
+from baseball_data_lab.apis.statcast_fetcher import (
+    DEFAULT_SETTLE_DAYS, StatcastFetcher, StatcastFetchError, date_windows, is_settled,
+)
+from baseball_data_lab.config import STATCAST_STORE_DIR
+
+
+logger = logging.getLogger(__name__)
+
+ROLES = ("pitcher", "batter")
+DEFAULT_MAX_WORKERS = 4
+
+
+class StatcastStore:
+    """Ingests every pitch for a day in one query and serves per-player slices.
+
+    Each ingested day is written once per pitcher and once per batter, as
+    ``store_dir/{role}/{player_id}/{date}.parquet``, and recorded in
+    ``store_dir/days/``, so building sheets for a whole roster costs one
+    league query per day instead of one query per player. Days are only
+    marked complete once they are ``settle_days`` old, because Savant's
+    results for the last few days can be empty or partial; newer days are
+    fetched again on every load.
+    """
+
+    def __init__(self,
+                 store_dir: str = STATCAST_STORE_DIR,
+                 fetcher: Optional[StatcastFetcher] = None,
+                 max_workers: int = DEFAULT_MAX_WORKERS,
+                 settle_days: int = DEFAULT_SETTLE_DAYS):
+        self.store_dir = store_dir
+        # League days are already one window each; no per-window checkpoints needed.
+        self.fetcher = fetcher or StatcastFetcher(checkpoint_dir=None, window_days=1)
+        self.max_workers = max_workers
+        self.settle_days = settle_days
+        self._lock = threading.Lock()
+        self._counters = {"days_ingested": 0, "pitches_ingested": 0, "player_reads": 0}
+
+    # ------------------------------------------------------------------
+    # Layout
+    # ------------------------------------------------------------------
+    def _day_marker(self, day: str) -> str:
+        return os.path.join(self.store_dir, "days", f"{day}.done")
+
+    def _partition_dir(self, role: str, player_id: int) -> str:
+        return os.path.join(self.store_dir, role, str(player_id))
+
+    def has_day(self, day: str) -> bool:
+        return os.path.exists(self._day_marker(day))
+
+    def missing_days(self, start_date: str, end_date: str) -> List[str]:
+        """Return the days in the range that still need a league query (never after today)."""
+        end_date = min(end_date, date.today().isoformat())
+        if start_date > end_date:
+            return []
+        return [day for day, _ in date_windows(start_date, end_date, 1) if not self.has_day(day)]
+
+    # ------------------------------------------------------------------
+    # Ingestion
+    # ------------------------------------------------------------------
+    def _write_day(self, day: str, df: pd.DataFrame) -> None:
+        for role in ROLES:
+            if df.empty or role not in df.columns:
+                continue
+            for player_id, rows in df.groupby(role, sort=False):
+                part_dir = self._partition_dir(role, int(player_id))
+                os.makedirs(part_dir, exist_ok=True)
+                path = os.path.join(part_dir, f"{day}.parquet")
+                tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+                rows.to_parquet(tmp_path, index=False)
+                os.replace(tmp_path, path)
+        if is_settled(day, self.settle_days):
+            os.makedirs(os.path.dirname(self._day_marker(day)), exist_ok=True)
+            open(self._day_marker(day), "w").close()
+
+    def ingest_day(self, day: str) -> int:
+        """Fetch every pitch thrown on ``day``, store it by pitcher and batter and return the count."""
+        df = self.fetcher.fetch("league", 0, day, day)
+        self._write_day(day, df)
+        with self._lock:
+            self._counters["days_ingested"] += 1
+            self._counters["pitches_ingested"] += len(df)
+        return len(df)
+
+    def ingest(self, start_date: str, end_date: str) -> Dict[str, int]:
+        """Ingest every day in the range not already stored; returns ``{day: pitches}``.
+
+        Days are fetched in parallel, and concurrent loads that need the same
+        day share one query. Raises :class:`StatcastFetchError` for the
+        days that failed after the others have been stored.
+        """
+        days = self.missing_days(start_date, end_date)
+        if not days:
+            return {}
+
+        def run(day: str) -> Optional[int]:
+            try:
+                return http_session.coalesce(("statcast_day", self.store_dir, day), lambda: self.ingest_day(day))
+            except Exception as exc:
+                logger.warning("Statcast league ingest for %s failed: %s", day, exc)
+                return None
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(days))) as executor:
+            counts = dict(zip(days, executor.map(run, days)))
+        failed = [(day, day) for day, count in counts.items() if count is None]
+        if failed:
+            raise StatcastFetchError(failed)
+        return counts
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+    def load(self, role: str, player_id: int, start_date: str, end_date: str, ingest: bool = True) -> pd.DataFrame:
+        """Return ``player_id``'s pitches as ``role`` in the range, newest first.
+
+        Unless ``ingest=False``, missing days are ingested league-wide first.
+        """
+        if role not in ROLES:
+            raise ValueError("Invalid role. Must be 'pitcher' or 'batter'")
+        if ingest:
+            self.ingest(start_date, end_date)
+        with self._lock:
+            self._counters["player_reads"] += 1
+
+        part_dir = self._partition_dir(role, player_id)
+        try:
+            names = sorted(os.listdir(part_dir))
+        except FileNotFoundError:
+            return pd.DataFrame()
+        frames = [
+            pd.read_parquet(os.path.join(part_dir, name))
+            for name in names
+            if name.endswith(".parquet") and start_date <= name[:-len(".parquet")] <= end_date
+        ]
+        return StatcastFetcher.merge(frames)
+
+    def load_pitcher(self, player_id: int, start_date: str, end_date: str) -> pd.DataFrame:
+        return self.load("pitcher", player_id, start_date, end_date)
+
+    def load_batter(self, player_id: int, start_date: str, end_date: str) -> pd.DataFrame:
+        return self.load("batter", player_id, start_date, end_date)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._counters)
@@ -1,27 +1,88 @@
+import copy
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
 import pandas as pd
 
+from baseball_data_lab.apis import metrics
 from baseball_data_lab.apis.web_client import WebClient
 from baseball_data_lab.apis.mlb_stats_client import MlbStatsClient
 from baseball_data_lab.apis.pybaseball_client import PybaseballClient
 from baseball_data_lab.apis.fangraphs_client import FangraphsClient
-from baseball_data_lab.apis.chadwick_register import ChadwickRegister, PlayerSearchClient
+from baseball_data_lab.apis.hydrate_planner import HydratePlanner
+from baseball_data_lab.apis.response_cache import CURRENT_TTL
+from baseball_data_lab.apis.chadwick_register import PlayerSearchClient, get_search_client
 from baseball_data_lab.utils import Utils
+from baseball_data_lab.config import HTTP_CACHE_DIR, IMAGE_CACHE_DIR, STATCAST_STORE_DIR
+from baseball_data_lab.constants import team_logo_urls
+
+
+class _ExpiringDict:
+    """A dict whose entries are dropped ``ttl`` seconds after they were stored (never if ``ttl`` is None)."""
+
+    def __init__(self, ttl: Optional[float]):
+        self.ttl = ttl
+        self._entries: Dict[Any, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if self.ttl is not None and time.monotonic() - entry[0] > self.ttl:
+                del self._entries[key]
+                return None
+            return entry[1]
+
+    def __contains__(self, key: Any) -> bool:
+        return self.get(key) is not None
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+
+    def update(self, values: Dict[Any, Any]) -> None:
+        now = time.monotonic()
+        with self._lock:
+            self._entries.update((key, (now, value)) for key, value in values.items())
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
 
 
 class UnifiedDataClient:
 
-    def __init__(self):
-        register = ChadwickRegister()
-        register.load(save=False)
-        self.search_client = PlayerSearchClient(register)
+    # Seconds prefetched people records and splits are served before being fetched
+    # again, as in the response cache, so ``currentTeam`` catches up with trades.
+    PLAYER_CACHE_TTL: Optional[float] = CURRENT_TTL
+
+    def __init__(self, search_client: Optional[PlayerSearchClient] = None):
+        # The Chadwick register is only loaded on the first player search or ID lookup.
+        self._search_client = search_client
+        # People records loaded in bulk by ``fetch_players_info``; served by ``fetch_player_info``.
+        self._player_info = _ExpiringDict(self.PLAYER_CACHE_TTL)
+        # Situational splits loaded by ``preload_players``, keyed by (player_id, season, group).
+        self._splits = _ExpiringDict(self.PLAYER_CACHE_TTL)
+
+    @property
+    def search_client(self) -> PlayerSearchClient:
+        """The register search client; the process-wide one unless another was passed in."""
+        if self._search_client is None:
+            self._search_client = get_search_client()
+        return self._search_client
+
+    @search_client.setter
+    def search_client(self, client: PlayerSearchClient) -> None:
+        self._search_client = client
 
     #############################
     # FangraphsClient wrappers
     #############################
-    def fetch_batting_stats(
-        self, mlbam_id: int, season: int, fangraphs_team_id: int = None
-    ) -> pd.DataFrame:
-        """Fetch batting stats for a player."""
+    def resolve_fangraphs_id(self, mlbam_id: int) -> int:
+        """Return the Fangraphs ID for an MLBAM ID, raising ``ValueError`` if unknown."""
         player_fangraphs_id = Utils.get_fangraphs_id(
             mlbam_id=mlbam_id, search_client=self.search_client
         )
@@ -34,6 +95,13 @@ class UnifiedDataClient:
                 player_fangraphs_id = 31781
             else:
                 raise ValueError(f"Invalid Fangraphs ID for player {mlbam_id}.")
+        return player_fangraphs_id
+
+    def fetch_batting_stats(
+        self, mlbam_id: int, season: int, fangraphs_team_id: int = None
+    ) -> pd.DataFrame:
+        """Fetch batting stats for a player."""
+        player_fangraphs_id = self.resolve_fangraphs_id(mlbam_id)
         return FangraphsClient.fetch_player_stats(
             player_fangraphs_id=player_fangraphs_id,
             season=season,
@@ -41,8 +109,8 @@ class UnifiedDataClient:
             stat_type="batting",
         )
 
-    def fetch_batting_leaderboards(self, season: int) -> pd.DataFrame:
-        return FangraphsClient.fetch_batting_leaderboards(season)
+    def fetch_batting_leaderboards(self, season: int, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        return FangraphsClient.fetch_batting_leaderboards(season, columns)
 
     def fetch_batting_leaderboards_as_json(self, season: int):
         return FangraphsClient.fetch_batting_leaderboards_as_json(season)
@@ -50,19 +118,7 @@ class UnifiedDataClient:
     def fetch_pitching_stats(
         self, mlbam_id: int, season: int, fangraphs_team_id: int = None
     ) -> pd.DataFrame:
-        player_fangraphs_id = Utils.get_fangraphs_id(
-            mlbam_id=mlbam_id, search_client=self.search_client
-        )
-        if player_fangraphs_id == -1:
-            if mlbam_id == 690916:
-                player_fangraphs_id = 30160
-            elif mlbam_id == 695578:
-                player_fangraphs_id = 29518
-            elif mlbam_id == 702616:
-                player_fangraphs_id = 31781
-            else:
-                raise ValueError(f"Invalid Fangraphs ID for player {mlbam_id}.")
-
+        player_fangraphs_id = self.resolve_fangraphs_id(mlbam_id)
         return FangraphsClient.fetch_player_stats(
             player_fangraphs_id=player_fangraphs_id,
             season=season,
@@ -70,25 +126,85 @@ class UnifiedDataClient:
             stat_type="pitching",
         )
 
-    def fetch_pitching_leaderboards(self, season: int) -> pd.DataFrame:
-        return FangraphsClient.fetch_pitching_leaderboards(season)
+    def fetch_pitching_leaderboards(self, season: int, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        return FangraphsClient.fetch_pitching_leaderboards(season, columns)
 
     def fetch_pitching_leaderboards_as_json(self, season: int):
         return FangraphsClient.fetch_pitching_leaderboards_as_json(season)
 
+    def load_fangraphs_snapshots(self, season: int, stat_types=("batting", "pitching"), *, team_split: bool = True):
+        """Load full-season leaderboards so per-player Fangraphs stats are served from memory.
+
+        ``team_split`` snapshots answer calls with a ``fangraphs_team_id``; the
+        season-total snapshots answer calls without one. Both are loaded by default.
+        """
+        splits = (True, False) if team_split else (False,)
+        return [
+            FangraphsClient.load_leaderboard_snapshot(season, stat_type, team_split=split)
+            for stat_type in stat_types
+            for split in splits
+        ]
+
+    def clear_fangraphs_snapshots(self) -> None:
+        FangraphsClient.clear_leaderboard_snapshots()
+
     def fetch_team_players(self, team_id: int, season: int):
         return FangraphsClient.fetch_team_players(team_id, season)
 
-    def fetch_leaderboards(self, season: int, stat_type: str) -> pd.DataFrame:
-        return FangraphsClient.fetch_leaderboards(season, stat_type)
+    def fetch_leaderboards(self, season: int, stat_type: str, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        return FangraphsClient.fetch_leaderboards(season, stat_type, columns)
 
     #############################
     # MlbStatsClient wrappers
     #############################
+    def enable_http_cache(self, cache_dir: str = HTTP_CACHE_DIR):
+        FangraphsClient.enable_cache(cache_dir)
+        return MlbStatsClient.enable_cache(cache_dir)
+
+    def http_cache_stats(self) -> Dict[str, Dict[str, int]]:
+        """Return the response cache counters keyed by client (``statsapi``, ``fangraphs``), skipping disabled caches."""
+        stats = {"statsapi": MlbStatsClient.cache_stats(), "fangraphs": FangraphsClient.cache_stats()}
+        return {name: counters for name, counters in stats.items() if counters}
+
+    def http_cache_bytes_saved(self) -> Dict[str, int]:
+        """Return bytes saved by 304 responses per endpoint, across the StatsAPI and Fangraphs caches."""
+        saved = MlbStatsClient.cache_bytes_saved()
+        if FangraphsClient.cache is not None:
+            saved.update(FangraphsClient.cache.bytes_saved())
+        return saved
+
+    def enable_hedging(self, **options) -> None:
+        """Hedge slow StatsAPI and Fangraphs requests; see ``HedgePolicy`` for ``options``."""
+        MlbStatsClient.enable_hedging(**options)
+        FangraphsClient.enable_hedging(**options)
+
+    def enable_circuit_breaker(self, **options) -> None:
+        """Fail fast while StatsAPI or Fangraphs is down; see ``CircuitBreaker`` for ``options``."""
+        MlbStatsClient.enable_circuit_breaker(**options)
+        FangraphsClient.enable_circuit_breaker(**options)
+
+    def metrics_snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Return per-endpoint request counts, errors, bytes, cache hits and latencies for every client."""
+        return metrics.snapshot()
+
+    def slowest_endpoints(self, count: int = 10, quantile: str = "p95"):
+        """Return the ``count`` endpoints with the highest ``quantile`` latency and their metrics."""
+        return metrics.get_metrics().slowest(count, quantile)
+
+    def write_metrics(self, path: str) -> None:
+        """Write the client metrics to ``path`` in the Prometheus text format."""
+        metrics.write_prometheus(path)
+
     def fetch_batting_splits(self, player_id: int, season: int) -> pd.DataFrame:
+        splits = self._splits.get((player_id, season, "hitting"))
+        if splits is not None:
+            return splits.copy()
         return MlbStatsClient.fetch_batter_stat_splits(player_id, season)
 
     def fetch_pitching_splits(self, player_id: int, season: int) -> pd.DataFrame:
+        splits = self._splits.get((player_id, season, "pitching"))
+        if splits is not None:
+            return splits.copy()
         return MlbStatsClient.fetch_pitcher_stat_splits(player_id, season)
 
     def fetch_active_roster(
@@ -109,13 +225,64 @@ class UnifiedDataClient:
         return MlbStatsClient.get_team_id(team_name)
 
     def fetch_player_info(self, player_id: int):
+        info = self._player_info.get(player_id)
+        if info is not None:
+            return copy.deepcopy(info)
         return MlbStatsClient.fetch_player_info(player_id)
 
+    def fetch_players_info(self, player_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """Fetch many players in batched requests and keep them for ``fetch_player_info``."""
+        missing = [pid for pid in player_ids if pid not in self._player_info]
+        if missing:
+            self.store_players_info(MlbStatsClient.fetch_players_info(missing))
+        return self.cached_players_info(player_ids)
+
+    def cached_players_info(self, player_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """Return copies of the kept people records for ``player_ids``, skipping players not loaded or expired."""
+        infos = {pid: self._player_info.get(pid) for pid in player_ids}
+        return {pid: copy.deepcopy(info) for pid, info in infos.items() if info is not None}
+
+    def store_players_info(self, infos: Dict[int, Dict[str, Any]]) -> None:
+        """Keep people records (by MLBAM ID) for ``fetch_player_info``, e.g. ones fetched asynchronously."""
+        self._player_info.update(infos)
+
+    def clear_player_cache(self) -> None:
+        """Drop the people records and splits kept by ``fetch_players_info`` and ``preload_players``."""
+        self._player_info.clear()
+        self._splits.clear()
+
+    def preload_players(self, player_ids: List[int], season: int) -> Dict[int, Dict[str, Any]]:
+        """Load people records and ``season``'s batting and pitching splits for many players at once.
+
+        Every player needs the same hydrate, so the whole batch costs one
+        ``people?personIds=...`` request per ``SEASON_STATS_BATCH_SIZE``
+        players instead of a people request plus a splits request each.
+        The results are kept for ``fetch_player_info`` and
+        ``fetch_*_splits``; returns the people records like ``fetch_players_info``.
+        """
+        planner = HydratePlanner()
+        planned = {}
+        for pid in dict.fromkeys(int(pid) for pid in player_ids):
+            if pid in self._player_info and (pid, season, "hitting") in self._splits:
+                continue
+            planned[pid] = (planner.person(pid),
+                            planner.splits(pid, season, "hitting"),
+                            planner.splits(pid, season, "pitching"))
+        planner.execute()
+        for pid, (person, hitting, pitching) in planned.items():
+            try:
+                self._player_info[pid] = person.result()
+            except LookupError:
+                continue
+            self._splits[(pid, season, "hitting")] = hitting.result()
+            self._splits[(pid, season, "pitching")] = pitching.result()
+        return self.cached_players_info(player_ids)
+
     # def fetch_player_stats(self, player_id: int, year: int):
     #     return MlbStatsClient.fetch_player_stats(player_id, year)
 
-    def fetch_player_stats_by_season(self, player_id: int, year: int):
-        return MlbStatsClient.fetch_player_stats_by_season(player_id, year)
+    def fetch_player_stats_by_season(self, player_id: int, year: int, *, group: Optional[str] = None):
+        return MlbStatsClient.fetch_player_stats_by_season(player_id, year, group=group)
 
     def fetch_player_team_stats(self, player_id: int, year: int):
         return MlbStatsClient.fetch_player_team_stats(player_id, year)
@@ -127,11 +294,23 @@ class UnifiedDataClient:
             player_id, year, group=group, ids_only=ids_only
         )
 
+    def fetch_players_stats_by_season(self, player_ids: List[int], year: int, group=("batting", "pitching")) -> pd.DataFrame:
+        return MlbStatsClient.fetch_players_stats_by_season(player_ids, year, group)
+
+    def get_players_teams_for_season(self, player_ids: List[int], year: int, group: str) -> Dict[int, List[int]]:
+        """Return ``{player_id: [team_id, ...]}`` for many players using bulk requests.
+
+        Every requested ID is present; players without stats for ``group`` map to ``[]``.
+        """
+        stats_df = MlbStatsClient.fetch_players_stats_by_season(player_ids, year, group)
+        teams = MlbStatsClient.teams_by_player(stats_df)
+        return {pid: teams.get(pid, []) for pid in player_ids}
+
     def fetch_player_team(self, player_id: int, year: int):
         return MlbStatsClient.fetch_player_team(player_id, year)
 
-    def get_player_mlbam_id(self, player_id: int):
-        return MlbStatsClient.get_player_mlbam_id(player_id)
+    def get_player_mlbam_id(self, player_name: str):
+        return MlbStatsClient.get_player_mlbam_id(player_name)
     
     def get_standings_data(self, season: int, league_ids: str) -> pd.DataFrame:
         return MlbStatsClient.get_standings_data(season, league_ids)
@@ -154,7 +333,7 @@ class UnifiedDataClient:
     def get_recent_schedule_for_team(self, team_id: int) -> pd.DataFrame:
         return MlbStatsClient.get_recent_schedule_for_team(team_id)
 
-    def get_game_boxscore_data(game_pk: int) -> pd.DataFrame:
+    def get_game_boxscore_data(self, game_pk: int) -> pd.DataFrame:
         return MlbStatsClient.get_game_boxscore_data(game_pk)
 
     def fetch_player_stats_career(self, player_id: int):
@@ -175,6 +354,15 @@ class UnifiedDataClient:
             player_name, team_fangraphs_id, start_year, end_year
         )
 
+    def enable_statcast_store(self, store_dir: str = STATCAST_STORE_DIR):
+        """Serve per-player Statcast data from one league-wide query per day."""
+        return PybaseballClient.enable_statcast_store(store_dir)
+
+    def ingest_statcast(self, start_date: str, end_date: str):
+        """Ingest every day in the range into the enabled Statcast store."""
+        store = PybaseballClient.statcast_store or PybaseballClient.enable_statcast_store()
+        return store.ingest(start_date, end_date)
+
     def fetch_statcast_batter_data(
         self, player_id: int, start_date: str, end_date: str
     ):
@@ -190,10 +378,10 @@ class UnifiedDataClient:
         )
 
     def save_statcast_batter_data(
-        self, player_id: int, year: int, file_path: str = None
+        self, player_id: int, year: int, file_path: str = None, incremental: bool = False
     ):
         return PybaseballClient.save_statcast_batter_data(
-            player_id, year, file_path
+            player_id, year, file_path, incremental=incremental
         )
 
     def fetch_fangraphs_pitcher_data(
@@ -225,10 +413,10 @@ class UnifiedDataClient:
         )
 
     def save_statcast_pitcher_data(
-        self, player_id: int, year: int, file_path: str = None
+        self, player_id: int, year: int, file_path: str = None, incremental: bool = False
     ):
         return PybaseballClient.save_statcast_pitcher_data(
-            player_id, year, file_path
+            player_id, year, file_path, incremental=incremental
         )
 
     def fetch_team_schedule_and_record(self, team_abbrev: str, season: int):
@@ -245,6 +433,26 @@ class UnifiedDataClient:
     def fetch_player_headshot(self, player_id: int):
         return WebClient.fetch_player_headshot(player_id)
 
+    def fetch_player_headshot_img(self, player_id: int):
+        return WebClient.fetch_player_headshot_img(player_id)
+
+    def enable_image_cache(self, cache_dir: str = IMAGE_CACHE_DIR):
+        return WebClient.enable_image_cache(cache_dir)
+
+    def image_cache_stats(self):
+        return WebClient.image_cache_stats()
+
+    def prefetch_images(self, player_ids: Iterable[int] = (), team_abbrevs: Iterable[str] = (),
+                        urls: Iterable[str] = ()) -> Dict[str, bool]:
+        """Download headshots and team logos in parallel ahead of rendering.
+
+        Returns ``{url: loaded}``; unknown team abbreviations are skipped.
+        """
+        wanted = [WebClient.player_headshot_url(pid) for pid in player_ids]
+        wanted += [team_logo_urls[abbrev] for abbrev in team_abbrevs if abbrev in team_logo_urls]
+        wanted += list(urls)
+        return WebClient.prefetch_images(wanted)
+
     #############################
     # Player search wrappers
     #############################
@@ -262,7 +470,29 @@ class UnifiedDataClient:
         return self.search_client.playerid_reverse_lookup(
             [player_id], key_type="mlbam"
         )
-    
-    
 
 
+# Shared by every object constructed without an explicit data_client.
+_default_client: Optional[UnifiedDataClient] = None
+_default_client_lock = threading.Lock()
+
+
+def get_default_client() -> UnifiedDataClient:
+    """Return the process-wide client, creating it on the first call.
+
+    Its prefetched people records and splits expire after
+    ``UnifiedDataClient.PLAYER_CACHE_TTL``; ``clear_player_cache`` drops them sooner.
+    """
+    global _default_client
+    with _default_client_lock:
+        if _default_client is None:
+            _default_client = UnifiedDataClient()
+        return _default_client
+
+
+def set_default_client(client: Optional[UnifiedDataClient]) -> Optional[UnifiedDataClient]:
+    """Replace the process-wide client and return the previous one."""
+    global _default_client
+    with _default_client_lock:
+        previous, _default_client = _default_client, client
+    return previous
@@ -1,30 +1,61 @@
-import requests
-from baseball_data_lab.config import MLB_STATIC_BASE_URL
+from typing import Dict, Iterable, Optional
+
+from baseball_data_lab.apis import http_session
+from baseball_data_lab.apis.image_cache import ImageCache
+from baseball_data_lab.config import MLB_STATIC_BASE_URL, IMAGE_CACHE_DIR
 from PIL import Image
-from io import BytesIO
 
 class WebClient:
-    
-    
+
+    # Headshots and logos; memory-only until ``enable_image_cache`` adds a disk tier.
+    images: ImageCache = ImageCache()
+
     @staticmethod
-    def fetch_player_headshot(player_id: int):
-        url = f'{MLB_STATIC_BASE_URL}'\
+    def enable_image_cache(cache_dir: str = IMAGE_CACHE_DIR, **kwargs) -> ImageCache:
+        """Keep downloaded images under ``cache_dir`` as well as in memory and return the cache."""
+        WebClient.images = ImageCache(cache_dir, **kwargs)
+        return WebClient.images
+
+    @staticmethod
+    def disable_image_cache() -> None:
+        """Drop the disk tier and start over with an empty memory-only cache."""
+        WebClient.images = ImageCache()
+
+    @staticmethod
+    def image_cache_stats() -> Dict[str, int]:
+        return WebClient.images.stats()
+
+    @staticmethod
+    def player_headshot_url(player_id: int) -> str:
+        return f'{MLB_STATIC_BASE_URL}'\
             f'upload/d_people:generic:headshot:67:current.png'\
             f'/w_640,q_auto:best/v1/people/{player_id}/headshot/silo/current.png'
-        response = requests.get(url)
-        return response.content
-    
+
+    @staticmethod
+    def fetch_player_headshot(player_id: int):
+        return WebClient.images.get_bytes(WebClient.player_headshot_url(player_id))
+
+    @staticmethod
+    def fetch_player_headshot_img(player_id: int) -> Image.Image:
+        return WebClient.images.get_image(WebClient.player_headshot_url(player_id))
+
+    @staticmethod
+    def fetch_logo_img(logo_url: str) -> Image.Image:
+        return WebClient.images.get_image(logo_url)
+
     @staticmethod
-    def fetch_logo_img(logo_url: str):
-        response = requests.get(logo_url)
-        return Image.open(BytesIO(response.content))
+    def prefetch_images(urls: Iterable[str], max_workers: Optional[int] = None) -> Dict[str, bool]:
+        """Warm the image cache for ``urls`` in parallel; returns ``{url: loaded}``."""
+        if max_workers is None:
+            return WebClient.images.prefetch(urls)
+        return WebClient.images.prefetch(urls, max_workers=max_workers)
     
     # https://img.mlbstatic.com/mlb-photos/image/upload/w_800,d_people:generic:action:hero:current.png,q_auto:best,f_auto/v1/people/681481/action/hero/current
     @staticmethod
     def fetch_player_action_shot(player_id: int, width: int = 800):
         url = f'{MLB_STATIC_BASE_URL}'\
             f'upload/w_{width},d_people:generic:action:hero:current.png,q_auto:best,f_auto/v1/people/{player_id}/action/hero/current'
-        response = requests.get(url)
+        response = http_session.http_get(url)
         return response.content
 
     """
@@ -37,7 +68,7 @@ class WebClient:
     @staticmethod
     def fetch_daily_schedule(date: str):
         url = f'https://baseballsavant.mlb.com/schedule?date={date}'
-        response = requests.get(url)
+        response = http_session.http_get(url)
         if response.status_code == 200:
             return response.json()
         else:
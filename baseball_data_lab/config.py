@@ -23,6 +23,34 @@ STATCAST_DATA_DIR = os.path.join(BASE_DIR, 'output')
 # Player sheets output directory
 PLAYER_SHEETS_DIR = os.path.join(BASE_DIR, 'output')
 
+# HTTP transport for the shared sessions: "http1" (pooled keep-alive connections)
+# or "http2" (requests to HTTP2_HOSTS multiplexed over a few connections; needs
+# httpx[http2], otherwise HTTP/1.1 is used).
+HTTP_TRANSPORT = os.environ.get("BASEBALL_DATA_LAB_HTTP_TRANSPORT", "http1")
+HTTP2_HOSTS = ("statsapi.mlb.com", "img.mlbstatic.com")
+
+# On-disk cache for API responses
+HTTP_CACHE_DIR = os.path.join(BASE_DIR, 'output', 'http_cache')
+
+# On-disk cache for headshots and team logos
+IMAGE_CACHE_DIR = os.path.join(BASE_DIR, 'output', 'image_cache')
+
+# Per-window Statcast downloads, kept so interrupted fetches can resume
+STATCAST_CHECKPOINT_DIR = os.path.join(BASE_DIR, 'output', 'statcast_checkpoints')
+
+# League-wide Statcast pitches by day, partitioned by pitcher and batter
+STATCAST_STORE_DIR = os.path.join(BASE_DIR, 'output', 'statcast_store')
+
+# Recorded API responses for offline replay and benchmarking
+CASSETTE_DIR = os.path.join(BASE_DIR, 'output', 'cassettes')
+
+# Per-user cache for files derived from the packaged data (the register snapshot and
+# name index), since the package directory is read-only once installed.
+USER_CACHE_DIR = os.environ.get(
+    "BASEBALL_DATA_LAB_CACHE_DIR",
+    os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+                 "baseball_data_lab"))
+
 FOOTER_TEXT = {
     1: {
         'text': 'Code by: Timothy Fisher',
@@ -1,7 +1,6 @@
 # player.py
 
 import logging
-from io import BytesIO
 from typing import Optional, Dict, Any
 
 from PIL import Image
@@ -10,7 +9,7 @@ import math
 from baseball_data_lab.team.team import Team
 from baseball_data_lab.player.player_bio import PlayerBio
 from baseball_data_lab.player.player_lookup import PlayerLookup
-from baseball_data_lab.apis.unified_data_client import UnifiedDataClient
+from baseball_data_lab.apis.unified_data_client import UnifiedDataClient, get_default_client
 from baseball_data_lab.player.player_info import PlayerInfo
 from baseball_data_lab.config import STATCAST_DATA_DIR
 
@@ -33,7 +32,7 @@ class Player:
         self.player_stats: Optional[Any] = None
         self.player_splits_stats: Optional[Any] = None
         self.statcast_data: Optional[Any] = None
-        self.data_client: UnifiedDataClient = data_client if data_client else UnifiedDataClient()
+        self.data_client: UnifiedDataClient = data_client if data_client else get_default_client()
         self.lookup_client: PlayerLookup = PlayerLookup(data_client=self.data_client)
 
     def load_stats_for_season(self, season: int) -> None:
@@ -62,9 +61,14 @@ class Player:
 
     @classmethod
     def create_from_mlb(cls, *, mlbam_id: Optional[int] = None, player_name: Optional[str] = None,
-                        data_client: Optional[UnifiedDataClient] = None) -> Optional["Player"]:
+                        data_client: Optional[UnifiedDataClient] = None,
+                        season: Optional[int] = None) -> Optional["Player"]:
         """
         Factory method to create a Player instance using MLBAM ID or player_name.
+
+        With ``season`` the people record and that season's splits are loaded
+        in one StatsAPI request, so a later ``load_stats_for_season(season)``
+        does not request the splits again.
         """
         player = Player(data_client=data_client)
         if player_name:
@@ -96,6 +100,8 @@ class Player:
 
         player.mlbam_id = mlbam_id #cls(mlbam_id, data_client=data_client)
         player.bbref_id = bbref_id
+        if season is not None:
+            player.data_client.preload_players([mlbam_id], season)
         mlb_player_info = player.data_client.fetch_player_info(mlbam_id)
         player.player_info.set_from_mlb_info(mlb_player_info)
         player.player_bio.set_from_mlb_info(mlb_player_info)
@@ -116,21 +122,20 @@ class Player:
         """
         Returns the headshot image of the player.
         """
-        headshot = self.data_client.fetch_player_headshot(self.mlbam_id)
-        img = Image.open(BytesIO(headshot))
-        return img
+        return self.data_client.fetch_player_headshot_img(self.mlbam_id)
     
-    def save_statcast_data(self, year: int = 2024) -> None:
+    def save_statcast_data(self, year: int = 2024, incremental: bool = False) -> None:
         """
         Saves the player's statcast data to a CSV file based on their position.
+        With ``incremental=True`` only days after the last stored pitch are fetched.
         """
         name_slug = self.player_bio.full_name.lower().replace(" ", "_")
         if self.player_info.primary_position == 'P':
             file_path = f'{STATCAST_DATA_DIR}/{year}/statcast_data/{self.current_team.abbrev}/pitching/statcast_data_{name_slug}_{year}.csv'
-            self.data_client.save_statcast_pitcher_data(self.mlbam_id, year, file_path)
+            self.data_client.save_statcast_pitcher_data(self.mlbam_id, year, file_path, incremental=incremental)
         else:
             file_path = f'{STATCAST_DATA_DIR}/{year}/statcast_data/{self.current_team.abbrev}/batting/statcast_data_{name_slug}_{year}.csv'
-            self.data_client.save_statcast_batter_data(self.mlbam_id, year, file_path)
+            self.data_client.save_statcast_batter_data(self.mlbam_id, year, file_path, incremental=incremental)
         logger.info(f"Statcast data saved to {file_path}")
     
     def to_json(self) -> Dict[str, Any]:
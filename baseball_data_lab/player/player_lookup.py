@@ -1,6 +1,6 @@
 import pandas as pd
 import logging
-from baseball_data_lab.apis.unified_data_client import UnifiedDataClient
+from baseball_data_lab.apis.unified_data_client import UnifiedDataClient, get_default_client
 from baseball_data_lab.special_name_mappings import SpecialNameMappings
 
 logger = logging.getLogger(__name__)
@@ -11,10 +11,10 @@ class PlayerLookup:
     def __init__(self, data_client: UnifiedDataClient = None):
         """
         Initialize the PlayerLookup instance.
-        Optionally pass a UnifiedDataClient instance; if not provided, one is created.
+        Optionally pass a UnifiedDataClient instance; if not provided, the shared default one is used.
         Also preprocesses special name mappings for quick lookup.
         """
-        self.data_client = data_client if data_client else UnifiedDataClient()
+        self.data_client = data_client if data_client else get_default_client()
         # Preprocess special mappings into dictionaries (keys in lowercase)
         self.first_name_map = {
             original.lower(): resolved
@@ -8,7 +8,7 @@ from baseball_data_lab.config import FOOTER_TEXT
 from baseball_data_lab.team.team import Team
 from baseball_data_lab.config  import BASE_DIR
 from baseball_data_lab.utils import Utils
-from baseball_data_lab.apis.unified_data_client import UnifiedDataClient
+from baseball_data_lab.apis.unified_data_client import UnifiedDataClient, get_default_client
 from baseball_data_lab.apis.local_data_client import LocalDataClient
 
 
@@ -18,7 +18,7 @@ class PlayerSheet:
 
     def __init__(self, data_client: Optional[UnifiedDataClient] = None):
 
-        self.data_client: UnifiedDataClient = data_client if data_client else UnifiedDataClient()
+        self.data_client: UnifiedDataClient = data_client if data_client else get_default_client()
 
         # Set the resolution of the figures to 300 DPI
         mpl.rcParams['figure.dpi'] = 300
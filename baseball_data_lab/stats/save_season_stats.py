@@ -1,4 +1,5 @@
 import os
+import asyncio
 import logging
 import time
 import json
@@ -10,6 +11,7 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 import pandas as pd
 from tqdm import tqdm
 
+from baseball_data_lab.apis import http_session
 from baseball_data_lab.apis.unified_data_client import UnifiedDataClient
 from baseball_data_lab.player.player import Player
 from baseball_data_lab.config import DATA_DIR
@@ -34,6 +36,13 @@ class SeasonStatsDownloader:
         max_workers: int = 10,
         retry_attempts: int = 2,
         chunk_size: int = 100,
+        cache_dir: Optional[str] = None,
+        use_async: bool = False,
+        max_in_flight: int = 200,
+        use_leaderboards: bool = True,
+        hedge_requests: bool = False,
+        circuit_breaker: bool = False,
+        metrics_file: Optional[str] = None,
     ):
         """
         :param season:       Year to fetch
@@ -43,10 +52,26 @@ class SeasonStatsDownloader:
         :param max_workers:  Number of threads
         :param retry_attempts: How many times to retry transient errors
         :param chunk_size:   How many players before flushing to disk
+        :param cache_dir:    Directory for the on-disk StatsAPI response cache (None disables it)
+        :param use_async:    Fetch on a single asyncio event loop instead of a thread pool
+        :param max_in_flight: Players processed concurrently in async mode
+        :param use_leaderboards: Serve per-player Fangraphs stats from full-season leaderboard snapshots
+        :param hedge_requests: Send a duplicate of unusually slow requests (thread pool mode only)
+        :param circuit_breaker: Fail requests fast while a host keeps erroring (thread pool mode only)
+        :param metrics_file: Write per-endpoint client metrics here in the Prometheus text format
         """
+        if use_async and (hedge_requests or circuit_breaker):
+            # The aiohttp client has its own retries and never goes through the hedging/breaker session.
+            raise ValueError("hedge_requests and circuit_breaker are not supported with use_async")
         self.season = season
         self.output_dir = output_dir
         self.client = UnifiedDataClient()
+        if cache_dir:
+            self.client.enable_http_cache(cache_dir)
+        if hedge_requests:
+            self.client.enable_hedging()
+        if circuit_breaker:
+            self.client.enable_circuit_breaker()
         self.league = league.upper() if league else None
 
         valid = {None, "pitchers", "batters"}
@@ -66,6 +91,10 @@ class SeasonStatsDownloader:
         self.max_workers    = max_workers
         self.retry_attempts = retry_attempts
         self.chunk_size     = chunk_size
+        self.use_async      = use_async
+        self.max_in_flight  = max_in_flight
+        self.use_leaderboards = use_leaderboards
+        self.metrics_file   = metrics_file
 
         self.statuses: Dict[str, List[str]] = {
             "success": [],
@@ -79,6 +108,9 @@ class SeasonStatsDownloader:
             "no_fangraphs_id": [],
         }
 
+        # Team IDs per player for the season, filled in bulk before fan-out.
+        self._player_teams: Dict[int, List[int]] = {}
+
         # Mapping from MLBAM team IDs to Fangraphs team IDs so we can
         # request team‑specific player stats.  This allows us to
         # differentiate players who played on multiple teams in a season
@@ -170,12 +202,17 @@ class SeasonStatsDownloader:
     def _build_player_tasks(
         teams_and_rosters: List[Tuple[int, pd.DataFrame]]
     ) -> List[int]:
-        """Return a de-duplicated list of player IDs from the supplied rosters."""
-        ids = {
-            row["mlbam_id"]
-            for _, roster_df in teams_and_rosters
-            for _, row in roster_df.iterrows()
-        }
+        """Return a de-duplicated list of player IDs from the supplied rosters.
+
+        Rosters may be DataFrames with an ``mlbam_id`` column or the list of
+        roster entries returned by the StatsAPI (``{"person": {"id": ...}}``).
+        """
+        ids = set()
+        for _, roster in teams_and_rosters:
+            if isinstance(roster, pd.DataFrame):
+                ids.update(roster["mlbam_id"].tolist())
+            else:
+                ids.update(entry["person"]["id"] for entry in roster)
         return list(ids)
 
     def _combine_and_clean_dfs(
@@ -196,8 +233,33 @@ class SeasonStatsDownloader:
 
         output_file = self._determine_output_file(output_file)
 
+        try:
+            if self.use_async:
+                all_stats = asyncio.run(self._download_async())
+            else:
+                all_stats = self._download_threaded()
+        finally:
+            if self.use_leaderboards:
+                self.client.clear_fangraphs_snapshots()
+
+        if all_stats:
+            self._write_all_to_disk(all_stats, output_file)
+
+        self._print_summary(output_file)
+        if self.metrics_file:
+            self.client.write_metrics(self.metrics_file)
+            logger.info(f"Metrics written to {self.metrics_file}")
+
+    def _download_threaded(self) -> List[pd.DataFrame]:
         teams_and_rosters = self._gather_rosters()
         tasks = self._build_player_tasks(teams_and_rosters)
+        players_info = self._prefetch_players_info(tasks)
+        self._prefetch_player_teams(players_info)
+        if self.use_leaderboards:
+            try:
+                self.client.load_fangraphs_snapshots(self.season, self._stat_types())
+            except Exception as e:  # pragma: no cover - network errors
+                logger.warning(f"Leaderboard snapshot load failed, falling back to per-player requests: {e}")
 
         all_stats: List[pd.DataFrame] = []
         with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
@@ -214,11 +276,210 @@ class SeasonStatsDownloader:
                 stats = future.result()
                 if stats is not None:
                     all_stats.append(stats)
+        return all_stats
 
-        if all_stats:
-            self._write_all_to_disk(all_stats, output_file)
+    async def _download_async(self) -> List[pd.DataFrame]:
+        """Fetch rosters and player stats concurrently on one event loop.
 
-        self._print_summary(output_file)
+        Per-host limits in the shared HTTP client bound the requests on the
+        wire; ``max_in_flight`` bounds how many players are in progress.
+        """
+        from baseball_data_lab.apis.async_unified_data_client import AsyncUnifiedDataClient
+
+        async with AsyncUnifiedDataClient(self.client) as aclient:
+            rosters = await asyncio.gather(
+                *(aclient.fetch_full_season_roster(team_id, self.season) for team_id in self.team_ids),
+                return_exceptions=True,
+            )
+            teams_and_rosters = []
+            for team_id, roster in zip(self.team_ids, rosters):
+                if isinstance(roster, Exception):  # pragma: no cover - network errors
+                    logger.error(f"Skipping team {team_id}: {roster}")
+                    continue
+                teams_and_rosters.append((team_id, roster))
+            tasks = self._build_player_tasks(teams_and_rosters)
+            try:
+                players_info = await aclient.fetch_players_info(tasks)
+                for group, ids in self._split_by_stat_group(players_info).items():
+                    self._player_teams.update(
+                        await aclient.get_players_teams_for_season(ids, self.season, group)
+                    )
+            except Exception as e:  # pragma: no cover - network errors
+                logger.warning(f"Batched player prefetch failed, falling back to per-player requests: {e}")
+            if self.use_leaderboards:
+                try:
+                    await aclient.load_fangraphs_snapshots(self.season, self._stat_types())
+                except Exception as e:  # pragma: no cover - network errors
+                    logger.warning(f"Leaderboard snapshot load failed, falling back to per-player requests: {e}")
+
+            in_flight = asyncio.Semaphore(self.max_in_flight)
+
+            async def fetch(mlbam_id: int) -> Optional[pd.DataFrame]:
+                async with in_flight:
+                    return await self._fetch_player_stats_async(aclient, mlbam_id)
+
+            all_stats: List[pd.DataFrame] = []
+            for coro in tqdm(
+                asyncio.as_completed([fetch(mlbam_id) for mlbam_id in tasks]),
+                total=len(tasks),
+                desc=f"Fetching {len(tasks)} players",
+            ):
+                stats = await coro
+                if stats is not None:
+                    all_stats.append(stats)
+        return all_stats
+
+    def _prefetch_players_info(self, player_ids: List[int]) -> Dict[int, dict]:
+        """Load people records for every player in a few batched requests.
+
+        ``Player.create_from_mlb`` then reads them from the client instead of
+        requesting each player separately.
+        """
+        try:
+            return self.client.fetch_players_info(player_ids)
+        except Exception as e:  # pragma: no cover - network errors
+            logger.warning(f"Batched player info fetch failed, falling back to per-player requests: {e}")
+            return {}
+
+    def _stat_types(self) -> List[str]:
+        """Fangraphs stat types needed for the configured ``player_type``."""
+        if self.player_type == "pitchers":
+            return ["pitching"]
+        if self.player_type == "batters":
+            return ["batting"]
+        return ["batting", "pitching"]
+
+    def _split_by_stat_group(self, players_info: Dict[int, dict]) -> Dict[str, List[int]]:
+        """Group player IDs by the stat group they will be fetched with.
+
+        Players excluded by ``player_type`` are left out; they are reported as
+        position mismatches later without any stats requests.
+        """
+        groups: Dict[str, List[int]] = {"pitching": [], "batting": []}
+        for player_id, info in players_info.items():
+            pos = (info.get("primaryPosition") or {}).get("abbreviation")
+            if self.player_type == "pitchers" and pos != "P":
+                continue
+            if self.player_type == "batters" and pos == "P":
+                continue
+            groups["pitching" if pos == "P" else "batting"].append(player_id)
+        return {group: ids for group, ids in groups.items() if ids}
+
+    def _prefetch_player_teams(self, players_info: Dict[int, dict]) -> None:
+        """Discover every player's teams with bulk season-stats requests.
+
+        Replaces one ``get_player_teams_for_season`` call per player.
+        """
+        try:
+            for group, ids in self._split_by_stat_group(players_info).items():
+                self._player_teams.update(
+                    self.client.get_players_teams_for_season(ids, self.season, group)
+                )
+        except Exception as e:  # pragma: no cover - network errors
+            logger.warning(f"Bulk team lookup failed, falling back to per-player requests: {e}")
+
+    # Expected per-player failures and the status bucket each is recorded under.
+    _FAILURE_STATUSES = (
+        (NoFangraphsIdError, "no_fangraphs_id"),
+        (PlayerNotFoundError, "not_found"),
+        (PositionMismatchError, "position_mismatch"),
+        (NoStatsError, "no_stats"),
+        (ValueError, "valueerror"),
+    )
+
+    def _record_failure(self, exc: Exception, mlbam_id: int, safe_name: str, attempt: int) -> bool:
+        """Record a failed player fetch and return True if it should be retried."""
+        for exc_type, status in self._FAILURE_STATUSES:
+            if isinstance(exc, exc_type):
+                self.statuses[status].append(safe_name)
+                return False
+        logger.warning(f"[{mlbam_id}] attempt {attempt} failed: {exc}")
+        if attempt == self.retry_attempts:
+            self.statuses["error"].append(mlbam_id)
+            return False
+        return True
+
+    def _check_position(self, mlbam_id: int, pos: Optional[str]) -> None:
+        if self.player_type == "pitchers" and pos != "P":
+            raise PositionMismatchError(f"{mlbam_id} is not a pitcher")
+        if self.player_type == "batters" and pos == "P":
+            raise PositionMismatchError(f"{mlbam_id} is a pitcher, not a batter")
+
+    def _label_team_stats(
+        self, stats: Optional[pd.DataFrame], mlbam_id: int, team_id: Optional[int]
+    ) -> Optional[pd.DataFrame]:
+        """Tag one team's stats with player/season/team, or return None if empty."""
+        # Drop columns with no data and skip entirely empty or all-NA frames
+        if stats is not None:
+            stats = stats.dropna(axis=1, how="all")
+        if stats is None or stats.empty:
+            return None
+        stats["mlbam_id"] = mlbam_id
+        stats["season"] = self.season
+        stats["mlbam_team_id"] = team_id
+        return stats
+
+    def _combine_player_stats(
+        self, team_dfs: List[pd.DataFrame], mlbam_id: int, safe_name: str
+    ) -> pd.DataFrame:
+        if not team_dfs:
+            raise NoStatsError(f"No stats for {mlbam_id} in {self.season}")
+        combined = pd.concat(team_dfs, ignore_index=True, sort=False)
+        self.statuses["success"].append(safe_name)
+        return combined
+
+    async def _fetch_player_stats_async(self, aclient, mlbam_id: int) -> Optional[pd.DataFrame]:
+        """Async variant of :meth:`_fetch_player_stats`.
+
+        Position and name come straight from the StatsAPI people record, so
+        no :class:`Player` (and none of its team/Fangraphs lookups) is built.
+        """
+        safe_name = f"mlbam:{mlbam_id}"
+        for attempt in range(1, self.retry_attempts + 1):
+            try:
+                info = await aclient.fetch_player_info(mlbam_id)
+                if not info:
+                    raise PlayerNotFoundError(f"No player for id {mlbam_id}")
+                safe_name = info.get("fullName") or safe_name
+
+                pos = (info.get("primaryPosition") or {}).get("abbreviation")
+                self._check_position(mlbam_id, pos)
+
+                fetch_fn = (
+                    aclient.fetch_pitching_stats
+                    if pos == "P"
+                    else aclient.fetch_batting_stats
+                )
+                group = "pitching" if pos == "P" else "batting"
+                team_ids = self._player_teams.get(mlbam_id)
+                if team_ids is None:
+                    team_ids = await aclient.get_player_teams_for_season(
+                        mlbam_id, self.season, group=group, ids_only=True
+                    )
+                if not team_ids:
+                    team_ids = [None]
+
+                frames = await asyncio.gather(*(
+                    fetch_fn(
+                        mlbam_id=mlbam_id,
+                        season=self.season,
+                        fangraphs_team_id=self.team_id_map.get(team_id) if team_id is not None else None,
+                    )
+                    for team_id in team_ids
+                ))
+                team_dfs = [
+                    df for df in (
+                        self._label_team_stats(stats, mlbam_id, team_id)
+                        for stats, team_id in zip(frames, team_ids)
+                    )
+                    if df is not None
+                ]
+                return self._combine_player_stats(team_dfs, mlbam_id, safe_name)
+
+            except Exception as exc:
+                if not self._record_failure(exc, mlbam_id, safe_name, attempt):
+                    return None
+                await asyncio.sleep(0.5)
 
 
 
@@ -245,10 +506,7 @@ class SeasonStatsDownloader:
                 safe_name = getattr(getattr(player, "player_bio", None), "full_name", safe_name)
 
                 pos = player.player_info.primary_position
-                if self.player_type == "pitchers" and pos != "P":
-                    raise PositionMismatchError(f"{mlbam_id} is not a pitcher")
-                if self.player_type == "batters" and pos == "P":
-                    raise PositionMismatchError(f"{mlbam_id} is a pitcher, not a batter")
+                self._check_position(mlbam_id, pos)
 
                 fetch_fn = (
                     self.client.fetch_pitching_stats
@@ -257,9 +515,11 @@ class SeasonStatsDownloader:
                 )
 
                 group = "pitching" if pos == "P" else "batting"
-                team_ids = self.client.get_player_teams_for_season(
-                    mlbam_id, self.season, group=group, ids_only=True
-                )
+                team_ids = self._player_teams.get(mlbam_id)
+                if team_ids is None:
+                    team_ids = self.client.get_player_teams_for_season(
+                        mlbam_id, self.season, group=group, ids_only=True
+                    )
                 if not team_ids:
                     team_ids = [None]
 
@@ -271,42 +531,14 @@ class SeasonStatsDownloader:
                         season=self.season,
                         fangraphs_team_id=fg_id,
                     )
-                    # Drop columns with no data and skip entirely empty or all-NA frames
+                    stats = self._label_team_stats(stats, mlbam_id, team_id)
                     if stats is not None:
-                        stats = stats.dropna(axis=1, how="all")
-                    if stats is None or stats.empty:
-                        continue
-                    stats["mlbam_id"] = mlbam_id
-                    stats["season"] = self.season
-                    stats["mlbam_team_id"] = team_id
-                    team_dfs.append(stats)
-
-                if not team_dfs:
-                    raise NoStatsError(f"No stats for {mlbam_id} in {self.season}")
-
-                combined = pd.concat(team_dfs, ignore_index=True, sort=False)
-                self.statuses["success"].append(safe_name)
-                return combined
-
-            except NoFangraphsIdError:
-                self.statuses["no_fangraphs_id"].append(safe_name)
-                return None
-            except PlayerNotFoundError:
-                self.statuses["not_found"].append(safe_name)
-                return None
-            except PositionMismatchError:
-                self.statuses["position_mismatch"].append(safe_name)
-                return None
-            except NoStatsError:
-                self.statuses["no_stats"].append(safe_name)
-                return None
-            except ValueError:
-                self.statuses["valueerror"].append(safe_name)
-                return None
+                        team_dfs.append(stats)
+
+                return self._combine_player_stats(team_dfs, mlbam_id, safe_name)
+
             except Exception as exc:
-                logger.warning(f"[{mlbam_id}] attempt {attempt} failed: {exc}")
-                if attempt == self.retry_attempts:
-                    self.statuses["error"].append(mlbam_id)
+                if not self._record_failure(exc, mlbam_id, safe_name, attempt):
                     return None
                 time.sleep(0.5)
 
@@ -354,6 +586,43 @@ class SeasonStatsDownloader:
         for status, lst in self.statuses.items():
             logger.info(f"{status.title():<12}: {len(lst)}")
 
+        cache_stats = self.client.http_cache_stats()
+        for name, stats in cache_stats.items():
+            logger.info(
+                f"HTTP cache    : {name} {stats['hits']} hits, {stats['misses']} misses "
+                f"({stats['expired']} expired, {stats['revalidated']} revalidated)"
+            )
+        if cache_stats:
+            for endpoint, saved in sorted(self.client.http_cache_bytes_saved().items()):
+                logger.info(f"Not modified  : {endpoint} {saved / 1024:.1f} KiB saved")
+
+        merged = http_session.coalescing_stats()
+        logger.info(f"Coalesced     : {merged['merged']} duplicate requests merged into {merged['calls']}")
+
+        for host, stats in http_session.rate_limit_stats().items():
+            logger.info(
+                f"Rate limit    : {host} {stats['requests']} requests, {stats['throttled']} throttled, "
+                f"{stats['rate']}/{stats['max_rate']} req/s"
+            )
+
+        for host, stats in http_session.hedging_stats().items():
+            logger.info(
+                f"Hedging       : {host} {stats['hedged']} of {stats['requests']} requests hedged, "
+                f"{stats['hedge_wins']} won by the hedge (delay {stats['delay']}s)"
+            )
+
+        for host, stats in http_session.circuit_breaker_stats().items():
+            logger.info(
+                f"Circuit       : {host} {stats['state']}, opened {stats['opened']} times, "
+                f"{stats['rejected']} requests failed fast"
+            )
+
+        for endpoint, stats in self.client.slowest_endpoints(5):
+            logger.info(
+                f"Slowest       : {endpoint} p95 {stats['latency']['p95']:.3f}s over {stats['requests']} requests, "
+                f"{stats['errors']} errors, {stats['cache_hit_ratio']:.0%} cache hits"
+            )
+
         no_stats = self.statuses.get("no_stats", [])
         if no_stats:
             logger.info("\nPlayers with no stats returned:")
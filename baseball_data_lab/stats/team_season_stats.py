@@ -1,12 +1,12 @@
 import numpy as np
 
-from baseball_data_lab.apis.unified_data_client import UnifiedDataClient
+from baseball_data_lab.apis.unified_data_client import UnifiedDataClient, get_default_client
 
 
 class TeamSeasonStats:
 
     def __init__(self, season: int, data_client: UnifiedDataClient = None):
-        self.data_client = data_client if data_client else UnifiedDataClient()
+        self.data_client = data_client if data_client else get_default_client()
         self.season = season
         self.wins = None
         self.losses = None
@@ -0,0 +1,165 @@
+"""Fetches everything a batch of summary sheets needs before any of them is rendered."""
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from baseball_data_lab.apis.fangraphs_client import FangraphsClient
+from baseball_data_lab.apis.mlb_stats_client import MlbStatsClient
+from baseball_data_lab.apis.unified_data_client import UnifiedDataClient, get_default_client
+from baseball_data_lab.constants import team_logo_urls
+from baseball_data_lab.player.player_lookup import PlayerLookup
+from baseball_data_lab.team.team import Team
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 16
+
+# Batches with at least this many players of one type load the full Fangraphs
+# leaderboard once instead of one stats request per player.
+LEADERBOARD_MIN_PLAYERS = 10
+
+ResourceKey = Tuple[Any, ...]
+
+
+class PrefetchPlanner:
+    """Plans and warms every remote resource a batch of player summary sheets reads.
+
+    For each player the sheets need the people record, the current team and
+    its Fangraphs roster, the season dates, Fangraphs stats, StatsAPI
+    splits, the season's Statcast pitches, the headshot and the team logo.
+    People records and splits for the whole batch share a few merged
+    requests (``UnifiedDataClient.preload_players``).
+    :meth:`plan` lists those as de-duplicated resources (players on the
+    same team share one team fetch, every sheet shares the season dates)
+    and :meth:`prefetch` fetches them all at once on a thread pool, so a
+    batch costs about as long as its slowest resource rather than the sum.
+
+    The fetched data lands in the clients' shared caches, so rendering only
+    benefits when they are enabled: the StatsAPI/Fangraphs response cache
+    (``UnifiedDataClient.enable_http_cache``), the image cache and the
+    Statcast checkpoints. Statcast windows that reach today are never
+    checkpointed and are fetched again while rendering. Pass the same
+    ``data_client`` to ``Player.create_from_mlb`` so the people records
+    loaded here are reused.
+    """
+
+    def __init__(self,
+                 season: int,
+                 data_client: Optional[UnifiedDataClient] = None,
+                 max_workers: int = DEFAULT_MAX_WORKERS,
+                 use_leaderboards: bool = True):
+        self.season = season
+        self.data_client = data_client if data_client else get_default_client()
+        self.max_workers = max_workers
+        self.use_leaderboards = use_leaderboards
+        self.timings: Dict[ResourceKey, float] = {}
+
+    # ------------------------------------------------------------------
+    # Players
+    # ------------------------------------------------------------------
+    def resolve_ids(self, player_names: Iterable[str]) -> Dict[str, Optional[int]]:
+        """Map each player name to its MLBAM ID using the local register (``None`` if not found)."""
+        lookup = PlayerLookup(data_client=self.data_client)
+        ids: Dict[str, Optional[int]] = {}
+        for name in dict.fromkeys(player_names):
+            player_data = lookup.lookup_player(name)
+            mlbam_id = player_data.get('key_mlbam') if player_data is not None else None
+            if isinstance(mlbam_id, list):
+                mlbam_id = mlbam_id[0] if mlbam_id else None
+            ids[name] = int(mlbam_id) if mlbam_id else None
+        return ids
+
+    # ------------------------------------------------------------------
+    # Planning
+    # ------------------------------------------------------------------
+    def _season_dates(self) -> Tuple[str, str]:
+        season_info = self.data_client.get_season_info(self.season)
+        return season_info['regularSeasonStartDate'], season_info['regularSeasonEndDate']
+
+    def _load_team(self, team_id: int) -> None:
+        team = Team.create_from_mlb(team_id=team_id, data_client=self.data_client)
+        if team.abbrev in team_logo_urls:
+            self.data_client.fetch_logo_img(team_logo_urls[team.abbrev])
+
+    def plan(self, player_ids: Iterable[int]) -> Dict[ResourceKey, Callable[[], Any]]:
+        """Return ``{resource: fetch}`` for every resource the players' sheets need.
+
+        Loads the people records with the season's splits (batched through
+        ``preload_players``) and the season dates first, since the rest of
+        the plan depends on positions, teams and dates.
+        """
+        client = self.data_client
+        ids = [int(pid) for pid in dict.fromkeys(player_ids)]
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            infos_future = executor.submit(client.preload_players, ids, self.season)
+            dates_future = executor.submit(self._season_dates)
+            infos, (start_date, end_date) = infos_future.result(), dates_future.result()
+
+        season = self.season
+        roles = {pid: 'pitching' if info.get('primaryPosition', {}).get('abbreviation') == 'P' else 'batting'
+                 for pid, info in infos.items()}
+        counts = {stat_type: sum(1 for role in roles.values() if role == stat_type) for stat_type in ('pitching', 'batting')}
+        leaderboards = {stat_type for stat_type, count in counts.items()
+                        if self.use_leaderboards and count >= LEADERBOARD_MIN_PLAYERS}
+
+        resources: Dict[ResourceKey, Callable[[], Any]] = {}
+        for stat_type in sorted(leaderboards):
+            resources[("leaderboard", stat_type, season)] = (
+                lambda stat_type=stat_type: FangraphsClient.load_leaderboard_snapshot(season, stat_type))
+
+        for pid, info in infos.items():
+            stat_type = roles[pid]
+            team_id = info.get('currentTeam', {}).get('id')
+            if team_id:
+                resources[("team", team_id)] = lambda team_id=team_id: self._load_team(team_id)
+            if stat_type not in leaderboards:
+                fetch_stats = client.fetch_pitching_stats if stat_type == 'pitching' else client.fetch_batting_stats
+                resources[("stats", stat_type, pid, season)] = (
+                    lambda fetch=fetch_stats, pid=pid: fetch(mlbam_id=pid, season=season))
+            fetch_statcast = (client.fetch_statcast_pitcher_data if stat_type == 'pitching'
+                              else client.fetch_statcast_batter_data)
+            resources[("statcast", stat_type, pid, start_date, end_date)] = (
+                lambda fetch=fetch_statcast, pid=pid: fetch(pid, start_date, end_date))
+            resources[("headshot", pid)] = lambda pid=pid: client.fetch_player_headshot_img(pid)
+
+        missing = [pid for pid in ids if pid not in infos]
+        if missing:
+            logger.warning(f"No people records for {missing}; their sheets will not be prefetched")
+        return resources
+
+    # ------------------------------------------------------------------
+    # Fetching
+    # ------------------------------------------------------------------
+    def _timed(self, key: ResourceKey, fetch: Callable[[], Any]) -> bool:
+        started = time.perf_counter()
+        try:
+            fetch()
+            return True
+        except Exception as exc:
+            logger.warning(f"Prefetch of {key} failed: {exc}")
+            return False
+        finally:
+            self.timings[key] = time.perf_counter() - started
+
+    def prefetch(self, player_ids: Iterable[int]) -> Dict[ResourceKey, bool]:
+        """Fetch every planned resource concurrently and return ``{resource: loaded}``.
+
+        Failures are logged and reported rather than raised; rendering
+        fetches those again and surfaces the error there.
+        """
+        if MlbStatsClient.cache is None or FangraphsClient.cache is None:
+            logger.warning("HTTP cache is disabled; prefetched StatsAPI/Fangraphs responses will not be reused")
+        resources = self.plan(player_ids)
+        if not resources:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(resources))) as executor:
+            keys: List[ResourceKey] = list(resources)
+            loaded = executor.map(lambda key: self._timed(key, resources[key]), keys)
+            return dict(zip(keys, loaded))
+
+    def slowest(self, count: int = 5) -> List[Tuple[ResourceKey, float]]:
+        """Return the ``count`` slowest resources of the last prefetch with their seconds."""
+        return sorted(self.timings.items(), key=lambda item: item[1], reverse=True)[:count]
@@ -7,7 +7,7 @@ from baseball_data_lab.config import FOOTER_TEXT
 from baseball_data_lab.team.team import Team
 from baseball_data_lab.config  import BASE_DIR
 from baseball_data_lab.utils import Utils
-from baseball_data_lab.apis.unified_data_client import UnifiedDataClient
+from baseball_data_lab.apis.unified_data_client import UnifiedDataClient, get_default_client
 from baseball_data_lab.apis.local_data_client import LocalDataClient
 
 
@@ -16,7 +16,7 @@ class SummarySheet:
     local_data_client = LocalDataClient()
 
     def __init__(self, season=2024, data_client: UnifiedDataClient = None):
-        self.data_client = data_client if data_client else UnifiedDataClient()
+        self.data_client = data_client if data_client else get_default_client()
         self.season = season
         season_info = self.data_client.get_season_info(season)
         self.start_date = season_info['regularSeasonStartDate']
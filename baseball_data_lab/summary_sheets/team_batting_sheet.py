@@ -5,18 +5,16 @@ from baseball_data_lab.stats.stats_display import StatsDisplay
 from baseball_data_lab.data_viz.batting_spray_chart import BattingSprayChart
 from baseball_data_lab.constants import statcast_events
 from baseball_data_lab.summary_sheets.summary_sheet import SummarySheet
-from baseball_data_lab.apis.unified_data_client import UnifiedDataClient
+from baseball_data_lab.apis.unified_data_client import UnifiedDataClient, get_default_client
 from baseball_data_lab.team.team import Team
 
 
 class TeamBattingSheet(SummarySheet):
 
-    data_client = UnifiedDataClient()
-
     def __init__(self, team: Team, season: int, data_client: UnifiedDataClient = None):
         super().__init__(season)
 
-        self.data_client = data_client if data_client else UnifiedDataClient()
+        self.data_client = data_client if data_client else get_default_client()
 
         self.team = team
 
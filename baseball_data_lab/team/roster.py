@@ -1,9 +1,7 @@
-from baseball_data_lab.apis.unified_data_client import UnifiedDataClient
+from baseball_data_lab.apis.unified_data_client import get_default_client
 
 class Roster:
 
-    data_client = UnifiedDataClient()
-
     def __init__(self):
         # Initialize self.players as an empty list
         self.players = []
@@ -20,11 +18,12 @@ class Roster:
     @staticmethod
     def get_season_roster(team_id: int = None, team_name: str = None, year: int = 2024):
         roster = []
+        data_client = get_default_client()
         if team_id:
-            roster = Roster.data_client.fetch_team_players(team_id=team_id, season=year)
+            roster = data_client.fetch_team_players(team_id=team_id, season=year)
         elif team_name:
-            team_id = Roster.data_client.get_team_id(team_name)
-            roster = Roster.data_client.fetch_team_players(team_id=team_id, season=year)
+            team_id = data_client.get_team_id(team_name)
+            roster = data_client.fetch_team_players(team_id=team_id, season=year)
 
         # if team_id:
         #     roster = Roster.data_client.fetch_active_roster(team_id=team_id, year=year)
@@ -21,8 +21,8 @@ class Team:
     def __init__(self, data_client: Optional["UnifiedDataClient"] = None):
         if data_client is None:
             # Lazy import at runtime to break cycles
-            from baseball_data_lab.apis.unified_data_client import UnifiedDataClient
-            data_client = UnifiedDataClient()
+            from baseball_data_lab.apis.unified_data_client import get_default_client
+            data_client = get_default_client()
         self.data_client: "UnifiedDataClient" = data_client
         self.team_id = None # MLBAM team ID
         self.mlbam_id = None # MLBAM team ID
@@ -82,8 +82,8 @@ class Team:
         if team_id is None and team_name is None:
             raise ValueError("Either team_id or team_name must be provided.")
         if data_client is None:
-            from baseball_data_lab.apis.unified_data_client import UnifiedDataClient as _UnifiedDataClient
-            data_client = _UnifiedDataClient()   # <-- DO NOT reassign the class name
+            from baseball_data_lab.apis.unified_data_client import get_default_client
+            data_client = get_default_client()
         team = Team(data_client=data_client)
         #team = Team(data_client=data_client)
         if team_id is None and team_name:
@@ -16,8 +16,8 @@ class Utils:
     def get_fangraphs_id(mlbam_id: int, search_client: PlayerSearchClient) -> any:
     
         # Perform the usual lookup first.
-        player_data = search_client.playerid_reverse_lookup([mlbam_id], key_type='mlbam').get('key_fangraphs')
-        player_fangraphs_id = player_data[0]
+        player_data = search_client.lookup_id(mlbam_id, key_type='mlbam')
+        player_fangraphs_id = player_data.get('key_fangraphs') if player_data else None
 
         # Check if the result is missing or not valid.
         if player_fangraphs_id in (None, -1, '', 'NA'):
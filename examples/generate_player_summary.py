@@ -14,13 +14,16 @@ from baseball_data_lab.summary_sheets.pitcher_summary_sheet import PitcherSummar
 from baseball_data_lab.summary_sheets.batter_summary_sheet import BatterSummarySheet
 from baseball_data_lab.team.roster import Roster
 from baseball_data_lab.team.team import Team
+from baseball_data_lab.apis.pybaseball_client import PybaseballClient
+from baseball_data_lab.apis.unified_data_client import UnifiedDataClient
+from baseball_data_lab.summary_sheets.prefetch_planner import PrefetchPlanner
 
 warnings.filterwarnings("ignore", category=MarkupResemblesLocatorWarning)
 
 players_not_found = []
 
-def generate_player_sheet(player_name: str, year: int=2024):
-    player = Player.create_from_mlb(player_name=player_name)
+def generate_player_sheet(player_name: str, year: int=2024, data_client: UnifiedDataClient = None):
+    player = Player.create_from_mlb(player_name=player_name, data_client=data_client, season=year)
     if player is None:
         print(f"Player {player_name} not found.")
         players_not_found.append(player_name)
@@ -55,8 +58,23 @@ def main():
         help="Specify the year for which the player stats should be generated (default: 2024)",
     )
 
+    parser.add_argument(
+        "--league-statcast",
+        action="store_true",
+        help="Ingest each day's Statcast data league-wide once and slice every player's pitches from it",
+    )
+
+    parser.add_argument(
+        "--no-prefetch",
+        action="store_true",
+        help="Fetch each sheet's data while rendering it instead of prefetching the whole batch first",
+    )
+
     args = parser.parse_args()
 
+    if args.league_statcast:
+        PybaseballClient.enable_statcast_store()
+
     players = []
     teams = None
 
@@ -81,8 +99,19 @@ def main():
     if teams:
         print(f"Teams: {teams}")
 
+    data_client = UnifiedDataClient()
+    if not args.no_prefetch:
+        data_client.enable_http_cache()
+        data_client.enable_image_cache()
+        planner = PrefetchPlanner(year, data_client=data_client)
+        player_ids = [pid for pid in planner.resolve_ids(players).values() if pid]
+        loaded = planner.prefetch(player_ids)
+        print(f"Prefetched {sum(loaded.values())} of {len(loaded)} resources")
+        for key, seconds in planner.slowest(3):
+            print(f"  {seconds:.2f}s {key}")
+
     for player in players:
-        generate_player_sheet(player, year)
+        generate_player_sheet(player, year, data_client)
 
     if teams:
         for team in teams:
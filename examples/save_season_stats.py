@@ -7,7 +7,12 @@ from pathlib import Path
 import sys
 sys.path.append(str(Path(__file__).resolve().parents[1]))
 
+from contextlib import ExitStack
+
 from baseball_data_lab.stats.save_season_stats import SeasonStatsDownloader
+from baseball_data_lab.apis.cassette import Cassette
+from baseball_data_lab.apis.stand_in_server import StandInServer
+from baseball_data_lab.config import HTTP_CACHE_DIR
 
 
 if __name__ == "__main__":
@@ -32,10 +37,54 @@ if __name__ == "__main__":
         default='batters',  # Set default player_type to 'batters'
         help='Specify the batters or pitcher for which stats should be saved'
     )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Disable the on-disk StatsAPI response cache'
+    )
+    parser.add_argument(
+        '--async',
+        dest='use_async',
+        action='store_true',
+        help='Fetch on a single asyncio event loop instead of a thread pool'
+    )
+    parser.add_argument(
+        '--record',
+        metavar='CASSETTE',
+        help='Record every API response to this cassette (.json.gz); use without --async'
+    )
+    parser.add_argument(
+        '--replay',
+        metavar='CASSETTE',
+        help='Serve API requests from this cassette through a local stand-in server'
+    )
+    parser.add_argument(
+        '--latency',
+        type=float,
+        default=0.0,
+        help='Seconds of latency the stand-in server adds to each response (with --replay)'
+    )
+    parser.add_argument(
+        '--hedge',
+        action='store_true',
+        help='Send a duplicate of unusually slow requests and use whichever answers first'
+    )
+    parser.add_argument(
+        '--circuit-breaker',
+        action='store_true',
+        help='Fail requests fast while a host keeps erroring instead of waiting on timeouts'
+    )
+    parser.add_argument(
+        '--metrics-file',
+        metavar='PATH',
+        help='Write per-endpoint request metrics to this file in the Prometheus text format'
+    )
 
 
     # Parse the command-line arguments
     args = parser.parse_args()
+    if args.use_async and (args.hedge or args.circuit_breaker):
+        parser.error('--hedge and --circuit-breaker only apply to the thread pool; drop --async')
 
     season = args.season
     league = args.league
@@ -49,9 +98,19 @@ if __name__ == "__main__":
         retry_attempts = 2,
         chunk_size = 300,
         league = league,
-        player_type=args.player_type
+        player_type=args.player_type,
+        cache_dir=None if args.no_cache else HTTP_CACHE_DIR,
+        use_async=args.use_async,
+        hedge_requests=args.hedge,
+        circuit_breaker=args.circuit_breaker,
+        metrics_file=args.metrics_file
     )
-    downloader.download()
+    with ExitStack() as stack:
+        if args.record:
+            stack.enter_context(Cassette(args.record).recording())
+        if args.replay:
+            stack.enter_context(StandInServer(Cassette(args.replay), latency=args.latency))
+        downloader.download()
 
     end_time = time.perf_counter()
 
@@ -14,7 +14,7 @@ from baseball_data_lab.team.roster import Roster
 players_not_found = []
 
 
-def save_statcast_data(player_name: str, year: int = 2024) -> None:
+def save_statcast_data(player_name: str, year: int = 2024, incremental: bool = False) -> None:
     """Save Statcast data for a single player."""
     player = Player.create_from_mlb(player_name=player_name)
     if player is None:
@@ -22,7 +22,7 @@ def save_statcast_data(player_name: str, year: int = 2024) -> None:
         players_not_found.append(player_name)
         return
 
-    player.save_statcast_data(year)
+    player.save_statcast_data(year, incremental=incremental)
 
 
 def main() -> None:
@@ -48,6 +48,12 @@ def main() -> None:
         help="Specify the year for which the player stats should be saved (default: 2024)",
     )
 
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only fetch days after the last pitch already saved for each player",
+    )
+
     args = parser.parse_args()
 
     players = []
@@ -74,7 +80,7 @@ def main() -> None:
     print(f"Team names: {teams}")
 
     for player in players:
-        save_statcast_data(player, year)
+        save_statcast_data(player, year, incremental=args.incremental)
 
     for player in players_not_found:
         print(f"Player {player} not found.")
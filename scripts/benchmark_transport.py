@@ -0,0 +1,81 @@
+# Compare the HTTP/1.1 and HTTP/2 transports on a full-league roster and people crawl.
+#
+# Usage:
+# python scripts/benchmark_transport.py output/cassettes/season_2024.json.gz --season 2024 --latency 0.05
+#
+# The crawl fetches every team's full-season roster and then each rostered
+# player's people record one request at a time, against a local stand-in
+# server replaying the cassette (recorded with examples/save_season_stats.py
+# --record). The server speaks HTTP/2 for the http2 run, and counts the
+# connections each transport opens.
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import sys
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from baseball_data_lab.apis import http_session
+from baseball_data_lab.apis.cassette import Cassette
+from baseball_data_lab.apis.http2_transport import http2_available
+from baseball_data_lab.apis.mlb_stats_client import MlbStatsClient
+from baseball_data_lab.apis.stand_in_server import StandInServer
+from baseball_data_lab.config import DATA_DIR
+
+
+def crawl(season: int, workers: int) -> int:
+    """Fetch every roster and every rostered player's people record; return the player count."""
+    with open(os.path.join(DATA_DIR, "mlb_teams.json"), "r") as fp:
+        team_ids = [t["mlbam_team_id"] for t in json.load(fp)]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        rosters = list(executor.map(lambda team_id: MlbStatsClient.fetch_full_season_roster(team_id, season), team_ids))
+        player_ids = sorted({entry["person"]["id"] for roster in rosters for entry in roster})
+        list(executor.map(MlbStatsClient.fetch_player_info, player_ids))
+    return len(player_ids)
+
+
+def run(cassette: Cassette, transport: str, args) -> dict:
+    registry = http_session.SessionRegistry(rate_limiter=None, transport=transport)
+    previous = http_session.set_registry(registry)
+    try:
+        with StandInServer(cassette, latency=args.latency, jitter=args.jitter, http2=transport == "http2") as server:
+            started = time.perf_counter()
+            players = crawl(args.season, args.workers)
+            elapsed = time.perf_counter() - started
+            stats = server.stats()
+    finally:
+        registry.close()
+        http_session.set_registry(previous)
+    return {
+        "transport": transport,
+        "players": players,
+        "requests": stats["requests"],
+        "missing": stats["missing"],
+        "seconds": elapsed,
+        "req_per_s": stats["requests"] / elapsed if elapsed else 0.0,
+        "connections": stats["connections"],
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the HTTP/1.1 and HTTP/2 transports against a stand-in server.")
+    parser.add_argument("cassette", help="Cassette file (.json.gz) with rosters and people records")
+    parser.add_argument("--season", type=int, default=2024)
+    parser.add_argument("--workers", type=int, default=32, help="Concurrent requests")
+    parser.add_argument("--latency", type=float, default=0.05, help="Seconds the server adds to every response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Up to this many extra random seconds")
+    parser.add_argument("--transports", nargs="+", default=["http1", "http2"], choices=["http1", "http2"])
+    args = parser.parse_args()
+
+    if "http2" in args.transports and not http2_available():
+        parser.error('the http2 transport needs httpx with HTTP/2 support: pip install "httpx[http2]"')
+
+    cassette = Cassette(args.cassette)
+    print(f"{'transport':<10} {'players':>8} {'requests':>9} {'missing':>8} {'seconds':>8} {'req/s':>8} {'connections':>12}")
+    for transport in args.transports:
+        row = run(cassette, transport, args)
+        print(f"{row['transport']:<10} {row['players']:>8} {row['requests']:>9} {row['missing']:>8} "
+              f"{row['seconds']:>8.2f} {row['req_per_s']:>8.1f} {row['connections']:>12}")
@@ -0,0 +1,39 @@
+# Serve recorded StatsAPI/Fangraphs responses locally for offline runs and load tests.
+#
+# Usage:
+# python scripts/stand_in_server.py output/cassettes/season_2024.json.gz --port 8765 --latency 0.05
+#
+# Point a process at it with
+#   http_session.set_host_override(STAND_IN_HOSTS, "http://127.0.0.1:8765")
+import argparse
+import time
+from pathlib import Path
+import sys
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from baseball_data_lab.apis.cassette import Cassette
+from baseball_data_lab.apis.stand_in_server import StandInServer
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run a local stand-in API server from a cassette.")
+    parser.add_argument("cassette", help="Cassette file (.json.gz) recorded with Cassette.recording()")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Up to this many extra random seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of requests answered with 503")
+    args = parser.parse_args()
+
+    cassette = Cassette(args.cassette)
+    server = StandInServer(cassette, port=args.port, latency=args.latency,
+                           jitter=args.jitter, error_rate=args.error_rate).start()
+    print(f"Serving {len(cassette)} recordings at {server.base_url}")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+        print(server.stats())
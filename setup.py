@@ -18,14 +18,19 @@ setup(
     install_requires=[
         "pandas==2.2.3",
         "numpy==2.1.1",
+        "pyarrow==17.0.0",
         "matplotlib==3.9.2",
         "seaborn==0.13.2",
         "mplcursors==0.5.3",
         "pybaseball==2.2.7",
         "MLB-StatsAPI==1.9.0",
         "requests==2.32.3",
+        "aiohttp==3.10.10",
         "python-dotenv==1.0.0",
     ],
+    extras_require={
+        "http2": ["httpx[http2]==0.28.1"],
+    },
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: GNU General Public License v3 (GPLv3)",
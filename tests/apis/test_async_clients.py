@@ -0,0 +1,250 @@
+import asyncio
+import inspect
+
+from aiohttp import web
+
+from baseball_data_lab.apis import metrics, response_cache
+
+from baseball_data_lab.apis.async_http import AsyncHttpClient
+from baseball_data_lab.apis.rate_limiter import RateLimiter
+from baseball_data_lab.apis.async_mlb_stats_client import AsyncMlbStatsClient
+from baseball_data_lab.apis.async_fangraphs_client import AsyncFangraphsClient
+from baseball_data_lab.apis.async_unified_data_client import AsyncUnifiedDataClient
+from baseball_data_lab.apis.mlb_stats_client import MlbStatsClient
+from baseball_data_lab.apis.fangraphs_client import FangraphsClient
+from baseball_data_lab.apis.unified_data_client import UnifiedDataClient
+
+
+class FakeHttp:
+    def __init__(self, responses):
+        self.responses = responses
+        self.urls = []
+
+    async def get_json(self, url):
+        self.urls.append(url)
+        return self.responses[url]
+
+
+async def _serve(handler):
+    app = web.Application()
+    app.router.add_get("/data", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}/data"
+
+
+def test_per_host_limit_bounds_requests_in_flight():
+    state = {"active": 0, "peak": 0}
+
+    async def handler(request):
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        await asyncio.sleep(0.02)
+        state["active"] -= 1
+        return web.json_response({"ok": True})
+
+    async def run():
+        runner, url = await _serve(handler)
+        try:
+            async with AsyncHttpClient(host_limits={}, default_limit=3, rate_limiter=RateLimiter(default_rate=1000)) as http:
+                results = await asyncio.gather(*(http.get_json(f"{url}?i={i}") for i in range(12)))
+        finally:
+            await runner.cleanup()
+        return results
+
+    results = asyncio.run(run())
+    assert results == [{"ok": True}] * 12
+    assert state["peak"] == 3
+
+
+def test_identical_concurrent_requests_share_one_call():
+    calls = []
+
+    async def handler(request):
+        calls.append(1)
+        await asyncio.sleep(0.02)
+        return web.json_response({"ok": True})
+
+    async def run():
+        runner, url = await _serve(handler)
+        try:
+            async with AsyncHttpClient(rate_limiter=RateLimiter(default_rate=1000)) as http:
+                results = await asyncio.gather(*(http.get_json(url) for _ in range(5)))
+                return results, http.single_flight.stats()
+        finally:
+            await runner.cleanup()
+
+    results, stats = asyncio.run(run())
+    assert results == [{"ok": True}] * 5
+    assert len(calls) == 1
+    assert stats == {"calls": 1, "merged": 4}
+
+
+def test_requests_are_recorded_in_the_client_metrics():
+    async def handler(request):
+        await asyncio.sleep(0.02)
+        return web.json_response({"ok": True})
+
+    async def run():
+        runner, url = await _serve(handler)
+        try:
+            async with AsyncHttpClient(rate_limiter=RateLimiter(default_rate=1000)) as http:
+                await asyncio.gather(*(http.get_json(url) for _ in range(3)))
+        finally:
+            await runner.cleanup()
+
+    previous = metrics.set_metrics(metrics.ClientMetrics())
+    try:
+        asyncio.run(run())
+        stats, = metrics.snapshot().values()
+    finally:
+        metrics.set_metrics(previous)
+    assert stats["requests"] == 1
+    assert stats["coalesced"] == 2
+    assert stats["errors"] == 0
+    assert stats["bytes"] > 0
+
+
+def test_transient_errors_are_retried():
+    calls = []
+
+    async def handler(request):
+        calls.append(1)
+        if len(calls) < 3:
+            return web.Response(status=503, headers={"Retry-After": "0"})
+        return web.json_response({"ok": True})
+
+    limiter = RateLimiter(default_rate=1000)
+
+    async def run():
+        runner, url = await _serve(handler)
+        try:
+            async with AsyncHttpClient(retries=3, backoff=0, rate_limiter=limiter) as http:
+                return await http.get_json(url)
+        finally:
+            await runner.cleanup()
+
+    assert asyncio.run(run()) == {"ok": True}
+    assert len(calls) == 3
+    host_stats = next(iter(limiter.stats().values()))
+    assert host_stats["throttled"] == 2
+    assert host_stats["rate"] < 1000
+
+
+def test_async_mlb_client_stores_validators_and_revalidates(monkeypatch, tmp_path):
+    sent = []
+
+    async def handler(request):
+        sent.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return web.Response(status=304)
+        return web.json_response({"ok": True}, headers={"ETag": '"v1"'})
+
+    async def run():
+        runner, url = await _serve(handler)
+        try:
+            async with AsyncHttpClient(rate_limiter=RateLimiter(default_rate=1000)) as http:
+                client = AsyncMlbStatsClient(http)
+                first = await client._get_json(url)
+                now = response_cache.time.time()
+                monkeypatch.setattr(response_cache.time, "time", lambda: now + 10 ** 6)
+                return first, await client._get_json(url)
+        finally:
+            await runner.cleanup()
+
+    cache = MlbStatsClient.enable_cache(str(tmp_path))
+    try:
+        assert asyncio.run(run()) == ({"ok": True}, {"ok": True})
+    finally:
+        MlbStatsClient.disable_cache()
+    assert sent == [None, '"v1"']
+    assert cache.stats()["revalidated"] == 1
+
+
+def test_async_mlb_client_matches_sync_parsing():
+    url = MlbStatsClient._player_stats_by_season_url(1, 2024, "pitching")
+    payload = {
+        "people": [{
+            "id": 1,
+            "stats": [{
+                "type": {"displayName": "season"},
+                "splits": [
+                    {"season": "2024", "stat": {"era": "3.00"}, "team": {"id": 116, "teamName": "Tigers"}},
+                    {"season": "2024", "stat": {"era": "4.00"}, "team": {"id": 119, "teamName": "Dodgers"}},
+                ],
+            }],
+        }]
+    }
+    client = AsyncMlbStatsClient(FakeHttp({url: payload}))
+
+    team_ids = asyncio.run(client.get_player_teams_for_season(1, 2024, group="pitching", ids_only=True))
+    assert team_ids == [116, 119]
+
+
+def test_async_fangraphs_team_players_fetches_both_groups():
+    batting_url, pitching_url = FangraphsClient._team_players_urls(6, 2024)
+    http = FakeHttp({
+        batting_url: {"data": [{"PlayerName": "Riley Greene"}]},
+        pitching_url: {"data": [{"PlayerName": "Tarik Skubal"}]},
+    })
+    client = AsyncFangraphsClient(http)
+
+    players = asyncio.run(client.fetch_team_players(6, 2024))
+    assert players == ["Riley Greene", "Tarik Skubal"]
+    assert sorted(http.urls) == sorted([batting_url, pitching_url])
+
+
+def test_async_unified_client_shares_player_records_with_sync_client():
+    url, = MlbStatsClient._players_info_urls([2])
+    data_client = UnifiedDataClient()
+    data_client.store_players_info({1: {"id": 1}})
+    http = FakeHttp({url: {"people": [{"id": 2}]}})
+    client = AsyncUnifiedDataClient(data_client, http=http)
+
+    assert asyncio.run(client.fetch_players_info([1, 2])) == {1: {"id": 1}, 2: {"id": 2}}
+    assert http.urls == [url]
+    assert data_client.fetch_player_info(2) == {"id": 2}
+
+
+def test_async_fangraphs_frames_stream_and_share_the_frame_cache(monkeypatch, tmp_path):
+    sent = []
+
+    async def handler(request):
+        sent.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return web.Response(status=304)
+        return web.json_response({"data": [{"PlayerName": "X", "WAR": 1.5}]}, headers={"ETag": '"v1"'})
+
+    async def run():
+        runner, url = await _serve(handler)
+        try:
+            async with AsyncHttpClient(rate_limiter=RateLimiter(default_rate=1000)) as http:
+                client = AsyncFangraphsClient(http)
+                rows = await client._stream(url, list)
+                first = await client._get_frame(url)
+                now = response_cache.time.time()
+                monkeypatch.setattr(response_cache.time, "time", lambda: now + 10 ** 6)
+                return rows[1], first, await client._get_frame(url)
+        finally:
+            await runner.cleanup()
+
+    cache = FangraphsClient.enable_cache(str(tmp_path))
+    try:
+        rows, first, second = asyncio.run(run())
+    finally:
+        FangraphsClient.disable_cache()
+    assert rows == [{"PlayerName": "X", "WAR": 1.5}]
+    assert first.to_dict("records") == second.to_dict("records") == rows
+    assert sent == [None, None, '"v1"']
+    assert cache.stats()["revalidated"] == 1
+
+
+def test_async_unified_client_methods_match_the_sync_signatures():
+    for name, method in inspect.getmembers(AsyncUnifiedDataClient, inspect.iscoroutinefunction):
+        if name.startswith("_") or not hasattr(UnifiedDataClient, name):
+            continue
+        sync_params = inspect.signature(getattr(UnifiedDataClient, name)).parameters
+        assert list(inspect.signature(method).parameters) == list(sync_params), name
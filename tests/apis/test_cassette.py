@@ -0,0 +1,93 @@
+import asyncio
+
+import pytest
+
+from baseball_data_lab.apis import http_session
+from baseball_data_lab.apis.async_http import AsyncHttpClient
+from baseball_data_lab.apis.cassette import Cassette, CassetteMissError, build_response
+from baseball_data_lab.apis.fangraphs_client import FangraphsClient
+from baseball_data_lab.apis.mlb_stats_client import MlbStatsClient
+from baseball_data_lab.apis.rate_limiter import RateLimiter
+from baseball_data_lab.apis.stand_in_server import StandInServer
+from baseball_data_lab.config import STATS_API_BASE_URL
+
+
+class FakeRegistry:
+    rate_limiter = None
+
+    def __init__(self, payloads):
+        self.payloads = payloads
+
+    def get(self, url, **kwargs):
+        import json
+        return build_response(url, {"status": 200, "headers": {"Content-Type": "application/json"},
+                                    "body": json.dumps(self.payloads[url]).encode("utf-8")})
+
+
+def test_record_save_and_replay(tmp_path):
+    url = f"{STATS_API_BASE_URL}teams/116"
+    path = str(tmp_path / "c.json.gz")
+    previous = http_session.set_registry(FakeRegistry({url: {"teams": [{"id": 116}]}}))
+    try:
+        with Cassette(path).recording():
+            assert MlbStatsClient.fetch_team(116) == {"id": 116}
+    finally:
+        http_session.set_registry(previous)
+
+    cassette = Cassette(path)
+    assert url in cassette
+    with cassette.replaying():
+        assert MlbStatsClient.fetch_team(116) == {"id": 116}
+        with pytest.raises(CassetteMissError):
+            MlbStatsClient.fetch_team(117)
+
+
+def test_stand_in_server_serves_and_assembles(tmp_path):
+    cassette = Cassette(str(tmp_path / "c.json.gz"))
+    for pid in (1, 2):
+        cassette.record(f"{STATS_API_BASE_URL}people?personIds={pid}&hydrate=currentTeam", 200,
+                        {"Content-Type": "application/json"}, f'{{"people": [{{"id": {pid}}}]}}'.encode())
+    snapshot_url = FangraphsClient._snapshot_url(2024, "batting")
+    cassette.record(snapshot_url, 200, {}, b'{"data": [{"playerid": 10, "WAR": 1.5}, {"playerid": 11, "WAR": 0.1}]}')
+    previous = http_session.set_registry(http_session.SessionRegistry(rate_limiter=RateLimiter(default_rate=1000)))
+    try:
+        with StandInServer(cassette) as server:
+            assert MlbStatsClient.fetch_player_info(2) == {"id": 2}
+            assert sorted(MlbStatsClient.fetch_players_info([1, 2])) == [1, 2]
+            df = FangraphsClient.fetch_player_stats(11, 2024, None, "batting")
+            assert df.to_dict("records") == [{"playerid": 11, "WAR": 0.1}]
+
+            async def fetch_async():
+                async with AsyncHttpClient(rate_limiter=RateLimiter(default_rate=1000)) as http:
+                    return await http.get_json(f"{STATS_API_BASE_URL}people?personIds=1&hydrate=currentTeam")
+
+            assert asyncio.run(fetch_async()) == {"people": [{"id": 1}]}
+            resp = http_session.http_get(f"{STATS_API_BASE_URL}teams/999")
+            assert resp.status_code == 404
+        assert server.stats()["assembled"] == 2
+        assert server.stats()["missing"] == 1
+    finally:
+        http_session.get_registry().close()
+        http_session.set_registry(previous)
+
+
+def test_http_session_settings_work_while_a_cassette_is_active(tmp_path):
+    inner = http_session.SessionRegistry(rate_limiter=RateLimiter(default_rate=1000))
+    previous = http_session.set_registry(inner)
+    try:
+        cassette = Cassette(str(tmp_path / "c.json.gz"))
+        with cassette.recording(save=False):
+            http_session.enable_circuit_breaker("statsapi.mlb.com")
+            http_session.set_transport("http1")
+            assert http_session.get_rate_limiter() is inner.rate_limiter
+        assert "statsapi.mlb.com" in inner.breakers
+
+        with cassette.replaying():
+            http_session.enable_hedging("statsapi.mlb.com")
+            http_session.enable_circuit_breaker("statsapi.mlb.com")
+            http_session.set_transport("http1")
+            assert list(http_session.circuit_breaker_stats()) == ["statsapi.mlb.com"]
+            http_session.disable_hedging("statsapi.mlb.com")
+    finally:
+        inner.close()
+        http_session.set_registry(previous)
@@ -0,0 +1,147 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from baseball_data_lab.apis.chadwick_register import ChadwickRegister, PlayerSearchClient
+from baseball_data_lab.apis.name_index import NameSearchIndex
+from baseball_data_lab.utils import Utils
+
+
+@pytest.fixture
+def search_client(tmp_path):
+    register_file = tmp_path / "chadwick-register.csv"
+    pd.DataFrame({
+        "name_last": ["Skubal", "Greene", "Greene", "Old", "Rodríguez"],
+        "name_first": ["Tarik", "Riley", "Shane", "Timer", "Julio"],
+        "key_mlbam": [669373, 682985, 656477, None, 677594],
+        "key_retro": ["skubt001", "greer003", "greea002", "oldt101", "rodrj007"],
+        "key_bbref": ["skubata01", "greenri03", "greensh02", "oldti01", "rodriju01"],
+        "key_fangraphs": [22267, 25976, None, 1001, 23697],
+        "mlb_played_first": [2020, 2022, 2013, 1901, 2022],
+        "mlb_played_last": [2025, 2025, 2021, 1905, 2025],
+    }).to_csv(register_file, index=False)
+    register = ChadwickRegister(register_file=str(register_file))
+    register.load()
+    return PlayerSearchClient(register)
+
+
+def test_reverse_lookup_uses_id_indexes(search_client):
+    result = search_client.reverse_lookup([682985, "669373", 1], key_type="mlbam")
+    assert result["name_first"].tolist() == ["tarik", "riley"]
+    assert result.index.tolist() == [0, 1]
+
+    by_fangraphs = search_client.reverse_lookup([1001], key_type="fangraphs")
+    assert by_fangraphs["key_bbref"].tolist() == ["oldti01"]
+    assert search_client.reverse_lookup(["greea002"], key_type="retro")["name_first"].tolist() == ["shane"]
+    assert search_client.reverse_lookup([], key_type="bbref").empty
+    with pytest.raises(ValueError):
+        search_client.reverse_lookup([1], key_type="espn")
+
+
+def test_lookup_id_returns_a_single_record(search_client):
+    record = search_client.lookup_id("skubata01", key_type="bbref")
+    assert record["key_mlbam"] == 669373
+    assert record["key_fangraphs"] == 22267
+    assert search_client.lookup_id(999) is None
+    assert Utils.get_fangraphs_id(682985, search_client) == 25976
+
+
+def test_search_uses_name_indexes_without_mutating_the_register(search_client):
+    assert search_client.search("greene")["name_first"].tolist() == ["riley", "shane"]
+    assert search_client.search("Greene", "Shane")["key_mlbam"].tolist() == [656477]
+    assert search_client.search("rodriguez", "julio").empty
+
+    folded = search_client.search("Rodriguez", "Julio", ignore_accents=True)
+    assert folded["key_mlbam"].tolist() == [677594]
+    assert search_client.search("rodríguez", ignore_accents=True)["name_last"].tolist() == ["rodríguez"]
+    assert search_client.table["name_last"].tolist()[-1] == "rodríguez"
+
+
+def test_fuzzy_search_uses_a_persisted_name_index(search_client, tmp_path):
+    closest = search_client.search("Skuball", "Tarek", fuzzy=True)
+    assert closest["key_mlbam"].iloc[0] == 669373
+
+    register = search_client.register
+    register.get_name_index(save=True)
+    assert os.path.exists(register.name_index_file)
+    reloaded = ChadwickRegister(register_file=register.register_file)
+    reloaded.load()
+    assert reloaded.get_name_index().row_count == 5
+
+    results = search_client.search_list([("Greene", "Riley"), ("Rodriguez", "Julo"), ("Gren", "Shane")], fuzzy=True)
+    assert results["key_mlbam"].tolist()[:2] == [682985, 677594]
+
+
+def test_name_index_ranks_like_difflib():
+    index = NameSearchIndex.build(["José Ramírez", "Jose Ramos", "Josh Rojas", "José Ramírez", "Tarik Skubal"])
+    matches = index.search("jose ramirez", k=2)
+    assert [match.name for match in matches] == ["jose ramirez", "jose ramos"]
+    assert matches[0].score == 1.0
+    assert matches[0].rows.tolist() == [0, 3]
+    assert index.search_many(["zzz", "tarik skubal"], k=1)[1][0].rows.tolist() == [4]
+    assert index.search("qqq") == []
+
+
+def test_second_load_maps_the_snapshot(search_client, monkeypatch):
+    register = search_client.register
+    assert os.path.exists(os.path.join(register.snapshot_dir, "meta.json"))
+
+    def no_csv(*args, **kwargs):
+        raise AssertionError("register CSV parsed again")
+
+    monkeypatch.setattr(pd, "read_csv", no_csv)
+    reloaded = ChadwickRegister(register_file=register.register_file)
+    table = reloaded.load()
+    names = {"name_last": object, "name_first": object}
+    pd.testing.assert_frame_equal(table.astype(names), register.get_lookup_table(), check_dtype=False)
+    assert isinstance(reloaded.snapshot.array("key_mlbam"), np.memmap)
+    assert np.shares_memory(table["key_mlbam"].to_numpy(), reloaded.snapshot.array("key_mlbam"))
+
+    client = PlayerSearchClient(reloaded)
+    assert client.search("Rodriguez", "Julio", ignore_accents=True)["key_mlbam"].tolist() == [677594]
+    assert client.lookup_id("greensh02", key_type="bbref")["key_mlbam"] == 656477
+    assert client.reverse_lookup([1001], key_type="fangraphs")["name_last"].tolist() == ["old"]
+
+
+def test_changed_register_file_rebuilds_the_snapshot(search_client):
+    register = search_client.register
+    table = pd.read_csv(register.register_file)
+    table.loc[0, "name_first"] = "Tarikk"
+    table.to_csv(register.register_file, index=False)
+
+    reloaded = ChadwickRegister(register_file=register.register_file)
+    assert reloaded.load()["name_first"].iloc[0] == "tarikk"
+    assert PlayerSearchClient(reloaded).search("skubal", "tarikk")["key_mlbam"].tolist() == [669373]
+
+
+def test_saved_name_index_is_rebuilt_when_the_register_changes(search_client):
+    register = search_client.register
+    register.get_name_index(save=True)
+    # Same row count, different row order.
+    pd.read_csv(register.register_file).iloc[::-1].to_csv(register.register_file, index=False)
+    os.utime(register.register_file, ns=(1, 1))
+
+    reloaded = ChadwickRegister(register_file=register.register_file)
+    reloaded.load()
+    assert reloaded.get_name_index().source == {"size": os.path.getsize(register.register_file), "mtime_ns": 1}
+    assert reloaded.get_closest_names("Skubal", "Tarik")["key_mlbam"].iloc[0] == 669373
+
+
+def test_exact_search_list_does_not_build_the_name_index(search_client):
+    results = search_client.search_list([("Greene", "Riley"), ("Skubal", "Tarik")], fuzzy=True)
+    assert results["key_mlbam"].tolist() == [682985, 669373]
+    assert search_client.register.name_index is None
+
+
+def test_snapshot_lives_in_the_user_cache_with_mapped_name_codes(search_client, user_cache_dir):
+    register = search_client.register
+    assert register.snapshot_dir.startswith(str(user_cache_dir))
+    assert register.name_index_file.startswith(str(user_cache_dir))
+
+    reloaded = ChadwickRegister(register_file=register.register_file)
+    names = reloaded.load()["name_last"].array
+    assert isinstance(names, pd.Categorical)
+    assert np.shares_memory(names.codes, reloaded.snapshot.arrays["name_last.codes"])
+    assert names.tolist() == ["skubal", "greene", "greene", "old", "rodríguez"]
@@ -0,0 +1,57 @@
+import pytest
+
+from baseball_data_lab.apis.circuit_breaker import CircuitBreaker, CircuitOpenError, CLOSED, OPEN
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_opens_after_consecutive_failures_and_fails_fast():
+    clock = FakeClock()
+    breaker = CircuitBreaker("statsapi.mlb.com", failure_threshold=3, reset_timeout=10, clock=clock)
+    for status in (503, None, 500):
+        breaker.before_request()
+        breaker.record(status)
+    assert breaker.state == OPEN
+
+    with pytest.raises(CircuitOpenError) as excinfo:
+        breaker.before_request()
+    assert excinfo.value.host == "statsapi.mlb.com"
+    assert breaker.stats()["opened"] == 1
+    assert breaker.stats()["rejected"] == 1
+
+
+def test_success_resets_the_failure_count():
+    breaker = CircuitBreaker("h", failure_threshold=2)
+    breaker.record(503)
+    breaker.record(200)
+    breaker.record(503)
+    assert breaker.state == CLOSED
+    # Throttling is the rate limiter's job, not a host failure.
+    breaker.record(429)
+    assert breaker.state == CLOSED
+
+
+def test_half_open_lets_one_trial_through():
+    clock = FakeClock()
+    breaker = CircuitBreaker("h", failure_threshold=1, reset_timeout=5, clock=clock)
+    breaker.record(None)
+    clock.now = 6
+    breaker.before_request()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+
+    breaker.record(503)
+    assert breaker.state == OPEN
+    assert breaker.stats()["opened"] == 2
+
+    clock.now = 12
+    breaker.before_request()
+    breaker.record(200)
+    assert breaker.state == CLOSED
+    breaker.before_request()
@@ -1,5 +1,7 @@
+import json
+
 import pandas as pd
-import requests
+from baseball_data_lab.apis import http_session
 import pytest
 
 from baseball_data_lab.apis import fangraphs_client
@@ -11,13 +13,19 @@ class DummyResponse:
         self._data = data
     def json(self):
         return {"data": self._data}
+    def iter_content(self, chunk_size=1):
+        body = json.dumps(self.json()).encode("utf-8")
+        for i in range(0, len(body), chunk_size):
+            yield body[i:i + chunk_size]
+    def close(self):
+        pass
 
 
 def make_fake_get(monkeypatch, expected_url, data):
     def fake_get(url):
         assert url == expected_url
         return DummyResponse(data)
-    monkeypatch.setattr(requests, "get", fake_get)
+    monkeypatch.setattr(http_session, "http_get", fake_get)
 
 
 def test_fetch_player_stats_builds_correct_url(monkeypatch):
@@ -52,9 +60,9 @@ def test_fetch_player_stats_invalid_type():
 
 def test_fetch_leaderboards_dispatch(monkeypatch):
     calls = []
-    def fake_pitch(season):
+    def fake_pitch(season, columns=None):
         calls.append(("pitch", season))
-    def fake_bat(season):
+    def fake_bat(season, columns=None):
         calls.append(("bat", season))
     monkeypatch.setattr(FangraphsClient, "fetch_pitching_leaderboards", fake_pitch)
     monkeypatch.setattr(FangraphsClient, "fetch_batting_leaderboards", fake_bat)
@@ -84,7 +92,7 @@ def test_fetch_team_players_merges_names(monkeypatch):
             return DummyResponse([{"PlayerName": "A"}, {"PlayerName": "B"}])
         else:
             return DummyResponse([{"PlayerName": "B"}, {"PlayerName": "C"}])
-    monkeypatch.setattr(requests, "get", fake_get)
+    monkeypatch.setattr(http_session, "http_get", fake_get)
     players = FangraphsClient.fetch_team_players(99, 2024)
     assert urls == [expected_bat_url, expected_pitch_url]
     assert players == ["A", "B", "C"]
@@ -99,10 +107,10 @@ def test_fetch_leaderboard_helpers(monkeypatch):
         f"&season=2022&season1=2022&ind=0&qual=0&type=8&month=0&pageitems=500000"
     )
     urls = []
-    def fake_get(url):
+    def fake_get(url, **kwargs):
         urls.append(url)
         return DummyResponse([{"PlayerName": "X"}])
-    monkeypatch.setattr(requests, "get", fake_get)
+    monkeypatch.setattr(http_session, "http_get", fake_get)
     df1 = FangraphsClient.fetch_pitching_leaderboards(2022)
     df2 = FangraphsClient.fetch_batting_leaderboards(2022)
     assert urls == [pitch_url, bat_url]
@@ -110,7 +118,70 @@ def test_fetch_leaderboard_helpers(monkeypatch):
     assert df2.to_dict("records") == [{"PlayerName": "X"}]
 
 
+def test_leaderboards_as_json_stream_the_rows(monkeypatch):
+    class PagedResponse(DummyResponse):
+        def json(self):
+            return {"data": self._data, "totalCount": 1}
+
+    calls = []
+    def fake_get(url, **kwargs):
+        calls.append(kwargs)
+        return PagedResponse([{"PlayerName": "X"}])
+    monkeypatch.setattr(http_session, "http_get", fake_get)
+    assert FangraphsClient.fetch_pitching_leaderboards_as_json(2022) == [{"PlayerName": "X"}]
+    assert FangraphsClient.fetch_batting_leaderboards_as_json(2022) == [{"PlayerName": "X"}]
+    assert calls == [{"stream": True}, {"stream": True}]
+
+
+
+
+
+
+
 
+@pytest.fixture
+def clear_snapshots():
+    yield
+    FangraphsClient.clear_leaderboard_snapshots()
+
+
+def test_fetch_player_stats_served_from_snapshot(monkeypatch, clear_snapshots):
+    rows = [
+        {"playerid": 10, "teamid": 6, "WAR": 1.0},
+        {"playerid": 10, "teamid": 22, "WAR": 2.0},
+        {"playerid": 11, "teamid": 6, "WAR": 3.0},
+    ]
+    urls = []
+    def fake_get(url, **kwargs):
+        urls.append(url)
+        return DummyResponse(rows)
+    monkeypatch.setattr(http_session, "http_get", fake_get)
+
+    FangraphsClient.load_leaderboard_snapshot(2024, "batting", team_split=True)
+    assert urls[0].endswith("&pageitems=500000&team=0,ss")
+
+    df = FangraphsClient.fetch_player_stats(10, 2024, 22, "batting")
+    assert df.to_dict("records") == [{"playerid": 10, "teamid": 22, "WAR": 2.0}]
+    assert FangraphsClient.fetch_player_stats(99, 2024, 6, "batting").empty
+    assert len(urls) == 1
+
+
+def test_fetch_player_stats_without_matching_snapshot_requests(monkeypatch, clear_snapshots):
+    urls = []
+    def fake_get(url, **kwargs):
+        urls.append(url)
+        return DummyResponse([{"playerid": 10, "teamid": 6}])
+    monkeypatch.setattr(http_session, "http_get", fake_get)
 
+    FangraphsClient.load_leaderboard_snapshot(2024, "batting", team_split=True)
+    FangraphsClient.fetch_player_stats(10, 2024, None, "batting")
+    FangraphsClient.fetch_player_stats(10, 2024, 6, "pitching")
+    assert len(urls) == 3
 
 
+def test_leaderboard_columns_are_projected_while_streaming(monkeypatch):
+    rows = [{"playerid": i, "PlayerName": f"P{i}", "WAR": i / 10} for i in range(5)]
+    monkeypatch.setattr(http_session, "http_get", lambda url, **kwargs: DummyResponse(rows))
+    df = FangraphsClient.fetch_leaderboards(2022, "batting", columns=["playerid", "WAR"])
+    assert list(df.columns) == ["playerid", "WAR"]
+    assert df["WAR"].tolist() == [0.0, 0.1, 0.2, 0.3, 0.4]
@@ -0,0 +1,104 @@
+import threading
+import time
+
+import pytest
+import requests
+
+from baseball_data_lab.apis import http_session
+from baseball_data_lab.apis.circuit_breaker import CircuitOpenError
+from baseball_data_lab.apis.hedging import HedgePolicy
+from baseball_data_lab.apis.http_session import SessionRegistry
+from tests.conftest import FakeResponse
+
+
+def test_fast_requests_are_not_hedged():
+    policy = HedgePolicy(initial_delay=1.0)
+    calls = []
+    resp = policy.call(lambda: calls.append(1) or FakeResponse("only"))
+    assert resp.json() == "only"
+    assert calls == [1]
+    assert policy.stats()["hedged"] == 0
+
+
+def test_slow_request_is_hedged_and_loser_closed():
+    policy = HedgePolicy(initial_delay=0.01)
+    release = threading.Event()
+    responses = []
+
+    def send():
+        first = not responses
+        resp = FakeResponse("primary" if first else "hedge")
+        responses.append(resp)
+        if first:
+            release.wait(2)
+        return resp
+
+    resp = policy.call(send)
+    assert resp.json() == "hedge"
+    release.set()
+    deadline = time.time() + 2
+    while not responses[0].closed and time.time() < deadline:
+        time.sleep(0.01)
+    assert responses[0].closed
+    stats = policy.stats()
+    assert stats["hedged"] == 1
+    assert stats["hedge_wins"] == 1
+
+
+def test_delay_follows_recent_latency_percentile():
+    policy = HedgePolicy(percentile=50, min_delay=0.0, min_samples=4)
+    policy._latencies.extend([0.1, 0.2, 0.3, 0.4])
+    assert policy.delay() == 0.3
+
+
+def test_registry_applies_breaker_and_hedging_per_host(monkeypatch):
+    registry = SessionRegistry(rate_limiter=None)
+    previous = http_session.set_registry(registry)
+    calls = []
+
+    def fake_send_limited(url, **kwargs):
+        calls.append(url)
+        return FakeResponse(url, status_code=503)
+
+    monkeypatch.setattr(registry, "_send_limited", fake_send_limited)
+    try:
+        http_session.enable_circuit_breaker("statsapi.mlb.com", failure_threshold=2)
+        http_session.enable_hedging("statsapi.mlb.com")
+        for _ in range(2):
+            registry.get("https://statsapi.mlb.com/api/v1/teams")
+        with pytest.raises(CircuitOpenError):
+            registry.get("https://statsapi.mlb.com/api/v1/teams")
+        # Other hosts are unaffected.
+        registry.get("https://www.fangraphs.com/api/leaders")
+        assert len(calls) == 3
+        assert http_session.circuit_breaker_stats()["statsapi.mlb.com"]["state"] == "open"
+        assert http_session.hedging_stats()["statsapi.mlb.com"]["requests"] == 3
+    finally:
+        http_session.disable_hedging("statsapi.mlb.com")
+        http_session.set_registry(previous)
+
+
+def test_any_send_error_settles_a_half_open_breaker(monkeypatch):
+    registry = SessionRegistry(rate_limiter=None)
+    previous = http_session.set_registry(registry)
+    outcomes = [FakeResponse("down", status_code=503), requests.exceptions.ChunkedEncodingError("truncated"),
+                FakeResponse("ok")]
+
+    def fake_send_limited(url, **kwargs):
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    monkeypatch.setattr(registry, "_send_limited", fake_send_limited)
+    try:
+        http_session.enable_circuit_breaker("statsapi.mlb.com", failure_threshold=1, reset_timeout=0)
+        url = "https://statsapi.mlb.com/api/v1/teams"
+        registry.get(url)
+        with pytest.raises(requests.exceptions.ChunkedEncodingError):
+            registry.get(url)
+        # The failed half-open trial reopened the breaker; the next trial goes through.
+        assert registry.get(url).json() == "ok"
+        assert http_session.circuit_breaker_stats()["statsapi.mlb.com"]["state"] == "closed"
+    finally:
+        http_session.set_registry(previous)
@@ -0,0 +1,65 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+pytest.importorskip("httpx")
+pytest.importorskip("h2")
+
+from baseball_data_lab.apis import http_session
+from baseball_data_lab.apis.cassette import Cassette
+from baseball_data_lab.apis.mlb_stats_client import MlbStatsClient
+from baseball_data_lab.apis.rate_limiter import RateLimiter
+from baseball_data_lab.apis.stand_in_server import StandInServer
+from baseball_data_lab.config import STATS_API_BASE_URL
+
+
+@pytest.fixture
+def cassette(tmp_path):
+    cassette = Cassette(str(tmp_path / "c.json.gz"))
+    for pid in range(1, 41):
+        cassette.record(f"{STATS_API_BASE_URL}people?personIds={pid}&hydrate=currentTeam", 200,
+                        {"Content-Type": "application/json"}, f'{{"people": [{{"id": {pid}}}]}}'.encode())
+    return cassette
+
+
+def use_registry(**kwargs):
+    registry = http_session.SessionRegistry(rate_limiter=RateLimiter(host_rates={}, default_rate=1000), **kwargs)
+    return http_session.set_registry(registry)
+
+
+def test_http2_multiplexes_concurrent_requests_over_one_connection(cassette):
+    previous = use_registry(transport="http2")
+    try:
+        with StandInServer(cassette, latency=0.02, http2=True) as server:
+            with ThreadPoolExecutor(max_workers=16) as executor:
+                infos = list(executor.map(MlbStatsClient.fetch_player_info, range(1, 41)))
+            resp = http_session.http_get(f"{STATS_API_BASE_URL}teams/999")
+        assert [info["id"] for info in infos] == list(range(1, 41))
+        assert resp.status_code == 404
+        assert resp.raw.version == "HTTP/2"
+        assert server.stats()["connections"] == 1
+        assert http_session.get_registry().transports() == {server.base_url.split("//")[1]: "http2"}
+    finally:
+        http_session.get_registry().close()
+        http_session.set_registry(previous)
+
+
+def test_http2_retries_unavailable_responses(cassette):
+    previous = use_registry(transport="http2")
+    try:
+        with StandInServer(cassette, error_rate=0.3, seed=7, http2=True) as server:
+            infos = [MlbStatsClient.fetch_player_info(pid) for pid in range(1, 21)]
+        assert [info["id"] for info in infos] == list(range(1, 21))
+        assert server.stats()["injected_errors"] > 0
+    finally:
+        http_session.get_registry().close()
+        http_session.set_registry(previous)
+
+
+def test_transport_only_applies_to_http2_hosts():
+    registry = http_session.SessionRegistry(transport="http2")
+    assert registry.transport_for("statsapi.mlb.com") == "http2"
+    assert registry.transport_for("www.fangraphs.com") == "http1"
+    assert http_session.SessionRegistry().transport_for("statsapi.mlb.com") == "http1"
+    with pytest.raises(ValueError):
+        http_session.SessionRegistry(transport="spdy")
@@ -0,0 +1,56 @@
+import threading
+
+from baseball_data_lab.apis import http_session
+from baseball_data_lab.apis.http_session import SessionRegistry, DEFAULT_RETRY
+
+
+def test_session_is_shared_per_host():
+    registry = SessionRegistry()
+    a = registry.session_for("https://statsapi.mlb.com/api/v1/teams/116")
+    b = registry.session_for("https://statsapi.mlb.com/api/v1/people?personIds=1")
+    c = registry.session_for("https://www.fangraphs.com/api/leaders/major-league/data")
+    assert a is b
+    assert a is not c
+    assert registry.hosts() == ["statsapi.mlb.com", "www.fangraphs.com"]
+    registry.close()
+    assert registry.hosts() == []
+
+
+def test_adapter_uses_host_pool_size_and_shared_retry():
+    registry = SessionRegistry(pool_sizes={"statsapi.mlb.com": 24}, default_pool_size=4)
+    adapter = registry.session_for("https://statsapi.mlb.com/").get_adapter("https://statsapi.mlb.com/")
+    other = registry.session_for("https://img.mlbstatic.com/").get_adapter("https://img.mlbstatic.com/")
+    assert adapter._pool_maxsize == 24
+    assert other._pool_maxsize == 4
+    assert adapter.max_retries is DEFAULT_RETRY
+
+
+def test_concurrent_callers_get_one_session():
+    registry = SessionRegistry()
+    seen = []
+
+    def worker():
+        seen.append(registry.session_for("https://statsapi.mlb.com/api/v1/"))
+
+    threads = [threading.Thread(target=worker) for _ in range(16)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len({id(s) for s in seen}) == 1
+
+
+def test_http_get_routes_through_registry(monkeypatch):
+    calls = []
+
+    class FakeRegistry:
+        def get(self, url, **kwargs):
+            calls.append((url, kwargs))
+            return "response"
+
+    previous = http_session.set_registry(FakeRegistry())
+    try:
+        assert http_session.http_get("https://statsapi.mlb.com/x", timeout=3) == "response"
+    finally:
+        http_session.set_registry(previous)
+    assert calls == [("https://statsapi.mlb.com/x", {"timeout": 3})]
@@ -0,0 +1,128 @@
+import pytest
+
+from baseball_data_lab.apis import http_session, unified_data_client
+from baseball_data_lab.apis.hydrate_planner import HydratePlanner, StatsHydrate
+from baseball_data_lab.apis.mlb_stats_client import MlbStatsClient
+from baseball_data_lab.apis.unified_data_client import UnifiedDataClient
+from baseball_data_lab.config import STATS_API_BASE_URL
+from tests.conftest import FakeResponse
+
+
+def split(code, avg):
+    return {"split": {"code": code}, "stat": {"avg": avg}}
+
+
+def person(pid):
+    return {
+        "id": pid,
+        "fullName": f"Player {pid}",
+        "currentTeam": {"id": 116},
+        "stats": [
+            {"type": {"displayName": "statSplits"}, "group": {"displayName": "hitting"},
+             "splits": [split("vr", ".250"), split("vl", ".300"), split("h", ".280"), split("a", ".270")]},
+            {"type": {"displayName": "statSplits"}, "group": {"displayName": "pitching"},
+             "splits": [split("vr", ".200"), split("vl", ".220"), split("h", ".210")]},
+            {"type": {"displayName": "season"}, "group": {"displayName": "hitting"},
+             "splits": [{"season": "2024", "stat": {"plateAppearances": 100, "baseOnBalls": 10}}]},
+        ],
+    }
+
+
+@pytest.fixture
+def people_api(monkeypatch):
+    urls = []
+
+    def fake_get(url):
+        urls.append(url)
+        ids = url.split("personIds=")[1].split("&")[0].split(",")
+        return FakeResponse({"people": [person(int(pid)) for pid in ids if int(pid) != 99]})
+
+    monkeypatch.setattr(http_session, "http_get", fake_get)
+    return urls
+
+
+def test_compatible_stats_hydrations_merge_into_one_block():
+    splits = StatsHydrate(types=("statSplits",), groups=("hitting",), season=2024, sit_codes=("vr", "vl"))
+    season = StatsHydrate(types=("season", "seasonAdvanced"), groups=("pitching",), season=2024,
+                          league_list_id="mlb_hist", nested="team(league)")
+    career = StatsHydrate(types=("career",), groups=("hitting",), league_list_id="mlb")
+
+    merged = splits.merge(season)
+    assert merged.render() == ("stats(group=[hitting,pitching],type=[statSplits,season,seasonAdvanced](team(league)),"
+                               "sitCodes=[vr,vl],leagueListId=mlb_hist,season=2024)")
+    assert merged.merge(career) is None
+    assert splits.render() == "stats(group=[hitting],type=statSplits,sitCodes=[vr,vl],season=2024)"
+
+
+def test_needs_for_many_players_share_one_request(people_api):
+    planner = HydratePlanner()
+    requests = {pid: (planner.person(pid), planner.splits(pid, 2024, "batting"), planner.splits(pid, 2024, "pitching"))
+                for pid in (1, 2, 99)}
+    planner.execute()
+
+    assert people_api == [
+        f"{STATS_API_BASE_URL}people?personIds=1,2,99&hydrate=currentTeam,"
+        "stats(group=[hitting,pitching],type=statSplits,sitCodes=[vr,vl,h,a],season=2024)"
+    ]
+    info, hitting, pitching = requests[2]
+    assert info.result() == {"id": 2, "fullName": "Player 2", "currentTeam": {"id": 116}}
+    assert hitting.result().index.get_level_values("Split").tolist() == ["vr", "vl", "h", "a"]
+    assert pitching.result().index.get_level_values("Split").tolist() == ["vr", "vl"]
+    assert pitching.result()["avg"].tolist() == [".200", ".220"]
+    with pytest.raises(LookupError):
+        requests[99][0].result()
+
+
+def test_conflicting_needs_are_split_into_separate_requests(people_api):
+    planner = HydratePlanner()
+    info = planner.person(1)
+    season = planner.season_stats(1, 2024, "batting")
+    career = planner.career(1)
+    assert len(planner.urls()) == 2
+    planner.execute()
+
+    assert len(people_api) == 2
+    assert "hydrate=currentTeam,team,stats(" in people_api[0]
+    assert info.result()["currentTeam"] == {"id": 116}
+    assert season.result()["season"]["BB%"] == 10.0
+    assert career.result() == {"stats": []}
+
+
+def test_fetch_batter_stat_splits_url_is_unchanged(people_api):
+    df = MlbStatsClient.fetch_batter_stat_splits(682985, 2024)
+    assert people_api == [
+        f"{STATS_API_BASE_URL}people?personIds=682985"
+        "&hydrate=stats(group=[hitting],type=statSplits,sitCodes=[vr,vl,h,a],season=2024)"
+    ]
+    assert df["avg"].tolist() == [".250", ".300", ".280", ".270"]
+
+
+def test_preload_players_serves_info_and_splits(people_api, monkeypatch):
+    client = UnifiedDataClient()
+    infos = client.preload_players([1, 2], 2024)
+    monkeypatch.setattr(MlbStatsClient, "fetch_batter_stat_splits",
+                        staticmethod(lambda pid, season: pytest.fail("unbatched request")))
+
+    assert sorted(infos) == [1, 2]
+    assert len(people_api) == 1
+    assert client.fetch_player_info(2)["fullName"] == "Player 2"
+    assert len(client.fetch_batting_splits(1, 2024)) == 4
+    client.preload_players([1, 2], 2024)
+    assert len(people_api) == 1
+
+
+def test_preloaded_records_expire_and_splits_are_copies(people_api, monkeypatch):
+    client = UnifiedDataClient()
+    client.preload_players([1], 2024)
+    splits = client.fetch_batting_splits(1, 2024)
+    splits["avg"] = None
+    assert client.fetch_batting_splits(1, 2024)["avg"].tolist() == [".250", ".300", ".280", ".270"]
+
+    client.clear_player_cache()
+    assert client.cached_players_info([1]) == {}
+    client.preload_players([1], 2024)
+    now = unified_data_client.time.monotonic()
+    monkeypatch.setattr(unified_data_client.time, "monotonic", lambda: now + UnifiedDataClient.PLAYER_CACHE_TTL + 1)
+    assert client.cached_players_info([1]) == {}
+    client.preload_players([1], 2024)
+    assert len(people_api) == 3
@@ -0,0 +1,99 @@
+from io import BytesIO
+
+import pytest
+import requests
+from PIL import Image
+
+from baseball_data_lab.apis import http_session
+from baseball_data_lab.apis.image_cache import ImageCache
+from baseball_data_lab.apis.web_client import WebClient
+from tests.conftest import FakeResponse
+
+
+LOGO_URL = "https://a.espncdn.com/i/teamlogos/mlb/500/det.png"
+
+
+def _png(color="red", size=(4, 4)):
+    buf = BytesIO()
+    Image.new("RGB", size, color).save(buf, format="PNG")
+    return buf.getvalue()
+
+
+@pytest.fixture
+def server(monkeypatch):
+    state = {"requests": [], "body": _png(), "etag": '"v1"'}
+
+    def fake_get(url, headers=None, **kwargs):
+        state["requests"].append((url, dict(headers or {})))
+        if headers and headers.get("If-None-Match") == state["etag"]:
+            return FakeResponse(status_code=304)
+        return FakeResponse(content=state["body"], headers={"ETag": state["etag"]})
+
+    monkeypatch.setattr(http_session, "http_get", fake_get)
+    return state
+
+
+def test_memory_tier_decodes_once(server):
+    cache = ImageCache()
+    first = cache.get_image(LOGO_URL)
+    second = cache.get_image(LOGO_URL)
+    assert first is second
+    assert len(server["requests"]) == 1
+    assert cache.stats()["memory_hits"] == 1
+
+
+def test_memory_tier_evicts_least_recently_used(server):
+    cache = ImageCache(max_memory_bytes=2 * 4 * 4 * 3)
+    for i in range(3):
+        cache.get_image(f"{LOGO_URL}?i={i}")
+    cache.get_image(f"{LOGO_URL}?i=2")
+    cache.get_image(f"{LOGO_URL}?i=0")
+    assert cache.stats()["memory_images"] == 2
+    assert len(server["requests"]) == 4
+
+
+def test_disk_tier_revalidates_stale_entries(server, tmp_path):
+    ImageCache(str(tmp_path)).get_image(LOGO_URL)
+
+    fresh = ImageCache(str(tmp_path))
+    assert fresh.get_bytes(LOGO_URL) == server["body"]
+    assert len(server["requests"]) == 1
+
+    stale = ImageCache(str(tmp_path), max_age=0)
+    assert stale.get_bytes(LOGO_URL) == server["body"]
+    assert server["requests"][-1][1] == {"If-None-Match": '"v1"'}
+    assert stale.stats()["revalidated"] == 1
+
+    server["etag"], server["body"] = '"v2"', _png("blue")
+    assert stale.get_bytes(LOGO_URL) == server["body"]
+    assert stale.stats()["downloads"] == 1
+
+
+def test_stale_entry_served_when_revalidation_fails(server, tmp_path, monkeypatch):
+    ImageCache(str(tmp_path)).get_bytes(LOGO_URL)
+
+    def offline(url, **kwargs):
+        raise requests.ConnectionError("offline")
+
+    monkeypatch.setattr(http_session, "http_get", offline)
+    assert ImageCache(str(tmp_path), max_age=0).get_bytes(LOGO_URL) == server["body"]
+
+
+def test_prefetch_warms_headshots_and_reports_failures(server, monkeypatch):
+    monkeypatch.setattr(WebClient, "images", ImageCache())
+    urls = [WebClient.player_headshot_url(pid) for pid in (1, 2, 3)]
+    server["body"] = _png()
+
+    def flaky_get(url, headers=None, **kwargs):
+        server["requests"].append((url, headers))
+        if url == urls[2]:
+            return FakeResponse(status_code=404)
+        return FakeResponse(content=server["body"])
+
+    monkeypatch.setattr(http_session, "http_get", flaky_get)
+    result = WebClient.prefetch_images(urls + urls[:1])
+    assert result == {urls[0]: True, urls[1]: True, urls[2]: False}
+
+    calls = len(server["requests"])
+    assert WebClient.fetch_player_headshot_img(1).size == (4, 4)
+    assert len(server["requests"]) == calls
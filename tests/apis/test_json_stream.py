@@ -0,0 +1,56 @@
+import json
+import warnings
+
+import pandas as pd
+import pytest
+
+from baseball_data_lab.apis.json_stream import iter_json_array, records_frame
+
+
+def _chunks(payload, size):
+    body = json.dumps(payload).encode("utf-8")
+    return [body[i:i + size] for i in range(0, len(body), size)]
+
+
+@pytest.mark.parametrize("size", [1, 3, 7, 4096])
+def test_iter_json_array_across_chunk_boundaries(size):
+    rows = [{"PlayerName": "José Ramírez", "WAR": 5.5, "tags": [1, {"a": None}]}, {"PlayerName": "}]\"", "WAR": -0.1}]
+    payload = {"data": rows, "totalCount": 2}
+    assert list(iter_json_array(_chunks(payload, size))) == rows
+
+
+def test_iter_json_array_scalars_and_empty():
+    assert list(iter_json_array(_chunks({"data": [12345, 6.5, "x"]}, 2))) == [12345, 6.5, "x"]
+    assert list(iter_json_array(_chunks({"data": []}, 2))) == []
+
+
+def test_iter_json_array_errors():
+    with pytest.raises(ValueError):
+        list(iter_json_array(_chunks({"rows": []}, 5)))
+    with pytest.raises(ValueError):
+        list(iter_json_array([b'{"data": [{"a": 1}, {"a"']))
+
+
+def test_records_frame_matches_dataframe_constructor():
+    rows = [{"id": i, "name": f"p{i}", "avg": (i / 7 if i % 3 else None)} for i in range(25)]
+    rows[10]["extra"] = "x"
+    expected = pd.DataFrame(data=rows)
+    result = records_frame(iter(rows), chunk_rows=4)
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_records_frame_projection_and_empty():
+    rows = [{"id": 1, "name": "a"}, {"id": 2}]
+    df = records_frame(rows, columns=["id", "name", "missing"], chunk_rows=1)
+    assert list(df.columns) == ["id", "name", "missing"]
+    assert df["id"].tolist() == [1, 2]
+    assert records_frame([], columns=["id"]).columns.tolist() == ["id"]
+
+
+def test_records_frame_dtypes_do_not_depend_on_all_na_chunks():
+    rows = [{"id": i, "war": None if i < 4 else i / 2, "team": None if i < 4 else "DET"} for i in range(8)]
+    expected = pd.DataFrame(data=rows)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", FutureWarning)
+        result = records_frame(rows, chunk_rows=4)
+    pd.testing.assert_frame_equal(result, expected)
@@ -0,0 +1,168 @@
+import threading
+
+import pytest
+import requests
+
+from baseball_data_lab.apis import http_session, metrics
+from baseball_data_lab.apis.metrics import ClientMetrics, LatencyHistogram, endpoint_of
+from baseball_data_lab.apis.fangraphs_client import FangraphsClient
+from baseball_data_lab.apis.mlb_stats_client import MlbStatsClient
+from baseball_data_lab.config import STATS_API_BASE_URL
+from tests.conftest import FakeResponse
+
+
+class FakeRegistry:
+    rate_limiter = None
+
+    def __init__(self, respond):
+        self.respond = respond
+
+    def get(self, url, **kwargs):
+        return self.respond(url)
+
+
+@pytest.fixture(autouse=True)
+def fresh_metrics():
+    previous = metrics.set_metrics(ClientMetrics())
+    yield metrics.get_metrics()
+    metrics.set_metrics(previous)
+
+
+@pytest.fixture
+def registry():
+    def use(respond):
+        previous = http_session.set_registry(FakeRegistry(respond))
+        restore.append(previous)
+
+    restore = []
+    yield use
+    for previous in restore:
+        http_session.set_registry(previous)
+
+
+def test_endpoint_of_replaces_ids_and_drops_query():
+    assert endpoint_of("https://statsapi.mlb.com/api/v1/teams/116/roster?season=2024") == \
+        "statsapi.mlb.com/api/v1/teams/{id}/roster"
+
+
+def test_histogram_quantiles_interpolate_within_buckets():
+    histogram = LatencyHistogram(buckets=(0.1, 1.0))
+    for seconds in (0.05, 0.05, 0.5, 0.5):
+        histogram.observe(seconds)
+    assert histogram.cumulative()[-1][1] == 4
+    assert histogram.quantile(0.5) == pytest.approx(0.1)
+    assert 0.1 < histogram.quantile(0.95) <= 0.5
+    assert histogram.max == 0.5
+
+
+def test_requests_errors_bytes_and_cache_hits_are_recorded(registry, tmp_path, fresh_metrics):
+    def respond(url):
+        if url.endswith("/teams/999"):
+            return FakeResponse({}, status_code=404, headers={"Content-Length": "10"})
+        return FakeResponse({"teams": [{"id": int(url.rsplit("/", 1)[1])}]}, headers={"Content-Length": "250"})
+
+    registry(respond)
+    MlbStatsClient.enable_cache(str(tmp_path))
+    try:
+        MlbStatsClient.fetch_team(116)
+        MlbStatsClient.fetch_team(117)
+        MlbStatsClient.fetch_team(116)
+        http_session.http_get(f"{STATS_API_BASE_URL}teams/999")
+    finally:
+        MlbStatsClient.disable_cache()
+
+    stats = fresh_metrics.snapshot()["statsapi.mlb.com/api/v1/teams/{id}"]
+    assert stats["requests"] == 3
+    assert stats["errors"] == 1
+    assert stats["bytes"] == 510
+    assert stats["cache_hits"] == 1
+    assert stats["cache_hit_ratio"] == 0.25
+    assert stats["latency"]["count"] == 3
+
+
+def test_connection_errors_count_as_errors(registry, fresh_metrics):
+    def respond(url):
+        raise requests.ConnectionError("down")
+
+    registry(respond)
+    with pytest.raises(requests.ConnectionError):
+        http_session.http_get("https://www.fangraphs.com/api/leaders/major-league/data")
+    stats = fresh_metrics.snapshot()["www.fangraphs.com/api/leaders/major-league/data"]
+    assert (stats["requests"], stats["errors"]) == (1, 1)
+
+
+def test_coalesced_calls_are_counted_per_endpoint(fresh_metrics):
+    started, release = threading.Event(), threading.Event()
+
+    def slow():
+        started.set()
+        release.wait(5)
+        return 1
+
+    url = "https://statsapi.mlb.com/api/v1/people/1"
+    leader = threading.Thread(target=http_session.coalesce, args=(url, slow))
+    leader.start()
+    started.wait(5)
+    follower = threading.Thread(target=http_session.coalesce, args=(url, slow))
+    follower.start()
+    while http_session.coalescing_stats()["merged"] < 1:
+        pass
+    release.set()
+    leader.join()
+    follower.join()
+    assert fresh_metrics.snapshot()["statsapi.mlb.com/api/v1/people/{id}"]["coalesced"] == 1
+
+
+def test_track_times_non_http_calls(fresh_metrics):
+    with metrics.track("pybaseball.get_splits"):
+        pass
+    with pytest.raises(ValueError):
+        with metrics.track("pybaseball.get_splits"):
+            raise ValueError("no splits")
+    stats = fresh_metrics.snapshot()["pybaseball.get_splits"]
+    assert (stats["requests"], stats["errors"]) == (2, 1)
+
+
+def test_prometheus_text_export(tmp_path, fresh_metrics):
+    fresh_metrics.observe_request('statsapi.mlb.com/api/v1/"odd"', 0.2, status=200, size=42)
+    fresh_metrics.count("statsapi.mlb.com/api/v1/\"odd\"", "cache_hits")
+    path = tmp_path / "metrics" / "client.prom"
+    metrics.write_prometheus(str(path))
+    text = path.read_text()
+
+    label = 'endpoint="statsapi.mlb.com/api/v1/\\"odd\\""'
+    assert "# TYPE baseball_data_lab_client_requests_total counter" in text
+    assert f"baseball_data_lab_client_requests_total{{{label}}} 1" in text
+    assert f"baseball_data_lab_client_response_bytes_total{{{label}}} 42" in text
+    assert f"baseball_data_lab_client_cache_hits_total{{{label}}} 1" in text
+    assert f'baseball_data_lab_client_request_duration_seconds_bucket{{{label},le="0.25"}} 1' in text
+    assert f'baseball_data_lab_client_request_duration_seconds_bucket{{{label},le="0.1"}} 0' in text
+    assert f'baseball_data_lab_client_request_duration_seconds_bucket{{{label},le="+Inf"}} 1' in text
+    assert f"baseball_data_lab_client_request_duration_seconds_count{{{label}}} 1" in text
+
+
+def test_slowest_orders_by_latency(fresh_metrics):
+    fresh_metrics.observe_request("fast", 0.01)
+    fresh_metrics.observe_request("slow", 3.0)
+    fresh_metrics.count("cached-only", "cache_hits")
+    assert [endpoint for endpoint, _ in fresh_metrics.slowest(5)] == ["slow", "fast"]
+
+
+def test_streamed_bytes_are_counted_without_content_length(registry, fresh_metrics):
+    body = b'{"data": [{"playerid": 1, "WAR": 2.5}], "totalCount": 1}'
+
+    class StreamedResponse:
+        status_code = 200
+        headers = {}
+
+        def iter_content(self, chunk_size=1):
+            yield body
+
+        def close(self):
+            pass
+
+    registry(lambda url: StreamedResponse())
+    FangraphsClient.fetch_batting_leaderboards(2023)
+    stats = fresh_metrics.snapshot()["www.fangraphs.com/api/leaders/major-league/data"]
+    assert stats["requests"] == 1
+    assert stats["bytes"] == len(body)
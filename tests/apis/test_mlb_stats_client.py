@@ -2,18 +2,11 @@
 
 import pytest
 import json
-import requests
+from baseball_data_lab.apis import http_session
 import statsapi
 import pandas as pd
 from baseball_data_lab.apis.mlb_stats_client import MlbStatsClient
-
-# A simple fake response class for monkeypatching requests.get
-class FakeResponse:
-    def __init__(self, json_data, status_code=200):
-        self._json_data = json_data
-        self.status_code = status_code
-    def json(self):
-        return self._json_data
+from tests.conftest import FakeResponse
 
 # ---------------------------
 # Test fetch_player_info
@@ -22,12 +15,56 @@ def test_fetch_player_info(monkeypatch):
     fake_data = {"people": [{"id": 669373, "name": "Test Player", "currentTeam": {"id": 123}}]}
     def fake_get(url):
         return FakeResponse(fake_data)
-    monkeypatch.setattr(requests, "get", fake_get)
+    monkeypatch.setattr(http_session, "http_get", fake_get)
     
     result = MlbStatsClient.fetch_player_info(669373)
     assert result["id"] == 669373
     assert result["name"] == "Test Player"
 
+# ---------------------------
+# Test fetch_players_info
+# ---------------------------
+def test_fetch_players_info_batches_ids(monkeypatch):
+    urls = []
+    def fake_get(url):
+        urls.append(url)
+        ids = url.split("personIds=")[1].split("&")[0].split(",")
+        return FakeResponse({"people": [{"id": int(pid)} for pid in ids]})
+    monkeypatch.setattr(http_session, "http_get", fake_get)
+
+    result = MlbStatsClient.fetch_players_info([1, 2, 3, 2, 4, 5], chunk_size=2)
+    assert sorted(result) == [1, 2, 3, 4, 5]
+    assert result[3] == {"id": 3}
+    assert len(urls) == 3
+    assert "personIds=1,2&hydrate=currentTeam" in urls[0]
+
+def test_fetch_players_stats_by_season_returns_tidy_frame(monkeypatch):
+    urls = []
+    payload = {"people": [
+        {"id": 1, "stats": [{"type": {"displayName": "season"}, "splits": [
+            {"season": "2024", "stat": {"era": "3.00"}, "team": {"id": 116, "teamName": "Tigers"}},
+            {"season": "2024", "stat": {"era": "4.50"}, "team": {"id": 119, "teamName": "Dodgers"}},
+            {"season": "2024", "stat": {"era": "3.60"}},
+        ]}]},
+        {"id": 2, "stats": [{"type": {"displayName": "season"}, "splits": [
+            {"season": "2024", "stat": {"era": "2.00"}, "team": {"id": 116, "teamName": "Tigers"}},
+        ]}]},
+    ]}
+    def fake_get(url):
+        urls.append(url)
+        return FakeResponse(payload)
+    monkeypatch.setattr(http_session, "http_get", fake_get)
+
+    df = MlbStatsClient.fetch_players_stats_by_season([1, 2], 2024, "pitching")
+    assert len(urls) == 1
+    assert "personIds=1,2&" in urls[0] and "group=[pitching]" in urls[0]
+    assert df[["player_id", "team_id", "group", "era"]].values.tolist() == [
+        [1, 116, "pitching", "3.00"],
+        [1, 119, "pitching", "4.50"],
+        [2, 116, "pitching", "2.00"],
+    ]
+    assert MlbStatsClient.teams_by_player(df) == {1: [116, 119], 2: [116]}
+
 # ---------------------------
 # Test fetch_team
 # ---------------------------
@@ -35,7 +72,7 @@ def test_fetch_team(monkeypatch):
     fake_data = {"teams": [{"id": 116, "name": "Test Team"}]}
     def fake_get(url):
         return FakeResponse(fake_data)
-    monkeypatch.setattr(requests, "get", fake_get)
+    monkeypatch.setattr(http_session, "http_get", fake_get)
     
     result = MlbStatsClient.fetch_team(116)
     assert result["id"] == 116
@@ -81,7 +118,7 @@ def test_fetch_player_stats_by_season(monkeypatch):
     }
     def fake_requests_get(url):
         return FakeResponse(fake_json)
-    monkeypatch.setattr(requests, "get", fake_requests_get)
+    monkeypatch.setattr(http_session, "http_get", fake_requests_get)
     
     result = MlbStatsClient.fetch_player_stats_by_season(12345, 2024)
     # Verify that the returned structure contains calculated values.
@@ -108,7 +145,7 @@ def test_fetch_player_team(monkeypatch):
     def fake_get(url):
         return FakeResponse(fake_data)
 
-    monkeypatch.setattr(requests, "get", fake_get)
+    monkeypatch.setattr(http_session, "http_get", fake_get)
 
     result = MlbStatsClient.fetch_player_team(12345, 2020)
     assert result["teamName"] == "Test Team"
@@ -128,7 +165,7 @@ def test_fetch_active_roster(monkeypatch):
     def fake_get(url):
         return FakeResponse(fake_roster)
 
-    monkeypatch.setattr(requests, "get", fake_get)
+    monkeypatch.setattr(http_session, "http_get", fake_get)
 
     result = MlbStatsClient.fetch_active_roster(team_id=100, year=2024)
     assert isinstance(result, list)
@@ -148,7 +185,7 @@ def test_fetch_full_season_roster(monkeypatch):
     def fake_get(url):
         return FakeResponse(fake_roster)
 
-    monkeypatch.setattr(requests, "get", fake_get)
+    monkeypatch.setattr(http_session, "http_get", fake_get)
 
     result = MlbStatsClient.fetch_full_season_roster(100, 2024)
     assert isinstance(result, list)
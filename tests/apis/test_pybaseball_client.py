@@ -3,6 +3,18 @@ import os
 import pandas as pd
 import pytest
 from baseball_data_lab.apis.pybaseball_client import PybaseballClient, process_splits
+from baseball_data_lab.apis.rate_limiter import RateLimiter
+from baseball_data_lab.apis.statcast_fetcher import StatcastFetcher
+
+
+@pytest.fixture(autouse=True)
+def statcast_fetcher(monkeypatch, tmp_path):
+    # Keep checkpoints out of the output directory and skip rate-limit waits.
+    limiter = RateLimiter(host_rates={}, default_rate=1000)
+    monkeypatch.setattr(PybaseballClient, "statcast", StatcastFetcher(checkpoint_dir=None, rate_limiter=limiter))
+    fetcher = StatcastFetcher(checkpoint_dir=str(tmp_path / "checkpoints"), rate_limiter=limiter)
+    monkeypatch.setattr(PybaseballClient, "resumable_statcast", fetcher)
+    return fetcher
 
 # --- Fake Data and Functions for Testing ---
 
@@ -157,3 +169,24 @@ def test_process_splits():
     combined = process_splits(data, splits_stats_list, split_labels, "player_bbref", 2020)
     # Check that the processed data contains the expected split label
     assert not combined.empty
+
+def test_save_statcast_pitcher_data_incremental(monkeypatch, tmp_path, statcast_fetcher):
+    def fake_get_season_info(year):
+        return {'regularSeasonStartDate': '2020-07-23', 'regularSeasonEndDate': '2020-09-27'}
+    monkeypatch.setattr("baseball_data_lab.apis.mlb_stats_client.MlbStatsClient.get_season_info", fake_get_season_info)
+    calls = []
+    def fake_sync(player_id, start_date, end_date, file_path):
+        calls.append((player_id, start_date, end_date, file_path))
+        return 0
+    monkeypatch.setattr(statcast_fetcher, "sync_pitcher", fake_sync)
+
+    temp_file = str(tmp_path / "statcast_pitcher_test.csv")
+    PybaseballClient.save_statcast_pitcher_data(321, 2020, file_path=temp_file, incremental=True)
+    assert calls == [(321, '2020-07-23', '2020-09-27', temp_file)]
+
+
+def test_plain_statcast_fetches_write_no_checkpoints(monkeypatch, tmp_path):
+    monkeypatch.setattr("baseball_data_lab.apis.pybaseball_client.pyb.statcast_batter", fake_statcast_batter)
+    PybaseballClient.fetch_statcast_batter_data(123, "2020-04-01", "2020-04-10")
+    assert not os.path.exists(tmp_path / "checkpoints")
+    assert PybaseballClient.statcast.checkpoint_dir is None
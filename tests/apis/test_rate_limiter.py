@@ -0,0 +1,59 @@
+import pytest
+
+from baseball_data_lab.apis.rate_limiter import RateLimiter, TokenBucket, parse_retry_after
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_reservations_are_spaced_at_the_rate():
+    clock = FakeClock()
+    bucket = TokenBucket(max_rate=10, burst=1, clock=clock)
+    waits = [bucket.reserve() for _ in range(4)]
+    assert waits == pytest.approx([0.0, 0.1, 0.2, 0.3])
+
+
+def test_throttle_halves_rate_once_per_cooldown_and_recovers_slowly():
+    clock = FakeClock()
+    bucket = TokenBucket(max_rate=10, clock=clock, recovery_step=0.5, decrease_cooldown=1.0)
+    bucket.on_throttle()
+    bucket.on_throttle()  # within the cooldown: no second cut
+    assert bucket.rate == 5
+    clock.now = 2.0
+    bucket.on_throttle()
+    assert bucket.rate == 2.5
+    for _ in range(3):
+        bucket.on_success()
+    assert bucket.rate == 4.0
+    for _ in range(100):
+        bucket.on_success()
+    assert bucket.rate == 10
+
+
+def test_retry_after_pauses_the_host():
+    clock = FakeClock()
+    bucket = TokenBucket(max_rate=100, clock=clock)
+    bucket.on_throttle(retry_after=3)
+    assert bucket.reserve() == pytest.approx(3.0)
+
+
+def test_limiter_uses_per_host_rates_and_records_statuses():
+    limiter = RateLimiter(host_rates={"statsapi.mlb.com": 20}, default_rate=2)
+    limiter.record("https://statsapi.mlb.com/api/v1/teams", 429, "1")
+    limiter.record("https://other.example.com/x", 200)
+    stats = limiter.stats()
+    assert stats["statsapi.mlb.com"]["max_rate"] == 20
+    assert stats["statsapi.mlb.com"]["rate"] == 10
+    assert stats["statsapi.mlb.com"]["throttled"] == 1
+    assert stats["other.example.com"]["rate"] == 2
+
+
+def test_parse_retry_after_accepts_seconds_and_dates():
+    assert parse_retry_after("7") == 7.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT", now=1445412470.0) == pytest.approx(10.0)
+    assert parse_retry_after(None) is None
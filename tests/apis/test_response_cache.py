@@ -0,0 +1,151 @@
+import json
+import os
+
+import pandas as pd
+import pytest
+
+from baseball_data_lab.apis import http_session, response_cache
+from baseball_data_lab.apis.response_cache import ResponseCache, default_ttl, LIVE_TTL, CURRENT_TTL
+from baseball_data_lab.apis.mlb_stats_client import MlbStatsClient
+from baseball_data_lab.apis.fangraphs_client import FangraphsClient
+from baseball_data_lab.config import STATS_API_BASE_URL
+from tests.conftest import FakeResponse
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = MlbStatsClient.enable_cache(str(tmp_path))
+    yield cache
+    MlbStatsClient.disable_cache()
+
+
+def test_normalize_url_sorts_query_and_collapses_slashes():
+    a = ResponseCache.normalize_url("https://StatsAPI.mlb.com/api/v1//teams?season=2024&teamId=116")
+    b = ResponseCache.normalize_url("https://statsapi.mlb.com/api/v1/teams?teamId=116&season=2024")
+    assert a == b
+
+
+def test_default_ttl_by_endpoint_class():
+    assert default_ttl(f"{STATS_API_BASE_URL}teams/116/roster?season=2020&rosterType=fullSeason") is None
+    assert default_ttl(f"{STATS_API_BASE_URL}teams/116/roster?season=2999&rosterType=fullSeason") == LIVE_TTL
+    assert default_ttl(f"{STATS_API_BASE_URL}standings?leagueId=103,104&season=2999") == LIVE_TTL
+    assert default_ttl(f"{STATS_API_BASE_URL}people?personIds=1&hydrate=currentTeam") == CURRENT_TTL
+    final_box = {"info": [{"label": "T", "value": "2:41."}]}
+    assert default_ttl(f"{STATS_API_BASE_URL}game/776673/boxscore", final_box) is None
+    assert default_ttl(f"{STATS_API_BASE_URL}game/776673/boxscore", {"info": []}) == LIVE_TTL
+
+
+def test_get_json_serves_repeat_requests_from_disk(monkeypatch, cache):
+    calls = []
+
+    def fake_get(url):
+        calls.append(url)
+        return FakeResponse({"teams": [{"id": 116, "name": "Detroit Tigers"}]})
+
+    monkeypatch.setattr(http_session, "http_get", fake_get)
+    first = MlbStatsClient.fetch_team(116)
+    second = MlbStatsClient.fetch_team(116)
+
+    assert first == second
+    assert len(calls) == 1
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_expired_entries_are_refetched(monkeypatch, cache):
+    url = f"{STATS_API_BASE_URL}standings?leagueId=103&season=2999&standingsTypes=regularSeason"
+    cache.set(url, {"records": ["stale"]}, ttl=10)
+    now = response_cache.time.time()
+    monkeypatch.setattr(response_cache.time, "time", lambda: now + 60)
+    monkeypatch.setattr(http_session, "http_get", lambda url: FakeResponse({"records": ["fresh"]}))
+
+    assert MlbStatsClient.get_standings_data(2999, "103") == ["fresh"]
+    assert cache.stats()["expired"] == 1
+
+
+def test_error_responses_are_not_cached(monkeypatch, cache):
+    monkeypatch.setattr(http_session, "http_get", lambda url: FakeResponse({"message": "boom"}, status_code=500))
+    MlbStatsClient.get_game_boxscore_data(1)
+    assert cache.stats()["writes"] == 0
+
+
+def test_expired_entries_are_revalidated_with_conditional_get(monkeypatch, cache):
+    url = f"{STATS_API_BASE_URL}teams/116/roster?season=2999&rosterType=fullSeason"
+    cache.set(url, {"roster": ["stored"]}, ttl=10,
+              response=FakeResponse(None, headers={"ETag": '"abc"', "Content-Length": "2048"}))
+    now = response_cache.time.time()
+    monkeypatch.setattr(response_cache.time, "time", lambda: now + 60)
+    sent = []
+
+    def fake_get(url, headers=None):
+        sent.append(headers)
+        return FakeResponse(None, status_code=304)
+
+    monkeypatch.setattr(http_session, "http_get", fake_get)
+    assert MlbStatsClient.fetch_full_season_roster(116, 2999) == ["stored"]
+    assert sent == [{"If-None-Match": '"abc"'}]
+    assert cache.stats()["revalidated"] == 1
+    assert cache.bytes_saved() == {"statsapi.mlb.com/api/v1/teams/{id}/roster": 2048}
+    # The renewed entry is fresh again.
+    assert cache.get(url) == {"roster": ["stored"]}
+
+
+class StreamResponse(FakeResponse):
+    def iter_content(self, chunk_size=1):
+        body = json.dumps(self._payload).encode("utf-8")
+        for i in range(0, len(body), chunk_size):
+            yield body[i:i + chunk_size]
+
+
+def test_fangraphs_frames_are_cached_and_revalidated(monkeypatch, tmp_path):
+    cache = FangraphsClient.enable_cache(str(tmp_path), ttl_policy=lambda url, payload: 10)
+    try:
+        responses = [
+            StreamResponse({"data": [{"playerid": 1, "WAR": 2.5}]}, headers={"ETag": "v1", "Content-Length": "100"}),
+            StreamResponse(None, status_code=304),
+        ]
+        sent = []
+
+        def fake_get(url, stream=False, headers=None):
+            sent.append(headers)
+            return responses.pop(0)
+
+        monkeypatch.setattr(http_session, "http_get", fake_get)
+        first = FangraphsClient.fetch_batting_leaderboards(2023)
+        assert FangraphsClient.fetch_batting_leaderboards(2023).equals(first)
+        assert sent == [None]
+
+        now = response_cache.time.time()
+        monkeypatch.setattr(response_cache.time, "time", lambda: now + 60)
+        assert FangraphsClient.fetch_batting_leaderboards(2023).equals(first)
+        assert sent == [None, {"If-None-Match": "v1"}]
+        assert cache.stats()["revalidated"] == 1
+        assert sum(cache.bytes_saved().values()) == 100
+    finally:
+        FangraphsClient.disable_cache()
+
+
+def test_streamed_frames_without_content_length_store_the_bytes_read(monkeypatch, tmp_path):
+    cache = FangraphsClient.enable_cache(str(tmp_path), ttl_policy=lambda url, payload: 10)
+    try:
+        payload = {"data": [{"playerid": 1, "WAR": 2.5}]}
+        responses = [StreamResponse(payload, headers={"ETag": "v1"}), StreamResponse(None, status_code=304)]
+        monkeypatch.setattr(http_session, "http_get", lambda url, stream=False, headers=None: responses.pop(0))
+        FangraphsClient.fetch_batting_leaderboards(2023)
+
+        now = response_cache.time.time()
+        monkeypatch.setattr(response_cache.time, "time", lambda: now + 60)
+        FangraphsClient.fetch_batting_leaderboards(2023)
+        assert sum(cache.bytes_saved().values()) == len(json.dumps(payload))
+    finally:
+        FangraphsClient.disable_cache()
+
+
+def test_frame_hits_are_counted_only_after_the_parquet_is_read(cache):
+    url = "https://www.fangraphs.com/api/leaders/major-league/data?season=2022"
+    cache.set_frame(url, pd.DataFrame({"WAR": [1.5]}), ttl=None)
+    os.remove(cache._path_for(url, ".parquet"))
+
+    assert cache.get_frame(url) is None
+    assert cache.stats()["hits"] == 0
+    assert cache.stats()["misses"] == 1
@@ -0,0 +1,74 @@
+import threading
+import time
+
+
+from baseball_data_lab.apis import http_session
+from baseball_data_lab.apis.single_flight import SingleFlight
+from baseball_data_lab.apis.mlb_stats_client import MlbStatsClient
+from tests.conftest import FakeResponse
+
+
+def _run_concurrently(n, target):
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(target())) for _ in range(n)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return results
+
+
+def test_concurrent_callers_share_one_call():
+    flight = SingleFlight()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        time.sleep(0.05)
+        return {"value": 42}
+
+    results = _run_concurrently(8, lambda: flight.do("key", fetch))
+    assert len(calls) == 1
+    assert all(r is results[0] for r in results)
+    assert flight.stats() == {"calls": 1, "merged": 7}
+
+
+def test_errors_propagate_to_every_waiter_and_are_not_kept():
+    flight = SingleFlight()
+    gate = threading.Event()
+    errors = []
+
+    def fail():
+        gate.wait(1)
+        raise RuntimeError("boom")
+
+    def call():
+        try:
+            flight.do("key", fail)
+        except RuntimeError as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=call) for _ in range(3)]
+    for t in threads:
+        t.start()
+    time.sleep(0.05)
+    gate.set()
+    for t in threads:
+        t.join()
+    assert len(errors) == 3
+    assert flight.do("key", lambda: "ok") == "ok"
+
+
+def test_mlb_client_merges_identical_in_flight_requests(monkeypatch):
+    calls = []
+
+    def slow_get(url):
+        calls.append(url)
+        time.sleep(0.05)
+        return FakeResponse({"teams": [{"id": 116}]})
+
+    monkeypatch.setattr(http_session, "http_get", slow_get)
+    results = _run_concurrently(6, lambda: MlbStatsClient.fetch_team(116))
+    assert results == [{"id": 116}] * 6
+    assert len(calls) == 1
+    assert http_session.coalescing_stats()["merged"] == 5
@@ -0,0 +1,125 @@
+import os
+import threading
+
+import pandas as pd
+import pytest
+
+from baseball_data_lab.apis.rate_limiter import RateLimiter
+from baseball_data_lab.apis.statcast_fetcher import StatcastFetcher, StatcastFetchError, date_windows
+
+
+def _fetcher(tmp_path, **kwargs):
+    kwargs.setdefault("rate_limiter", RateLimiter(host_rates={}, default_rate=1000))
+    kwargs.setdefault("backoff", 0)
+    return StatcastFetcher(checkpoint_dir=str(tmp_path), **kwargs)
+
+
+class FakeSavant:
+    def __init__(self, fail=()):
+        self.calls = []
+        self.fail = set(fail)
+        self._lock = threading.Lock()
+
+    def __call__(self, start, end, player_id):
+        with self._lock:
+            self.calls.append((start, end))
+        if start in self.fail:
+            raise ConnectionError("savant timeout")
+        if start == "2024-04-08":
+            return pd.DataFrame()
+        return pd.DataFrame({
+            "game_date": pd.to_datetime([start, end]),
+            "game_pk": [1, 2],
+            "at_bat_number": [1, 1],
+            "pitch_number": [1, 2],
+            "release_speed": [95.1, 88.4],
+        })
+
+
+def test_date_windows_cover_range_inclusively():
+    assert date_windows("2024-04-01", "2024-04-16", 7) == [
+        ("2024-04-01", "2024-04-07"), ("2024-04-08", "2024-04-14"), ("2024-04-15", "2024-04-16"),
+    ]
+    assert date_windows("2024-04-01", "2024-04-02", 1) == [("2024-04-01", "2024-04-01"), ("2024-04-02", "2024-04-02")]
+
+
+def test_fetch_merges_windows_newest_first(tmp_path, monkeypatch):
+    savant = FakeSavant()
+    monkeypatch.setitem(StatcastFetcher.FETCHERS, "pitcher", savant)
+    df = _fetcher(tmp_path).fetch_pitcher(1, "2024-04-01", "2024-04-16")
+
+    assert len(savant.calls) == 3
+    assert len(df) == 4
+    assert df["game_date"].is_monotonic_decreasing
+    assert df["release_speed"].dtype == float
+
+
+def test_failed_windows_resume_from_checkpoints(tmp_path, monkeypatch):
+    savant = FakeSavant(fail={"2024-04-15"})
+    monkeypatch.setitem(StatcastFetcher.FETCHERS, "batter", savant)
+    with pytest.raises(StatcastFetchError) as excinfo:
+        _fetcher(tmp_path, retries=1).fetch_batter(7, "2024-04-01", "2024-04-16")
+    assert excinfo.value.missing == [("2024-04-15", "2024-04-16")]
+    assert sorted(os.listdir(tmp_path / "batter_7")) == [
+        "2024-04-01_2024-04-07.parquet", "2024-04-08_2024-04-14.empty",
+    ]
+
+    savant.fail.clear()
+    savant.calls.clear()
+    fetcher = _fetcher(tmp_path)
+    df = fetcher.fetch_batter(7, "2024-04-01", "2024-04-16")
+    assert savant.calls == [("2024-04-15", "2024-04-16")]
+    assert len(df) == 4
+    assert fetcher.stats()["windows_resumed"] == 2
+
+
+def test_windows_reaching_today_are_not_checkpointed(tmp_path, monkeypatch):
+    monkeypatch.setitem(StatcastFetcher.FETCHERS, "pitcher", lambda start, end, pid: pd.DataFrame({"game_pk": [1]}))
+    today = pd.Timestamp.today().date().isoformat()
+    _fetcher(tmp_path, window_days=1).fetch_pitcher(1, today, today)
+    assert not os.path.exists(tmp_path / "pitcher_1")
+
+
+def test_sync_fetches_only_days_after_last_stored_pitch(tmp_path, monkeypatch):
+    file_path = str(tmp_path / "out" / "statcast.csv")
+    calls = []
+
+    def savant(start, end, player_id):
+        calls.append((start, end))
+        days = pd.date_range(start, end)
+        return pd.DataFrame({
+            "game_date": days,
+            "game_pk": [d.day for d in days],
+            "at_bat_number": 1,
+            "pitch_number": 1,
+        })
+
+    monkeypatch.setitem(StatcastFetcher.FETCHERS, "pitcher", savant)
+    fetcher = _fetcher(tmp_path / "checkpoints", window_days=30)
+
+    assert fetcher.sync_pitcher(1, "2024-04-01", "2024-04-10", file_path) == 10
+    assert StatcastFetcher.last_stored_date(file_path) == "2024-04-10"
+
+    calls.clear()
+    assert fetcher.sync_pitcher(1, "2024-04-01", "2024-04-12", file_path) == 2
+    assert calls == [("2024-04-10", "2024-04-12")]
+
+    stored = pd.read_csv(file_path)
+    assert len(stored) == 12
+    assert stored["game_date"].iloc[0] == "2024-04-12"
+    assert not stored.duplicated(subset=["game_pk", "at_bat_number", "pitch_number"]).any()
+
+
+def test_recent_empty_windows_are_not_checkpointed(tmp_path, monkeypatch):
+    monkeypatch.setitem(StatcastFetcher.FETCHERS, "pitcher", lambda start, end, pid: pd.DataFrame())
+    yesterday = (pd.Timestamp.today() - pd.Timedelta(days=1)).date().isoformat()
+    settled = (pd.Timestamp.today() - pd.Timedelta(days=3)).date().isoformat()
+    _fetcher(tmp_path, window_days=1).fetch_pitcher(1, settled, yesterday)
+    assert os.listdir(tmp_path / "pitcher_1") == [f"{settled}_{settled}.empty"]
+
+
+def test_recent_windows_with_data_are_not_checkpointed(tmp_path, monkeypatch):
+    monkeypatch.setitem(StatcastFetcher.FETCHERS, "pitcher", lambda start, end, pid: pd.DataFrame({"game_pk": [1]}))
+    yesterday = (pd.Timestamp.today() - pd.Timedelta(days=1)).date().isoformat()
+    _fetcher(tmp_path, window_days=1).fetch_pitcher(1, yesterday, yesterday)
+    assert not os.path.exists(tmp_path / "pitcher_1")
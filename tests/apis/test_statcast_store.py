@@ -0,0 +1,87 @@
+import threading
+
+import pandas as pd
+import pytest
+
+from baseball_data_lab.apis.pybaseball_client import PybaseballClient
+from baseball_data_lab.apis.rate_limiter import RateLimiter
+from baseball_data_lab.apis.statcast_fetcher import StatcastFetcher, StatcastFetchError
+from baseball_data_lab.apis.statcast_store import StatcastStore
+
+
+class FakeLeague:
+    def __init__(self):
+        self.calls = []
+        self.fail = set()
+        self._lock = threading.Lock()
+
+    def __call__(self, start, end, player_id):
+        with self._lock:
+            self.calls.append(start)
+        if start in self.fail:
+            raise ConnectionError("savant timeout")
+        if start == "2024-04-02":
+            return pd.DataFrame()
+        return pd.DataFrame({
+            "game_date": pd.to_datetime([start] * 3),
+            "game_pk": [1, 1, 1],
+            "at_bat_number": [1, 1, 2],
+            "pitch_number": [1, 2, 1],
+            "pitcher": [10, 10, 11],
+            "batter": [20, 20, 21],
+        })
+
+
+@pytest.fixture
+def league(monkeypatch):
+    fake = FakeLeague()
+    monkeypatch.setitem(StatcastFetcher.FETCHERS, "league", fake)
+    return fake
+
+
+def _store(tmp_path):
+    fetcher = StatcastFetcher(checkpoint_dir=None, window_days=1, backoff=0, retries=0,
+                              rate_limiter=RateLimiter(host_rates={}, default_rate=1000))
+    return StatcastStore(str(tmp_path), fetcher=fetcher)
+
+
+def test_one_league_query_per_day_serves_every_player(tmp_path, league):
+    store = _store(tmp_path)
+    pitcher = store.load_pitcher(10, "2024-04-01", "2024-04-03")
+    batter = store.load_batter(21, "2024-04-01", "2024-04-03")
+
+    assert sorted(league.calls) == ["2024-04-01", "2024-04-02", "2024-04-03"]
+    assert len(pitcher) == 4 and set(pitcher["pitcher"]) == {10}
+    assert pitcher["game_date"].iloc[0] == pd.Timestamp("2024-04-03")
+    assert len(batter) == 2 and set(batter["batter"]) == {21}
+    assert store.load_pitcher(10, "2024-04-03", "2024-04-03")["game_date"].nunique() == 1
+    assert store.load_pitcher(999, "2024-04-01", "2024-04-03").empty
+
+
+def test_failed_days_are_retried_on_next_load(tmp_path, league):
+    league.fail.add("2024-04-03")
+    store = _store(tmp_path)
+    with pytest.raises(StatcastFetchError) as excinfo:
+        store.ingest("2024-04-01", "2024-04-03")
+    assert excinfo.value.missing == [("2024-04-03", "2024-04-03")]
+
+    league.fail.clear()
+    league.calls.clear()
+    assert len(store.load_pitcher(10, "2024-04-01", "2024-04-03")) == 4
+    assert league.calls == ["2024-04-03"]
+
+
+def test_pybaseball_client_reads_from_enabled_store(tmp_path, league, monkeypatch):
+    monkeypatch.setattr(PybaseballClient, "statcast_store", _store(tmp_path))
+    df = PybaseballClient.fetch_statcast_pitcher_data(11, "2024-04-01", "2024-04-01")
+    assert df["pitcher"].tolist() == [11]
+    assert league.calls == ["2024-04-01"]
+
+
+def test_recent_days_are_not_marked_complete(tmp_path, league):
+    settled, two_days_ago, yesterday = [(pd.Timestamp.today() - pd.Timedelta(days=n)).date().isoformat()
+                                        for n in (3, 2, 1)]
+    store = _store(tmp_path)
+    store.ingest(settled, yesterday)
+    assert store.has_day(settled)
+    assert store.missing_days(settled, yesterday) == [two_days_ago, yesterday]
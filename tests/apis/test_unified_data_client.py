@@ -0,0 +1,68 @@
+import pytest
+
+from baseball_data_lab.apis import chadwick_register, unified_data_client
+from baseball_data_lab.apis.chadwick_register import ChadwickRegister
+from baseball_data_lab.apis.fangraphs_client import FangraphsClient
+from baseball_data_lab.apis.mlb_stats_client import MlbStatsClient
+from baseball_data_lab.apis.unified_data_client import UnifiedDataClient, get_default_client
+from baseball_data_lab.player.player_lookup import PlayerLookup
+from baseball_data_lab.stats.team_season_stats import TeamSeasonStats
+from baseball_data_lab.team.team import Team
+
+
+@pytest.fixture
+def register_loads(monkeypatch, tmp_path):
+    register_file = tmp_path / "chadwick-register.csv"
+    register_file.write_text(
+        "name_last,name_first,key_mlbam,key_retro,key_bbref,key_fangraphs,mlb_played_first,mlb_played_last\n"
+        "Skubal,Tarik,669373,skubt001,skubata01,22267,2020,2025\n"
+    )
+    loads = []
+    init = ChadwickRegister.__init__
+
+    def counted_init(self, *args, **kwargs):
+        loads.append(self)
+        init(self, register_file=str(register_file))
+
+    monkeypatch.setattr(ChadwickRegister, "__init__", counted_init)
+    monkeypatch.setattr(chadwick_register, "_search_client", None)
+    monkeypatch.setattr(unified_data_client, "_default_client", None)
+    return loads
+
+
+def test_clients_defer_and_share_the_register(register_loads):
+    first, second = UnifiedDataClient(), UnifiedDataClient()
+    assert register_loads == []
+
+    assert first.lookup_player_by_id(669373)["key_bbref"].tolist() == ["skubata01"]
+    assert second.playerid_reverse_lookup(669373)["key_fangraphs"].tolist() == [22267]
+    assert len(register_loads) == 1
+    assert first.search_client is second.search_client
+
+
+def test_default_constructed_objects_share_one_client(register_loads):
+    team, stats, lookup = Team(), TeamSeasonStats(2024), PlayerLookup()
+    assert team.data_client is stats.data_client is lookup.data_client is get_default_client()
+    assert register_loads == []
+
+
+def test_kept_player_records_are_returned_as_copies():
+    client = UnifiedDataClient()
+    client.store_players_info({1: {"id": 1, "currentTeam": {"id": 116}}})
+
+    client.fetch_player_info(1)["currentTeam"]["id"] = 0
+    client.cached_players_info([1])[1]["id"] = 2
+    assert client.fetch_player_info(1) == {"id": 1, "currentTeam": {"id": 116}}
+
+
+def test_http_cache_stats_are_keyed_per_client(tmp_path):
+    client = UnifiedDataClient()
+    try:
+        client.enable_http_cache(str(tmp_path))
+        stats = client.http_cache_stats()
+    finally:
+        MlbStatsClient.disable_cache()
+        FangraphsClient.disable_cache()
+    assert set(stats) == {"statsapi", "fangraphs"}
+    assert stats["fangraphs"]["hits"] == 0
+    assert client.http_cache_stats() == {}
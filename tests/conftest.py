@@ -1,6 +1,45 @@
 import json
 import os
 import pytest
+import requests
+
+from baseball_data_lab.apis import chadwick_register, http_session
+from baseball_data_lab.apis.single_flight import SingleFlight
+
+
+class FakeResponse:
+    """Stand-in for ``requests.Response`` returned by patched ``http_get`` calls."""
+
+    def __init__(self, payload=None, status_code=200, headers=None, content=b""):
+        self._payload = payload
+        self.status_code = status_code
+        self.headers = dict(headers or {})
+        self.content = content
+        self.closed = False
+
+    def json(self):
+        return self._payload
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code}")
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture(autouse=True)
+def fresh_single_flight(monkeypatch):
+    """Give each test its own in-flight call table so merged calls never span tests."""
+    monkeypatch.setattr(http_session, "_single_flight", SingleFlight())
+
+
+@pytest.fixture(autouse=True)
+def user_cache_dir(monkeypatch, tmp_path):
+    """Write register snapshots and name indexes under the test's temporary directory."""
+    cache_dir = tmp_path / "user_cache"
+    monkeypatch.setattr(chadwick_register, "USER_CACHE_DIR", str(cache_dir))
+    return cache_dir
 
 
 @pytest.fixture(scope="module")
@@ -46,13 +46,16 @@ class DummyDataClient:
     def fetch_player_headshot(self, mlbam_id):
         return self.headshot_bytes
 
-    def save_statcast_pitcher_data(self, mlbam_id, year, path):
+    def fetch_player_headshot_img(self, mlbam_id):
+        return Image.open(BytesIO(self.headshot_bytes))
+
+    def save_statcast_pitcher_data(self, mlbam_id, year, path, incremental=False):
         # ensure the directory exists
         os.makedirs(os.path.dirname(path), exist_ok=True)
         with open(path, "w") as f:
             f.write("pitcher data")
 
-    def save_statcast_batter_data(self, mlbam_id, year, path):
+    def save_statcast_batter_data(self, mlbam_id, year, path, incremental=False):
         # ensure the directory exists
         os.makedirs(os.path.dirname(path), exist_ok=True)
         with open(path, "w") as f:
@@ -103,7 +106,7 @@ class DummyTeam:
 def patch_dependencies(monkeypatch, tmp_path):
     # Patch data_client, lookup_client, PlayerInfo, PlayerBio, Team, STATCAST_DATA_DIR
     monkeypatch.setattr(player_module, 'STATCAST_DATA_DIR', str(tmp_path))
-    monkeypatch.setattr(player_module, 'UnifiedDataClient', lambda: DummyDataClient())
+    monkeypatch.setattr(player_module, 'get_default_client', lambda: DummyDataClient())
     monkeypatch.setattr(player_module, 'PlayerLookup', lambda data_client=None: DummyLookupClient(return_data={'key_mlbam': 1, 'key_bbref': 'BB'}))
     monkeypatch.setattr(player_module, 'PlayerInfo', DummyPlayerInfo)
     monkeypatch.setattr(player_module, 'PlayerBio', DummyPlayerBio)
@@ -82,3 +82,79 @@ def test_fetch_player_stats_position_mismatch(monkeypatch, tmp_path):
     result = downloader._fetch_player_stats(2)
     assert result is None
     assert downloader.statuses["position_mismatch"] == ["Dummy Player"]
+
+
+class DummyAsyncClient:
+    def __init__(self, pos):
+        self.pos = pos
+        self.team_requests = []
+
+    async def fetch_player_info(self, player_id):
+        return {"id": player_id, "fullName": "Async Player", "primaryPosition": {"abbreviation": self.pos}}
+
+    async def get_player_teams_for_season(self, player_id, year, group=None, ids_only=False):
+        return [116, 119]
+
+    async def fetch_pitching_stats(self, mlbam_id, season, fangraphs_team_id=None):
+        self.team_requests.append(fangraphs_team_id)
+        return pd.DataFrame({"wins": [1]})
+
+    async def fetch_batting_stats(self, mlbam_id, season, fangraphs_team_id=None):
+        self.team_requests.append(fangraphs_team_id)
+        return pd.DataFrame({"hits": [5]})
+
+
+def test_fetch_player_stats_async_splits_by_team(tmp_path):
+    import asyncio
+
+    downloader = SeasonStatsDownloader(season=2024, output_dir=str(tmp_path))
+    client = DummyAsyncClient("P")
+    df = asyncio.run(downloader._fetch_player_stats_async(client, 1))
+    assert df["mlbam_team_id"].tolist() == [116, 119]
+    assert len(client.team_requests) == 2
+    assert downloader.statuses["success"] == ["Async Player"]
+
+
+def test_build_player_tasks_accepts_statsapi_rosters():
+    rosters = [
+        (116, [{"person": {"id": 1}}, {"person": {"id": 2}}]),
+        (119, pd.DataFrame([{"mlbam_id": 2}, {"mlbam_id": 3}])),
+    ]
+    assert sorted(SeasonStatsDownloader._build_player_tasks(rosters)) == [1, 2, 3]
+
+
+def test_prefetched_player_info_is_served_without_requests(monkeypatch, tmp_path):
+    from baseball_data_lab.apis.mlb_stats_client import MlbStatsClient
+
+    downloader = SeasonStatsDownloader(season=2024, output_dir=str(tmp_path))
+    monkeypatch.setattr(
+        MlbStatsClient, "fetch_players_info",
+        staticmethod(lambda ids: {pid: {"id": pid, "fullName": f"P{pid}"} for pid in ids}),
+    )
+    monkeypatch.setattr(MlbStatsClient, "fetch_player_info", staticmethod(lambda pid: pytest.fail("unbatched request")))
+
+    downloader._prefetch_players_info([1, 2])
+    assert downloader.client.fetch_player_info(2)["fullName"] == "P2"
+
+
+def test_prefetched_teams_skip_per_player_team_lookup(monkeypatch, tmp_path):
+    class BulkClient(DummyClient):
+        def get_players_teams_for_season(self, player_ids, year, group):
+            return {pid: [116, 119] for pid in player_ids}
+
+        def get_player_teams_for_season(self, *args, **kwargs):
+            pytest.fail("per-player team lookup")
+
+    downloader = SeasonStatsDownloader(season=2024, output_dir=str(tmp_path))
+    downloader.client = BulkClient()
+    downloader._prefetch_player_teams({1: {"primaryPosition": {"abbreviation": "P"}}})
+    monkeypatch.setattr(save_season_stats.Player, "create_from_mlb", lambda mlbam_id, data_client=None: DummyPlayer("P"))
+
+    df = downloader._fetch_player_stats(1)
+    assert df["mlbam_team_id"].tolist() == [116, 119]
+
+
+@pytest.mark.parametrize("option", ["hedge_requests", "circuit_breaker"])
+def test_async_mode_rejects_thread_pool_only_options(tmp_path, option):
+    with pytest.raises(ValueError):
+        SeasonStatsDownloader(season=2024, output_dir=str(tmp_path), use_async=True, **{option: True})
@@ -0,0 +1,100 @@
+import threading
+from collections import Counter
+
+from baseball_data_lab.apis.fangraphs_client import FangraphsClient
+from baseball_data_lab.summary_sheets import prefetch_planner
+from baseball_data_lab.summary_sheets.prefetch_planner import PrefetchPlanner
+
+
+class FakeClient:
+    def __init__(self, infos):
+        self.infos = infos
+        self.calls = Counter()
+        self._lock = threading.Lock()
+
+    def _count(self, *key):
+        with self._lock:
+            self.calls[key] += 1
+
+    def preload_players(self, ids, season):
+        self._count("people", tuple(ids), season)
+        return {pid: self.infos[pid] for pid in ids if pid in self.infos}
+
+    def get_season_info(self, season):
+        self._count("season", season)
+        return {"regularSeasonStartDate": f"{season}-03-28", "regularSeasonEndDate": f"{season}-09-29"}
+
+    def fetch_team(self, team_id):
+        self._count("team", team_id)
+        return {"id": team_id, "abbreviation": "DET", "name": "Detroit Tigers"}
+
+    def fetch_team_players(self, team_id, season):
+        self._count("team_players", team_id)
+        return []
+
+    def fetch_logo_img(self, url):
+        self._count("logo", url)
+
+    def fetch_player_headshot_img(self, pid):
+        self._count("headshot", pid)
+
+    def fetch_pitching_stats(self, mlbam_id, season):
+        self._count("stats", mlbam_id)
+
+    fetch_batting_stats = fetch_pitching_stats
+
+    def fetch_statcast_pitcher_data(self, pid, start, end):
+        self._count("statcast", "pitcher", pid, start, end)
+
+    def fetch_statcast_batter_data(self, pid, start, end):
+        self._count("statcast", "batter", pid, start, end)
+
+
+INFOS = {
+    1: {"id": 1, "primaryPosition": {"abbreviation": "P"}, "currentTeam": {"id": 116}},
+    2: {"id": 2, "primaryPosition": {"abbreviation": "LF"}, "currentTeam": {"id": 116}},
+    3: {"id": 3, "primaryPosition": {"abbreviation": "P"}, "currentTeam": {"id": 147}},
+}
+
+
+def test_plan_deduplicates_shared_resources():
+    client = FakeClient(INFOS)
+    planner = PrefetchPlanner(2024, data_client=client)
+    loaded = planner.prefetch([1, 2, 3, 1, 99])
+
+    assert all(loaded.values())
+    assert client.calls[("people", (1, 2, 3, 99), 2024)] == 1
+    assert client.calls[("season", 2024)] == 1
+    assert client.calls[("team", 116)] == 1
+    assert client.calls[("team", 147)] == 1
+    assert client.calls[("statcast", "pitcher", 1, "2024-03-28", "2024-09-29")] == 1
+    assert client.calls[("statcast", "batter", 2, "2024-03-28", "2024-09-29")] == 1
+    assert sum(n for key, n in client.calls.items() if key[0] == "headshot") == 3
+    assert sum(n for key, n in client.calls.items() if key[0] == "stats") == 3
+    assert ("team", 116) in loaded and ("headshot", 99) not in loaded
+
+
+def test_large_batches_use_leaderboard_snapshots(monkeypatch):
+    loads = []
+    monkeypatch.setattr(prefetch_planner, "LEADERBOARD_MIN_PLAYERS", 2)
+    monkeypatch.setattr(FangraphsClient, "load_leaderboard_snapshot",
+                        staticmethod(lambda season, stat_type: loads.append((season, stat_type))))
+    client = FakeClient(INFOS)
+    loaded = PrefetchPlanner(2024, data_client=client).prefetch([1, 2, 3])
+
+    assert loads == [(2024, "pitching")]
+    assert ("leaderboard", "pitching", 2024) in loaded
+    stats = {key[1] for key in client.calls if key[0] == "stats"}
+    assert stats == {2}
+
+
+def test_failures_are_reported_not_raised():
+    client = FakeClient(INFOS)
+
+    def broken(pid):
+        raise RuntimeError("no headshot")
+
+    client.fetch_player_headshot_img = broken
+    loaded = PrefetchPlanner(2024, data_client=client).prefetch([1])
+    assert loaded[("headshot", 1)] is False
+    assert loaded[("team", 116)] is True